@@ -0,0 +1,120 @@
+"""
+Measures ``walk.is_contained_by`` on generated modules with many loops.
+
+Usage: ``python scripts/benchmark_containment.py [--loops N ...] [--runs RUNS]``
+
+Each loaded name is checked against each loop of the module,
+like ``AfterBlockVariablesVisitor`` does for block variables.
+
+Generated modules:
+
+- sequential loops: loops one after another, each uses its variable
+- nested loops: groups of loops nested up to the indentation limit
+
+"""
+
+import argparse
+import ast
+import timeit
+from collections.abc import Callable
+from typing import Final
+
+from wemake_python_styleguide.logic import walk
+from wemake_python_styleguide.transformations.ast_tree import transform
+
+DEFAULT_LOOPS: Final = (125, 250, 500)
+
+DEFAULT_RUNS: Final = 5
+
+#: Python tokenizer does not allow deeper indentation.
+MAX_NESTING: Final = 98
+
+_MILLISECONDS_IN_SECOND: Final = 1000
+
+_INDENT: Final = '    '
+
+# This is needed to stop linter from spewing WPS421 errors.
+report = print
+
+
+def sequential_loops(loops: int) -> str:
+    """Returns loops that follow each other."""
+    lines: list[str] = []
+    for loop in range(loops):
+        lines.extend((
+            f'for item{loop} in items:',
+            f'{_INDENT}use(item{loop})',
+        ))
+    return '\n'.join(lines)
+
+
+def nested_loops(loops: int) -> str:
+    """Returns groups of loops, each loop is nested in the previous one."""
+    lines: list[str] = []
+    for loop in range(loops):
+        indent = _INDENT * (loop % MAX_NESTING)
+        lines.extend((
+            f'{indent}for item{loop} in items:',
+            f'{indent}{_INDENT}use(item{loop})',
+        ))
+    return '\n'.join(lines)
+
+
+#: Functions that generate modules with the given number of loops.
+GENERATORS: Final = (sequential_loops, nested_loops)
+
+
+def measure(source: str, runs: int) -> tuple[int, float]:
+    """Returns the number of checks and their best time in ms."""
+    tree = transform(ast.parse(source))
+    loops = list(walk.get_subnodes_by_type(tree, ast.For))
+    names = [
+        name
+        for name in walk.get_subnodes_by_type(tree, ast.Name)
+        if isinstance(name.ctx, ast.Load)
+    ]
+    best_time = min(
+        timeit.repeat(
+            lambda: [
+                walk.is_contained_by(name, loop)
+                for name in names
+                for loop in loops
+            ],
+            number=1,
+            repeat=runs,
+        ),
+    )
+    return len(names) * len(loops), best_time * _MILLISECONDS_IN_SECOND
+
+
+def report_module(
+    generate: Callable[[int], str],
+    loops: int,
+    runs: int,
+) -> None:
+    """Prints the best time of all checks for a single generated module."""
+    checks, milliseconds = measure(generate(loops), runs)
+    report(
+        format(milliseconds, '10.1f'),
+        format(checks, '10'),
+        'checks',
+        generate.__name__,
+        loops,
+    )
+
+
+def main() -> None:
+    """Prints the best time of all checks for each generated module."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--loops', type=int, nargs='+', default=DEFAULT_LOOPS)
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    report(f'Best time of {args.runs} runs, ms:')
+    for generate in GENERATORS:
+        for loops in args.loops:
+            report_module(generate, loops, args.runs)
+
+
+if __name__ == '__main__':
+    main()
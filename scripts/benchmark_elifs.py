@@ -0,0 +1,107 @@
+"""
+Measures ``ElifVisitor`` on generated modules with many ``elif`` branches.
+
+Usage: ``python scripts/benchmark_elifs.py [--branches N ...] [--runs RUNS]``
+
+Each module has the given number of branches in total,
+they are split into chains of ``if`` / ``elif`` statements
+of the same length, like generated protocol handlers are.
+Python parser cannot parse a single chain of thousands of branches,
+so longer chains are not generated.
+
+"""
+
+import argparse
+import ast
+import timeit
+from typing import Final
+
+from wemake_python_styleguide.options.config import Configuration
+from wemake_python_styleguide.options.validation import (
+    ValidatedOptions,
+    validate_options,
+)
+from wemake_python_styleguide.transformations.ast_tree import transform
+from wemake_python_styleguide.visitors.ast.complexity.counts import ElifVisitor
+
+DEFAULT_BRANCHES: Final = (2500, 5000, 10000)
+
+DEFAULT_RUNS: Final = 5
+
+#: Branches in each chain of generated modules.
+CHAIN_LENGTHS: Final = (1, 10, 100)
+
+_MILLISECONDS_IN_SECOND: Final = 1000
+
+_INDENT: Final = '    '
+
+# This is needed to stop linter from spewing WPS421 errors.
+report = print
+
+
+def elif_chains(branches: int, chain_length: int) -> str:
+    """Returns chains of ``if`` and ``elif`` with the given total branches."""
+    lines: list[str] = []
+    for branch in range(branches):
+        keyword = 'elif' if branch % chain_length else 'if'
+        lines.extend((
+            f'{keyword} command == {branch}:',
+            f'{_INDENT}handle({branch})',
+        ))
+    return '\n'.join(lines)
+
+
+def default_options() -> ValidatedOptions:
+    """Returns default values of all options, like ``flake8`` passes them."""
+    return validate_options(
+        argparse.Namespace(**{
+            option.long_option_name[2:].replace('-', '_'): option.default
+            for option in Configuration._options  # noqa: SLF001
+        }),
+    )
+
+
+def measure(source: str, runs: int) -> float:
+    """Returns the best time of the visitor in ms."""
+    tree = transform(ast.parse(source))
+    options = default_options()
+    best_time = min(
+        timeit.repeat(
+            lambda: ElifVisitor(options, tree=tree).run(),
+            number=1,
+            repeat=runs,
+        ),
+    )
+    return best_time * _MILLISECONDS_IN_SECOND
+
+
+def main() -> None:
+    """Prints the best time of the visitor for each generated module."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--branches',
+        type=int,
+        nargs='+',
+        default=DEFAULT_BRANCHES,
+    )
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    report(f'Best time of {args.runs} runs, ms:')
+    for chain_length in CHAIN_LENGTHS:
+        for branches in args.branches:
+            milliseconds = measure(
+                elif_chains(branches, chain_length),
+                args.runs,
+            )
+            report(
+                format(milliseconds, '10.1f'),
+                'branches',
+                branches,
+                'in chains of',
+                chain_length,
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Measures ``WrongImportVisitor`` on generated modules with many imports.
+
+Usage: ``python scripts/benchmark_imports.py [--imports N ...] [--runs RUNS]``
+
+Generated modules re-export names from submodules,
+like large ``__init__.py`` files do.
+Every other import is a plain ``import`` of a submodule,
+so each ``from`` import collides with it.
+
+"""
+
+import argparse
+import ast
+import timeit
+from typing import Final
+
+from wemake_python_styleguide.options.config import Configuration
+from wemake_python_styleguide.options.validation import (
+    ValidatedOptions,
+    validate_options,
+)
+from wemake_python_styleguide.transformations.ast_tree import transform
+from wemake_python_styleguide.visitors.ast.imports import WrongImportVisitor
+
+DEFAULT_IMPORTS: Final = (500, 1000, 2000)
+
+DEFAULT_RUNS: Final = 5
+
+_MILLISECONDS_IN_SECOND: Final = 1000
+
+# This is needed to stop linter from spewing WPS421 errors.
+report = print
+
+
+def reexports(imports: int) -> str:
+    """Returns the given number of imports from submodules."""
+    lines: list[str] = []
+    for index in range(imports):
+        module_index = index // 2
+        module = f'package.module{module_index}'
+        if index % 2:
+            lines.append(f'from {module} import name{index}')
+        else:
+            lines.append(f'import {module}')
+    return '\n'.join(lines)
+
+
+def default_options() -> ValidatedOptions:
+    """Returns default values of all options, like ``flake8`` passes them."""
+    return validate_options(
+        argparse.Namespace(**{
+            option.long_option_name[2:].replace('-', '_'): option.default
+            for option in Configuration._options  # noqa: SLF001
+        }),
+    )
+
+
+def measure(source: str, runs: int) -> tuple[int, float]:
+    """Returns the number of violations and the best time in ms."""
+    tree = transform(ast.parse(source))
+    options = default_options()
+    best_time = min(
+        timeit.repeat(
+            lambda: WrongImportVisitor(options, tree=tree).run(),
+            number=1,
+            repeat=runs,
+        ),
+    )
+    visitor = WrongImportVisitor(options, tree=tree)
+    visitor.run()
+    return len(visitor.violations), best_time * _MILLISECONDS_IN_SECOND
+
+
+def main() -> None:
+    """Prints the best time of the visitor for each generated module."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--imports',
+        type=int,
+        nargs='+',
+        default=DEFAULT_IMPORTS,
+    )
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    report(f'Best time of {args.runs} runs, ms:')
+    for imports in args.imports:
+        violations, milliseconds = measure(reexports(imports), args.runs)
+        report(
+            format(milliseconds, '10.1f'),
+            format(violations, '10'),
+            'violations',
+            imports,
+            'imports',
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Measures memory retained by ``transform`` for each ``ast`` node.
+
+Usage: ``python scripts/benchmark_memory.py [--copies COPIES] [FILE ...]``
+
+Each file is repeated ``COPIES`` times to get a large generated module,
+``typing`` module of the standard library is measured by default.
+
+Reports:
+
+- number of nodes in the module
+- memory allocated by ``transform`` and still used after it
+- the same memory for each node
+- peak RSS of the whole process, parsing included
+
+"""
+
+import argparse
+import ast
+import gc
+import resource
+import sysconfig
+import tracemalloc
+from pathlib import Path
+from typing import Final
+
+from wemake_python_styleguide.transformations.ast_tree import transform
+
+DEFAULT_COPIES: Final = 20
+
+DEFAULT_FILE: Final = str(Path(sysconfig.get_paths()['stdlib'], 'typing.py'))
+
+_MEBIBYTE: Final = 1024 * 1024
+
+_KIBIBYTE: Final = 1024
+
+# This is needed to stop linter from spewing WPS421 errors.
+report = print
+
+
+def measure(source: str) -> tuple[int, int]:
+    """Returns number of nodes and bytes retained by ``transform``."""
+    tree = ast.parse(source)
+    gc.collect()
+    tracemalloc.start()
+    transform(tree)
+    gc.collect()
+    retained_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return sum(1 for _ in ast.walk(tree)), retained_bytes
+
+
+def report_file(filename: str, copies: int) -> None:
+    """Prints memory retained by ``transform`` for the repeated file."""
+    source = Path(filename).read_text(encoding='utf8')
+    nodes, retained_bytes = measure(source * copies)
+    report(
+        format(nodes, '10'),
+        format(retained_bytes / _MEBIBYTE, '14.2f'),
+        format(retained_bytes / nodes, '15.1f'),
+        filename,
+    )
+
+
+def main() -> None:
+    """Prints memory retained by ``transform`` for each file."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--copies', type=int, default=DEFAULT_COPIES)
+    parser.add_argument('files', nargs='*', default=[DEFAULT_FILE])
+    args = parser.parse_args()
+
+    report('     nodes  retained, MiB  bytes per node  file')
+    for filename in args.files:
+        report_file(filename, args.copies)
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // _KIBIBYTE
+    report(f'Peak RSS: {peak_rss} MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Measures how long it takes ``flake8`` to import our plugin.
+
+Usage: ``python scripts/benchmark_startup.py [module] [--runs RUNS]``
+
+Each run imports the module in a fresh interpreter with ``-X importtime``.
+Median cumulative import times are reported:
+for the module itself and for the slowest modules it imports.
+"""
+
+import argparse
+import heapq
+import statistics
+import subprocess  # noqa: S404
+import sys
+from collections import defaultdict
+from typing import Final
+
+DEFAULT_MODULE: Final = 'wemake_python_styleguide.checker'
+
+DEFAULT_RUNS: Final = 10
+
+REPORT_SIZE: Final = 15
+
+_MICROSECONDS_IN_MILLISECOND: Final = 1000
+
+# This is needed to stop linter from spewing WPS421 errors.
+report = print
+
+
+def measure(module: str) -> dict[str, int]:
+    """Returns cumulative import time of each imported module in us."""
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in process.stderr.splitlines()[1:]:  # the first one is a header
+        _, cumulative, module_name = line.split('|')
+        import_times[module_name.strip()] = int(cumulative)
+    return import_times
+
+
+def median_import_times(module: str, runs: int) -> dict[str, float]:
+    """Returns median cumulative import time of each module in ms."""
+    measurements: defaultdict[str, list[int]] = defaultdict(list)
+    for _ in range(runs):
+        for module_name, cumulative in measure(module).items():
+            measurements[module_name].append(cumulative)
+    return {
+        imported_module: (
+            statistics.median(import_times) / _MICROSECONDS_IN_MILLISECOND
+        )
+        for imported_module, import_times in measurements.items()
+    }
+
+
+def main() -> None:
+    """Prints median import times of the module and its slowest imports."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('module', nargs='?', default=DEFAULT_MODULE)
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    medians = median_import_times(args.module, args.runs)
+    report(f'Median import time of {args.runs} runs, ms:')
+    for module_name in heapq.nlargest(
+        REPORT_SIZE,
+        medians,
+        key=medians.__getitem__,
+    ):
+        report(format(medians[module_name], '10.1f'), module_name)
+
+
+if __name__ == '__main__':
+    main()
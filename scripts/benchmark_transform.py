@@ -0,0 +1,97 @@
+"""
+Measures ``transform`` on deeply nested generated modules.
+
+Usage: ``python scripts/benchmark_transform.py [--depth DEPTH] [--runs RUNS]``
+
+Generated modules:
+
+- nested blocks: ``if`` statements nested up to the indentation limit
+- nested functions: functions nested up to the indentation limit
+- nested expressions: a single ``+`` chain of the given depth
+
+"""
+
+import argparse
+import ast
+import itertools
+import timeit
+from typing import Final
+
+from wemake_python_styleguide.transformations.ast_tree import transform
+
+#: Python parser cannot parse much deeper expressions.
+DEFAULT_DEPTH: Final = 2000
+
+DEFAULT_RUNS: Final = 5
+
+#: Python tokenizer does not allow deeper indentation.
+MAX_INDENTATION: Final = 99
+
+_MILLISECONDS_IN_SECOND: Final = 1000
+
+_INDENT: Final = '    '
+
+# This is needed to stop linter from spewing WPS421 errors.
+report = print
+
+
+def nested_blocks(depth: int) -> str:
+    """Returns ``if`` statements with assignments on each level."""
+    levels = min(depth, MAX_INDENTATION)
+    lines: list[str] = []
+    for level in range(levels):
+        indent = _INDENT * level
+        lines.extend((
+            f'{indent}number{level} = {level}',
+            f'{indent}if number{level}:',
+        ))
+    body_indent = _INDENT * levels
+    lines.append(f'{body_indent}pass')
+    return '\n'.join(lines)
+
+
+def nested_functions(depth: int) -> str:
+    """Returns functions defined inside each other."""
+    levels = min(depth, MAX_INDENTATION)
+    lines: list[str] = []
+    for level in range(levels):
+        indent = _INDENT * level
+        lines.append(f'{indent}def function{level}(arg{level}):')
+    body_indent = _INDENT * levels
+    lines.append(f'{body_indent}return arg0')
+    return '\n'.join(lines)
+
+
+def nested_expressions(depth: int) -> str:
+    """Returns a chain of binary operations, each is nested in the next."""
+    return 'total = {}'.format(' + '.join(itertools.repeat('number', depth)))
+
+
+#: Functions that generate modules of the given depth.
+GENERATORS: Final = (nested_blocks, nested_functions, nested_expressions)
+
+
+def measure(source: str, runs: int) -> float:
+    """Returns the best time of ``transform`` on the source in ms."""
+    tree = ast.parse(source)
+    best_time = min(
+        timeit.repeat(lambda: transform(tree), number=1, repeat=runs),
+    )
+    return best_time * _MILLISECONDS_IN_SECOND
+
+
+def main() -> None:
+    """Prints the best ``transform`` time for each generated module."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--depth', type=int, default=DEFAULT_DEPTH)
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    report(f'Best time of {args.runs} runs, ms:')
+    for generate in GENERATORS:
+        milliseconds = measure(generate(args.depth), args.runs)
+        report(format(milliseconds, '10.1f'), generate.__name__)
+
+
+if __name__ == '__main__':
+    main()
@@ -12,10 +12,10 @@ FAIL_CODE: Final = 255
 OK_CODE: Final = 0
 
 PATTERN: Final = """
-//ClassDef[contains(bases, Name[@id='BaseNodeVisitor'])]/body
+//ClassDef[contains(bases, Name[@id='BaseNodeVisitor']) or
+contains(bases, Attribute[@attr='BaseNodeVisitor' or @attr='BaseNodeTokenVisitor'])]/body
 /FunctionDef[re:match('visit_.*', @name)
-and not(child::body/Expr[last()]/value/Call/func/Attribute[@attr='generic_visit'] or
-child::body/With[last()]/body/Expr[last()]/value/Call/func/Attribute[@attr='generic_visit'])]
+and not(child::body/*[last()]/value/Call/func/Attribute[@attr='generic_visit'])]
 """  # noqa: E501
 
 # This is needed to stop linter from spewing WPS421 errors.
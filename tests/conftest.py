@@ -32,6 +32,15 @@ def options():
         option.long_option_name[2:].replace('-', '_'): option.default
         for option in Configuration._options  # noqa: SLF001
     }
+    # These options are used by `flake8` itself to select violations:
+    default_values.update({
+        'select': None,
+        'extend_select': None,
+        'ignore': None,
+        'extend_ignore': None,
+        'extended_default_select': ('WPS',),
+        'extended_default_ignore': (),
+    })
 
     Options = namedtuple('options', default_values.keys())
 
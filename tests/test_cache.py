@@ -0,0 +1,215 @@
+import ast
+import multiprocessing
+import os
+import pathlib
+import tokenize
+
+import pytest
+
+from wemake_python_styleguide.cache import ResultCache, evict
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.options.validation import validate_options
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+
+_SOURCE = 'x = 1\n'
+
+
+class _BrokenVisitor(BaseNodeVisitor):
+    def visit_Assign(self, node):  # noqa: N802
+        raise ValueError('broken')
+
+
+def _failed_replace(path, target):
+    raise OSError('replace')
+
+
+def _failed_unlink(path, missing_ok):
+    raise OSError('unlink')
+
+
+def _run_checker(source, filename='example.py'):
+    lines = source.splitlines(keepends=True)
+    checker = Checker(
+        tree=ast.parse(source),
+        file_tokens=list(tokenize.generate_tokens(iter(lines).__next__)),
+        filename=filename,
+        lines=lines,
+    )
+    return list(checker.run())
+
+
+@pytest.fixture
+def cached_options(tmp_path, options, monkeypatch):
+    """Returns options with the enabled cache."""
+    monkeypatch.setattr(Checker, '_cache', None)
+    return options(wps_cache_dir=str(tmp_path))
+
+
+def test_warm_run(cached_options, monkeypatch):
+    """Ensures that warm runs load violations without checking."""
+    Checker.parse_options(cached_options)
+    cold_results = _run_checker(_SOURCE)
+
+    monkeypatch.delattr(Checker, '_check')
+    warm_results = _run_checker(_SOURCE)
+
+    assert cold_results
+    assert warm_results == cold_results
+
+
+@pytest.mark.parametrize(
+    ('source', 'filename'),
+    [
+        ('x = 2\n', 'example.py'),
+        (_SOURCE, 'other.py'),
+    ],
+)
+def test_changed_module(cached_options, source, filename):
+    """Ensures that changed modules are checked again."""
+    Checker.parse_options(cached_options)
+    _run_checker(_SOURCE)
+
+    assert _run_checker(source, filename) == _run_checker(source, filename)
+    assert len(list(Checker._cache.directory.glob('*/*'))) == 2  # noqa: SLF001
+
+
+def test_without_lines(cached_options, tmp_path):
+    """Ensures that modules without source lines are not cached."""
+    Checker.parse_options(cached_options)
+    checker = Checker(tree=ast.parse(_SOURCE), file_tokens=[])
+
+    assert list(checker.run())
+    assert not list(tmp_path.iterdir())
+
+
+def test_internal_errors(cached_options, tmp_path, monkeypatch, capsys):
+    """Ensures that results of failed visitors are not cached."""
+    monkeypatch.setattr(Checker, '_visitors', (_BrokenVisitor,))
+    Checker.parse_options(cached_options)
+    cold_results = _run_checker(_SOURCE)
+    capsys.readouterr()
+
+    warm_results = _run_checker(_SOURCE)
+
+    assert warm_results == cold_results
+    assert cold_results[0][2].startswith('WPS000 ')
+    assert 'ValueError: broken' in capsys.readouterr().out
+    assert not list(tmp_path.iterdir())
+
+
+def test_options_fingerprint(tmp_path, options):
+    """Ensures that only options that change violations change the key."""
+    visitor_names = ['Visitor']
+    base_entry = ResultCache.start(
+        validate_options(options(wps_cache_dir=str(tmp_path))),
+        visitor_names,
+    ).entry('example.py', [_SOURCE])
+    performance_entry = ResultCache.start(
+        validate_options(
+            options(wps_cache_dir=str(tmp_path), wps_fused_engine=True),
+        ),
+        visitor_names,
+    ).entry('example.py', [_SOURCE])
+    other_entry = ResultCache.start(
+        validate_options(
+            options(wps_cache_dir=str(tmp_path), max_name_length=10),
+        ),
+        visitor_names,
+    ).entry('example.py', [_SOURCE])
+
+    assert base_entry == performance_entry
+    assert base_entry != other_entry
+
+
+def test_broken_cache(tmp_path):
+    """Ensures that broken cache does not break the checks."""
+    (tmp_path / 'cache').write_text('')
+    result_cache = ResultCache(tmp_path / 'cache', 'fingerprint')
+    entry = result_cache.entry('example.py', [_SOURCE])
+
+    result_cache.store(entry, [(1, 0, 'message')])
+
+    assert result_cache.load(entry) is None
+
+
+@pytest.mark.parametrize(
+    'raw_results',
+    [
+        '[[1, 2',
+        '[[1, 2]]',
+        '[1]',
+        '1',
+    ],
+)
+def test_corrupt_entry(tmp_path, raw_results):
+    """Ensures that corrupt entries are removed and treated as misses."""
+    entry = tmp_path / 'ab' / 'entry'
+    entry.parent.mkdir()
+    entry.write_text(raw_results)
+
+    assert ResultCache(tmp_path, 'fingerprint').load(entry) is None
+    assert not entry.exists()
+
+
+def test_failed_write(tmp_path, monkeypatch):
+    """Ensures that temporary files are removed when writes fail."""
+    entry = tmp_path / 'ab' / 'entry'
+    monkeypatch.setattr(pathlib.Path, 'replace', _failed_replace)
+
+    ResultCache(tmp_path, 'fingerprint').store(entry, [(1, 0, 'message')])
+
+    assert not list(entry.parent.iterdir())
+
+
+def test_failed_remove(tmp_path, monkeypatch):
+    """Ensures that corrupt entries that cannot be removed are misses."""
+    entry = tmp_path / 'ab' / 'entry'
+    entry.parent.mkdir()
+    entry.write_text('[[1, 2')
+    monkeypatch.setattr(pathlib.Path, 'unlink', _failed_unlink)
+
+    assert ResultCache(tmp_path, 'fingerprint').load(entry) is None
+    assert entry.exists()
+
+
+def test_evict_least_recently_used(tmp_path):
+    """Ensures that least recently used entries are removed first."""
+    result_cache = ResultCache(tmp_path, 'fingerprint')
+    entries = [
+        result_cache.entry(f'{index}.py', [_SOURCE]) for index in range(3)
+    ]
+    for index, entry in enumerate(entries):
+        result_cache.store(entry, [(1, 0, 'message')])
+        os.utime(entry, (index, index))
+    assert result_cache.load(entries[0]) == [(1, 0, 'message')]
+
+    evict(tmp_path, entries[0].stat().st_size * 2)
+
+    assert entries[0].exists()
+    assert not entries[1].exists()
+    assert entries[2].exists()
+
+
+def test_evict_removed_entries(tmp_path):
+    """Ensures that entries removed by other processes are skipped."""
+    (tmp_path / 'ab').mkdir()
+    (tmp_path / 'ab' / 'removed').symlink_to(tmp_path / 'missing')
+
+    evict(tmp_path, 0)
+
+    assert (tmp_path / 'ab' / 'removed').is_symlink()
+
+
+def test_worker_does_not_evict(tmp_path, options, monkeypatch):
+    """Ensures that only the main process evicts entries."""
+    result_cache = ResultCache(tmp_path, 'fingerprint')
+    entry = result_cache.entry('example.py', [_SOURCE])
+    result_cache.store(entry, [(1, 0, 'message' * 1024 * 1024)])
+    monkeypatch.setattr(multiprocessing, 'parent_process', object)
+
+    ResultCache.start(
+        validate_options(options(wps_cache_dir=str(tmp_path))),
+        [],
+    )
+
+    assert entry.exists()
@@ -0,0 +1,68 @@
+import ast
+import tokenize
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.compat.constants import PY313, PY315
+from wemake_python_styleguide.violations.system import InternalErrorViolation
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+
+
+class _BrokenVisitor(BaseNodeVisitor):
+    def visit(self, _tree) -> None:
+        raise ValueError('Message from visitor')
+
+
+def _run_checker(filename, options):
+    Checker.parse_options(options)
+    with tokenize.open(filename) as source_file:
+        source = source_file.read()
+    with open(filename, 'rb') as token_file:  # noqa: PTH123
+        file_tokens = list(tokenize.tokenize(token_file.readline))
+    checker = Checker(
+        tree=ast.parse(source),
+        file_tokens=file_tokens,
+        filename=str(filename),
+    )
+    return sorted(checker.run())
+
+
+@pytest.mark.filterwarnings('ignore::SyntaxWarning')
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+@pytest.mark.parametrize(
+    ('filename', 'run_condition'),
+    [
+        ('noqa.py', True),
+        ('noqa313.py', PY313),
+        ('noqa315.py', PY315),
+    ],
+)
+def test_fused_engine_results(
+    absolute_path,
+    options,
+    filename,
+    run_condition,
+):
+    """Ensures that fused engine produces the same violations."""
+    if not run_condition:  # pragma: no cover
+        return
+    fixture = absolute_path('fixtures', 'noqa', filename)
+
+    regular = _run_checker(fixture, options())
+    fused = _run_checker(fixture, options(wps_fused_engine=True))
+
+    assert regular
+    assert fused == regular
+
+
+def test_fused_engine_exception_handling(options, capsys):
+    """Ensures that fused engine reports broken visitors."""
+    Checker.parse_options(options(wps_fused_engine=True))
+    checker = Checker(tree=ast.parse(''), file_tokens=[], filename='test.py')
+    checker._selected_visitors = [_BrokenVisitor]  # noqa: SLF001
+
+    violation = next(checker.run())
+
+    assert violation[2][7:] == InternalErrorViolation.error_template
+    assert 'ValueError: Message from visitor' in capsys.readouterr().out
@@ -1,11 +1,15 @@
+import ast
 import importlib
 import inspect
+import subprocess
+import sys
 from operator import itemgetter
 from pathlib import Path
 
 import pytest
 
 from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.presets.loader import load_visitors
 from wemake_python_styleguide.visitors.base import (
     BaseFilenameVisitor,
     BaseNodeVisitor,
@@ -13,6 +17,16 @@ from wemake_python_styleguide.visitors.base import (
     BaseVisitor,
 )
 
+_PRINT_CHECKER_IMPORTS = (
+    'import sys, wemake_python_styleguide.checker; print(*sys.modules)'
+)
+
+_LAZY_MODULES = (
+    'wemake_python_styleguide.visitors.ast',
+    'wemake_python_styleguide.visitors.tokenize',
+    'wemake_python_styleguide.violations.best_practices',
+)
+
 
 def _is_visitor_class(cls) -> bool:
     base_classes = {
@@ -64,7 +78,7 @@ def test_all_visitors_contained_in_checker(all_visitors):
     """Ensures that all visitors are contained in a checker."""
     checker_visitors = {
         klass.__qualname__
-        for klass in Checker._visitors  # noqa: SLF001
+        for klass in load_visitors(Checker._preset)  # noqa: SLF001
         if not klass.__qualname__.startswith('_')
     }
 
@@ -72,3 +86,40 @@ def test_all_visitors_contained_in_checker(all_visitors):
         assert visitor.__qualname__ in checker_visitors
 
     assert len(all_visitors) == len(checker_visitors)
+
+
+@pytest.mark.parametrize(
+    'visitor_class',
+    [
+        visitor_class
+        for visitor_class in load_visitors(Checker._preset)  # noqa: SLF001
+        if getattr(visitor_class, 'interesting_node_types', ())
+    ],
+)
+def test_interesting_node_types(visitor_class):
+    """Ensures that visitors declare all node types they handle."""
+    handled_types = {
+        node_type if issubclass(node_type, ast.AST) else ast.Constant
+        for node_type in visitor_class.dispatch_table
+    }
+
+    assert handled_types <= set(visitor_class.interesting_node_types)
+
+
+def test_lazy_visitors():
+    """Ensures that importing the checker does not import visitors."""
+    process = subprocess.run(
+        [sys.executable, '-c', _PRINT_CHECKER_IMPORTS],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported_modules = process.stdout.split()
+    visitor_modules = [
+        module_name
+        for module_name in imported_modules
+        if module_name.startswith(_LAZY_MODULES)
+    ]
+
+    assert 'wemake_python_styleguide.checker' in imported_modules
+    assert not visitor_modules
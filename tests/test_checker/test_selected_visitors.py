@@ -0,0 +1,108 @@
+import ast
+import tokenize
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.presets.loader import load_visitors
+from wemake_python_styleguide.violations import complexity
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+
+
+class _UndeclaredVisitor(BaseNodeVisitor):
+    """Does not declare any violations."""
+
+
+def _run_checker(filename, options):
+    Checker.parse_options(options)
+    with tokenize.open(filename) as source_file:
+        source = source_file.read()
+    with open(filename, 'rb') as token_file:  # noqa: PTH123
+        file_tokens = list(tokenize.tokenize(token_file.readline))
+    checker = Checker(
+        tree=ast.parse(source),
+        file_tokens=file_tokens,
+        filename=str(filename),
+    )
+    return sorted(checker.run())
+
+
+def test_all_visitors_declare_violations():
+    """Ensures that all visitors declare violations they emit."""
+    for visitor_class in load_visitors(Checker._preset):  # noqa: SLF001
+        assert visitor_class.emitted_violations, visitor_class
+
+
+@pytest.mark.parametrize(
+    ('selection', 'is_selected'),
+    [
+        ({}, lambda code: True),
+        ({'select': ('WPS2',)}, lambda code: code.startswith('WPS2')),
+        ({'select': ('E', 'C')}, lambda code: False),
+        ({'extend_select': ('WPS2',)}, lambda code: True),
+        (
+            {'extend_ignore': ('WPS2',)},
+            lambda code: not code.startswith('WPS2'),
+        ),
+        (
+            {'select': ('WPS2',), 'ignore': ('WPS20', 'WPS21')},
+            lambda code: (
+                code.startswith('WPS2')
+                and not code.startswith(('WPS20', 'WPS21'))
+            ),
+        ),
+    ],
+)
+def test_selected_visitors(options, selection, is_selected):
+    """Ensures that only visitors with selected violations are executed."""
+    Checker.parse_options(options(**selection))
+
+    selected_visitors = Checker._selected_visitors  # noqa: SLF001
+    for visitor_class in load_visitors(Checker._preset):  # noqa: SLF001
+        emitted_codes = [
+            violation.full_code
+            for violation in visitor_class.emitted_violations
+        ]
+        assert (visitor_class in selected_visitors) == any(
+            map(is_selected, emitted_codes),
+        )
+
+
+def test_ignored_plugin(options, monkeypatch):
+    """Ensures that visitors are not imported when all codes are ignored."""
+    monkeypatch.setattr(Checker, '_visitors', None)
+    Checker.parse_options(options(extend_ignore=('WPS',)))
+
+    assert Checker._visitors is None  # noqa: SLF001
+    assert not Checker._selected_visitors  # noqa: SLF001
+
+
+def test_undeclared_visitors(options, monkeypatch):
+    """Ensures that visitors without declarations are always executed."""
+    monkeypatch.setattr(Checker, '_visitors', (_UndeclaredVisitor,))
+    Checker.parse_options(options(select=('E',)))
+
+    assert Checker._selected_visitors == (_UndeclaredVisitor,)  # noqa: SLF001
+
+
+@pytest.mark.filterwarnings('ignore::SyntaxWarning')
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+def test_selected_visitors_results(absolute_path, options):
+    """Ensures that skipped visitors do not affect selected violations."""
+    fixture = absolute_path('fixtures', 'noqa', 'noqa.py')
+    selected_code = complexity.TooManyLocalsViolation.full_code[:4]
+
+    regular = _run_checker(fixture, options())
+    selected = _run_checker(fixture, options(select=(selected_code,)))
+    selected = [
+        violation
+        for violation in selected
+        if violation[2].startswith(selected_code)
+    ]
+
+    assert selected
+    assert selected == [
+        violation
+        for violation in regular
+        if violation[2].startswith(selected_code)
+    ]
@@ -0,0 +1,219 @@
+"""Testing of wps serve and wps client commands."""
+
+import io
+import pathlib
+import socket
+import stat
+import sys
+import threading
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.cli import cli_app
+from wemake_python_styleguide.cli.commands.serve.linter import Linter
+from wemake_python_styleguide.cli.commands.serve.server import (
+    LintServer,
+    send_request,
+)
+from wemake_python_styleguide.profiler import Profiler
+
+_SOURCE = 'x = 1\n'
+_EXPECTED_OUTPUT = 'example.py:1:1: WPS111 Found too short name: x < 2\n'
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    """Returns path to the server socket."""
+    return str(tmp_path / 'wps.sock')
+
+
+@pytest.fixture
+def linter(monkeypatch):
+    """Returns linter, checker options are restored after the test."""
+    for attribute in ('options', '_selected_visitors', 'profiler', '_cache'):
+        monkeypatch.setattr(
+            Checker,
+            attribute,
+            getattr(Checker, attribute, None),
+            raising=False,
+        )
+    return Linter(['--isolated', '--select', 'WPS1'])
+
+
+@pytest.fixture
+def lint_server(socket_path, linter):
+    """Runs the server in a background thread."""
+    with LintServer(socket_path, linter) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        yield server
+        server.shutdown()
+        thread.join()
+
+
+def _broken_lint(linter, filename, source):
+    raise OSError('broken')
+
+
+def _run_client(monkeypatch, *args):
+    monkeypatch.setattr(sys, 'argv', ['wps', 'client', *args])
+    return cli_app.main()
+
+
+@pytest.mark.usefixtures('lint_server')
+def test_source_request(socket_path):
+    """Ensures that the passed source is checked instead of the file."""
+    response = send_request(
+        socket_path,
+        {'filename': 'missing.py', 'source': f'{_SOURCE}y = 2  # noqa\n'},
+    )
+
+    assert response == {
+        'violations': [
+            {
+                'code': 'WPS111',
+                'line': 1,
+                'column': 1,
+                'text': 'Found too short name: x < 2',
+            },
+        ],
+    }
+
+
+@pytest.mark.usefixtures('lint_server')
+def test_broken_request(socket_path):
+    """Ensures that broken requests do not break the server."""
+    assert send_request(socket_path, {}) == {'error': "KeyError: 'filename'"}
+
+
+@pytest.mark.usefixtures('lint_server')
+def test_client_file(socket_path, tmp_path, monkeypatch, capsys):
+    """Ensures that the client prints violations of the file."""
+    (tmp_path / 'example.py').write_text(_SOURCE)
+    monkeypatch.chdir(tmp_path)
+
+    assert _run_client(monkeypatch, 'example.py', '--socket', socket_path)
+    assert capsys.readouterr().out == _EXPECTED_OUTPUT
+
+
+@pytest.mark.usefixtures('lint_server')
+def test_client_stdin(socket_path, monkeypatch, capsys):
+    """Ensures that the client sends the source from stdin."""
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(_SOURCE))
+
+    assert _run_client(
+        monkeypatch,
+        'example.py',
+        '--socket',
+        socket_path,
+        '--stdin',
+    )
+    assert capsys.readouterr().out == _EXPECTED_OUTPUT
+
+
+@pytest.mark.usefixtures('lint_server')
+def test_client_error(socket_path, monkeypatch, capsys):
+    """Ensures that the client reports errors of the server."""
+    monkeypatch.setattr(Linter, 'lint', _broken_lint)
+
+    assert _run_client(monkeypatch, 'example.py', '--socket', socket_path)
+    assert capsys.readouterr().err == 'OSError: broken\n'
+
+
+def test_server_permissions(lint_server, socket_path):
+    """Ensures that only the owner can connect to the server."""
+    socket_mode = pathlib.Path(socket_path).stat().st_mode
+
+    assert stat.S_IMODE(socket_mode) == stat.S_IRUSR | stat.S_IWUSR
+
+
+def test_request_timeout(lint_server, socket_path, monkeypatch):
+    """Ensures that silent clients do not block the server."""
+    monkeypatch.setattr(lint_server.RequestHandlerClass, 'timeout', 0.1)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        with connection.makefile('rb') as response_file:
+            assert response_file.readline() == (
+                b'{"error": "TimeoutError: timed out"}\n'
+            )
+    assert send_request(socket_path, {}) == {'error': "KeyError: 'filename'"}
+
+
+def test_stale_socket(socket_path, linter):
+    """Ensures that sockets of killed servers are replaced."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale_socket:
+        stale_socket.bind(socket_path)
+
+    with LintServer(socket_path, linter):
+        assert pathlib.Path(socket_path).is_socket()
+
+
+@pytest.mark.usefixtures('lint_server')
+def test_running_server_socket(socket_path, linter):
+    """Ensures that sockets of running servers are not replaced."""
+    with pytest.raises(OSError, match='Address already in use'):
+        LintServer(socket_path, linter)
+
+    assert send_request(socket_path, {}) == {'error': "KeyError: 'filename'"}
+
+
+def test_other_file(socket_path, linter):
+    """Ensures that other files are not replaced."""
+    pathlib.Path(socket_path).write_text(_SOURCE, encoding='utf8')
+
+    with pytest.raises(OSError, match='Address already in use'):
+        LintServer(socket_path, linter)
+
+    assert pathlib.Path(socket_path).read_text(encoding='utf8') == _SOURCE
+
+
+def test_profile_each_request(linter, tmp_path, monkeypatch, capsys):
+    """Ensures that the profile is printed after each request."""
+    monkeypatch.setattr(Checker, 'profiler', Profiler(tmp_path))
+
+    linter.lint('example.py', _SOURCE)
+    first_report = capsys.readouterr().err
+    linter.lint('example.py', _SOURCE)
+
+    assert 'profile: 1 files' in first_report
+    assert 'profile: 1 files' in capsys.readouterr().err
+
+
+def test_client_without_server(socket_path, monkeypatch, capsys):
+    """Ensures that the client reports that the server is not running."""
+    assert _run_client(monkeypatch, 'example.py', '--socket', socket_path)
+    assert 'wps serve' in capsys.readouterr().err
+
+
+def _interrupt(server):
+    raise KeyboardInterrupt
+
+
+def _run_server(monkeypatch, socket_path):
+    monkeypatch.setattr(
+        sys,
+        'argv',
+        ['wps', 'serve', '--socket', socket_path, '--', '--isolated'],
+    )
+    return cli_app.main()
+
+
+@pytest.mark.usefixtures('linter')
+def test_serve(socket_path, monkeypatch, capsys):
+    """Ensures that the server removes its socket when stopped."""
+    monkeypatch.setattr(LintServer, 'serve_forever', _interrupt)
+
+    assert _run_server(monkeypatch, socket_path) == 0
+    assert 'Stopped' in capsys.readouterr().err
+    assert not pathlib.Path(socket_path).exists()
+
+
+@pytest.mark.usefixtures('linter')
+def test_serve_wrong_socket(tmp_path, monkeypatch, capsys):
+    """Ensures that the server reports sockets it cannot listen on."""
+    socket_path = str(tmp_path / 'missing' / 'wps.sock')
+
+    assert _run_server(monkeypatch, socket_path) == 1
+    assert 'Cannot listen' in capsys.readouterr().err
@@ -0,0 +1,126 @@
+import ast
+import tokenize
+
+import pytest
+
+from wemake_python_styleguide.cache import ResultCache
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.incremental import ModuleDefinitions
+from wemake_python_styleguide.violations.system import InternalErrorViolation
+from wemake_python_styleguide.visitors.ast.complexity.jones import (
+    JonesComplexityVisitor,
+)
+from wemake_python_styleguide.visitors.ast.naming.validation import (
+    WrongNameVisitor,
+)
+
+_ADDED_FUNCTION = 'def added_function(a):\n    return a\n\n\n'
+
+
+def _run_checker(source):
+    lines = source.splitlines(keepends=True)
+    checker = Checker(
+        tree=ast.parse(source),
+        file_tokens=list(tokenize.generate_tokens(iter(lines).__next__)),
+        filename='example.py',
+        lines=lines,
+    )
+    return sorted(checker.run())
+
+
+def _run_visitor(visitor):
+    visitor.run()
+
+
+def _fail_visitor(visitor):
+    visitor.add_violation(InternalErrorViolation())
+
+
+@pytest.fixture
+def incremental_options(tmp_path, options, monkeypatch):
+    """Returns options with the enabled incremental mode."""
+    monkeypatch.setattr(Checker, '_cache', None)
+    return options(wps_cache_dir=str(tmp_path), wps_incremental=True)
+
+
+@pytest.mark.filterwarnings('ignore::SyntaxWarning')
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+def test_incremental_results(
+    absolute_path,
+    options,
+    incremental_options,
+):
+    """Ensures that incremental mode finds the same violations."""
+    fixture = absolute_path('fixtures', 'noqa', 'noqa.py')
+    source = fixture.read_text(encoding='utf8')
+    changed_source = _ADDED_FUNCTION + source.replace('_arg6)', '_arg6, _arg7)')
+
+    Checker.parse_options(options())
+    regular = _run_checker(changed_source)
+
+    Checker.parse_options(incremental_options)
+    _run_checker(source)
+    incremental = _run_checker(changed_source)
+
+    assert source != changed_source
+    assert regular
+    assert incremental == regular
+
+
+def _run_definitions(result_cache, lines, options):
+    tree = ast.parse(''.join(lines))
+    visitor = WrongNameVisitor(options(), tree=tree)
+    definitions = ModuleDefinitions(result_cache, 'x.py', tree, lines)
+    return definitions.run([visitor], _run_visitor), visitor.tree
+
+
+def test_unchanged_definitions(tmp_path, options):
+    """Ensures that unchanged definitions are not checked again."""
+    result_cache = ResultCache(tmp_path, 'fingerprint')
+    lines = ['def function(a):\n', '    return a\n']
+    cold_results, _ = _run_definitions(result_cache, lines, options)
+    warm_results, checked_tree = _run_definitions(
+        result_cache,
+        ['\n', *lines],
+        options,
+    )
+
+    assert cold_results
+    assert warm_results == [
+        (check_result[0] + 1, *check_result[1:])
+        for check_result in cold_results
+    ]
+    assert not ast.unparse(checked_tree)
+
+
+def test_shared_lines(tmp_path, options):
+    """Ensures that modules with statements sharing lines are not split."""
+    result_cache = ResultCache(tmp_path, 'fingerprint')
+    lines = ['x = 1; y = 2\n', 'def function(a):\n', '    return a\n']
+    tree = ast.parse(''.join(lines))
+    definitions = ModuleDefinitions(result_cache, 'x.py', tree, lines)
+
+    definitions.run([WrongNameVisitor(options(), tree=tree)], _run_visitor)
+
+    assert not list(tmp_path.iterdir())
+
+
+def test_failed_visitors(tmp_path, options):
+    """Ensures that definitions are not cached when visitors fail."""
+    result_cache = ResultCache(tmp_path, 'fingerprint')
+    lines = ['def function(a):\n', '    return a\n']
+    tree = ast.parse(''.join(lines))
+    definitions = ModuleDefinitions(result_cache, 'x.py', tree, lines)
+    check_results = definitions.run(
+        [WrongNameVisitor(options(), tree=tree)],
+        _fail_visitor,
+    )
+
+    assert check_results == [(0, 0, InternalErrorViolation().message())]
+    assert not list(tmp_path.iterdir())
+
+
+def test_module_level_visitors():
+    """Ensures that module-level aggregates are not incremental."""
+    assert WrongNameVisitor.incremental
+    assert not JonesComplexityVisitor.incremental
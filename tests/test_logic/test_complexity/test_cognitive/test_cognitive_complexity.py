@@ -6,6 +6,11 @@ Adapted from https://github.com/Melevir/cognitive_complexity
 
 import pytest
 
+from wemake_python_styleguide.logic.complexity import cognitive
+
+#: Deep enough to hit the default recursion limit in a recursive engine.
+_DEEP_NESTING = 1000
+
 complexity1_1 = """
 def f(a, b):
     if a:  # +1
@@ -29,6 +34,13 @@ def f(a):
         case _: return a # +1
 """
 
+complexity1_5 = """
+def f(a):
+    def f(b):  # shadows the outer function
+        return f(b - 1)  # +1 for recursion
+    return f(a)
+"""
+
 complexity2_1 = """
 def f(a, b):
     if a and b and True:  # +2
@@ -50,6 +62,13 @@ def f(a, b):
         case 2: return 2  # +1
 """
 
+complexity2_4 = """
+def f(a):
+    def inner():
+        return a and f(a - 1)  # +1 for nested `and`, +1 for recursion
+    return inner()
+"""
+
 complexity3_1 = """
 def f(a, b):
     if a and b or True:  # +3
@@ -98,6 +117,14 @@ def f(a):
     return 'a' if a else 'b'  # +1
 """
 
+complexity4_4 = """
+def f(items):
+    for item in items:  # +1
+        def inner():
+            if item:  # +3
+                return item
+"""
+
 complexity5_1 = """
 def f(a):
     valid_items = []
@@ -165,6 +192,15 @@ def enhance(tree):
     return tree
 """
 
+nested_functions = """
+def outer(a):
+    if a:  # +1
+        def inner(b):
+            if b:  # +3 for `outer`, +1 for `inner`
+                return inner(b - 1)  # +1 for recursion of `inner`
+    return a
+"""
+
 
 @pytest.mark.parametrize(
     ('code', 'complexity'),
@@ -173,15 +209,18 @@ def enhance(tree):
         (complexity1_2, 1),
         (complexity1_3, 1),
         (complexity1_4, 1),
+        (complexity1_5, 1),
         (complexity2_1, 2),
         (complexity2_2, 2),
         (complexity2_3, 2),
+        (complexity2_4, 2),
         (complexity3_1, 3),
         (complexity3_2, 3),
         (complexity3_3, 3),
         (complexity4_1, 4),
         (complexity4_2, 4),
         (complexity4_3, 4),
+        (complexity4_4, 4),
         (complexity5_1, 5),
         (complexity6_1, 6),
         (complexity9_1, 9),
@@ -198,3 +237,20 @@ def test_cognitive_complexity(
 ):
     """Ensures that cognitive complexity count is correct."""
     assert get_code_snippet_complexity(mode(code)) == complexity
+
+
+def test_nested_functions_complexity(parse_ast_tree):
+    """Ensures that nested functions are counted in a single pass."""
+    tree = parse_ast_tree(nested_functions)
+
+    scores = cognitive.cognitive_scores(tree.body[0])
+
+    assert list(scores.values()) == [4, 2]
+
+
+def test_deep_code_complexity(get_code_snippet_complexity):
+    """Ensures that deeply nested code does not hit the recursion limit."""
+    deep_condition = 'not ' * _DEEP_NESTING
+    code = f'def f(a):\n    if {deep_condition}a:  # +1\n        return a'
+
+    assert get_code_snippet_complexity(code) == 1
@@ -0,0 +1,44 @@
+import ast
+
+from wemake_python_styleguide.logic.source import (
+    RenderedNodes,
+    node_to_string,
+    rendered_nodes,
+)
+from wemake_python_styleguide.transformations.ast_tree import transform
+
+
+def test_rendered_once():
+    """Ensures that each node is unparsed only once."""
+    module = transform(ast.parse('first + second'))
+    expression = module.body[0].value
+    unparsed = rendered_nodes.unparsed
+
+    sources = {node_to_string(expression) for _ in range(3)}
+
+    assert sources == {'first + second'}
+    assert rendered_nodes.unparsed == unparsed + 1
+
+
+def test_cleared_for_new_tree():
+    """Ensures that rendered nodes of old trees are removed."""
+    module = transform(ast.parse('first + second'))
+    node_to_string(module)
+    unparsed = rendered_nodes.unparsed
+
+    transform(ast.parse('other'))
+    node_to_string(module)
+
+    assert rendered_nodes.unparsed == unparsed + 1
+
+
+def test_bounded_size():
+    """Ensures that full memo is cleared."""
+    memo = RenderedNodes(max_size=2)
+    nodes = ast.parse('first, second, third').body[0].value.elts
+
+    sources = [memo.render(node) for node in (*nodes, nodes[0])]
+
+    assert sources == ['first', 'second', 'third', 'first']
+    assert memo.calls == 4
+    assert memo.unparsed == 4
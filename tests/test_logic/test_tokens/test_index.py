@@ -0,0 +1,67 @@
+import ast
+import io
+import tokenize
+
+from wemake_python_styleguide.logic.tokens.index import TokenIndex
+
+_CODE = """
+first = items[
+    1:2
+]
+second = 'text'
+"""
+
+
+def _parse(code):
+    tokens = list(tokenize.generate_tokens(io.StringIO(code).readline))
+    return ast.parse(code), TokenIndex(tokens)
+
+
+def test_by_start():
+    """Ensures that tokens are found by their start positions."""
+    module, token_index = _parse(_CODE)
+    constant = module.body[1].value
+
+    token = token_index.by_start[constant.lineno, constant.col_offset]
+
+    assert token.string == "'text'"
+
+
+def test_by_line():
+    """Ensures that tokens are grouped by their lines."""
+    _, token_index = _parse(_CODE)
+
+    assert [token.string for token in token_index.by_line[5]] == [
+        'second',
+        '=',
+        "'text'",
+        '\n',
+    ]
+
+
+def test_get_span():
+    """Ensures that all lines of multiline nodes are spanned."""
+    module, token_index = _parse(_CODE)
+    subscript = module.body[0].value
+
+    assert [token.string for token in token_index.get_span(subscript)] == [
+        'items',
+        '[',
+        '\n',
+        '1',
+        ':',
+        '2',
+        '\n',
+        ']',
+    ]
+
+
+def test_lines():
+    """Ensures that lines are linked to their neighbours."""
+    _, token_index = _parse(_CODE)
+    first_line, *_, last_line = token_index.lines
+
+    assert first_line.previous_token is None
+    assert first_line.next_token.string == 'first'
+    assert last_line.previous_token.string == '\n'
+    assert last_line.next_token is None
@@ -0,0 +1,50 @@
+import ast
+import itertools
+
+import pytest
+
+from wemake_python_styleguide.logic.tree.structure import StructuralKeys
+
+#: Recursive implementation would fail on this depth.
+_DEPTH = 2000
+
+
+def _parse_expression(code):
+    statement = ast.parse(code).body[0]
+    if isinstance(statement, ast.Assign):
+        return statement.targets[0]
+    return statement.value
+
+
+@pytest.mark.parametrize(
+    ('first', 'second', 'is_equal'),
+    [
+        ('call(arg, key=1)', 'call( arg , key = 1 )', True),
+        ('items[0]', 'items[0] = 1', True),
+        ('"text"', "'text'", True),
+        ('call(1)', 'call(1.0)', False),
+        ('call(1)', 'call(True)', False),
+        ('call(first)', 'call(second)', False),
+        ('first + second', 'first - second', False),
+        ('[*items]', '[items]', False),
+    ],
+)
+def test_structural_keys(first, second, is_equal):
+    """Ensures that only structurally equal nodes have equal keys."""
+    structural_keys = StructuralKeys()
+
+    first_key = structural_keys.get_key(_parse_expression(first))
+    second_key = structural_keys.get_key(_parse_expression(second))
+
+    assert (first_key == second_key) is is_equal
+
+
+def test_deeply_nested_nodes():
+    """Ensures that deeply nested nodes do not hit the recursion limit."""
+    structural_keys = StructuralKeys()
+    source_code = ' + '.join(itertools.repeat('number', _DEPTH))
+
+    first_key = structural_keys.get_key(ast.parse(source_code))
+    second_key = structural_keys.get_key(ast.parse(source_code))
+
+    assert first_key == second_key
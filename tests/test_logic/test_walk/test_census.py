@@ -0,0 +1,71 @@
+import ast
+
+import pytest
+
+from wemake_python_styleguide.logic.walk.census import (
+    get_census,
+    get_outermost_nodes,
+)
+
+_CODE = """
+try:
+    import first
+except ImportError:
+    try:
+        from second import first
+    except ImportError:
+        first = None
+
+def function():
+    import third
+"""
+
+
+class _RecordingVisitor(ast.NodeVisitor):
+    def __init__(self) -> None:
+        self.visited: list[ast.AST] = []
+
+    def visit(self, node: ast.AST) -> None:
+        self.visited.append(node)
+        self.generic_visit(node)
+
+
+def test_census_order(parse_ast_tree):
+    """Ensures that census keeps nodes in the same order as visitors."""
+    tree = parse_ast_tree(_CODE)
+    census = get_census(tree)
+    visitor = _RecordingVisitor()
+    visitor.visit(tree)
+
+    assert census is not None
+    positioned_nodes = sorted(
+        positioned_node
+        for census_nodes in census.values()
+        for positioned_node in census_nodes.positioned()
+    )
+    assert [node for _, node in positioned_nodes] == visitor.visited
+
+
+@pytest.mark.parametrize(
+    ('node_types', 'expected_lines'),
+    [
+        ((ast.Try,), [2]),
+        ((ast.Import,), [3, 11]),
+        ((ast.Import, ast.ImportFrom), [3, 6, 11]),
+        ((ast.Try, ast.FunctionDef), [2, 10]),
+        ((ast.Match,), []),
+    ],
+)
+def test_outermost_nodes(parse_ast_tree, node_types, expected_lines):
+    """Ensures that only outermost nodes are returned in document order."""
+    census = get_census(parse_ast_tree(_CODE))
+
+    assert census is not None
+    assert [
+        node.lineno for node in get_outermost_nodes(census, node_types)
+    ] == expected_lines
+
+
+def test_missing_census():
+    """Ensures that regular trees do not have census."""
+    assert get_census(ast.parse(_CODE)) is None
@@ -0,0 +1,51 @@
+import ast
+
+from wemake_python_styleguide.logic.walk.symbols import get_symbols
+
+_CODE = """
+for first in items:
+    use(first)
+
+def function():
+    with open() as (second, third):
+        second = third
+    del second
+
+del first
+"""
+
+
+def test_module_symbols(parse_ast_tree):
+    """Ensures that names of nested contexts are not included."""
+    module_symbols = get_symbols(parse_ast_tree(_CODE))
+
+    assert [name.id for name in module_symbols.definitions] == ['first']
+    assert [name.id for _, name in module_symbols.loads] == [
+        'items',
+        'use',
+        'first',
+    ]
+    assert module_symbols.deleted == {'first'}
+    assert list(module_symbols.blocks) == ['first']
+
+
+def test_block_positions(parse_ast_tree):
+    """Ensures that blocks are positioned where they define variables."""
+    function = parse_ast_tree(_CODE).body[1]
+    function_symbols = get_symbols(function)
+    load_position, _ = function_symbols.loads[-1]
+
+    assert [
+        block_position < load_position
+        for block_position, _ in function_symbols.blocks['second']
+    ] == [True]
+    assert function_symbols.blocks['second'] == function_symbols.blocks['third']
+    assert function_symbols.deleted == {'second'}
+
+
+def test_not_transformed():
+    """Ensures that contexts of regular trees have no symbols."""
+    module_symbols = get_symbols(ast.parse(_CODE))
+
+    assert not module_symbols.definitions
+    assert not module_symbols.loads
@@ -0,0 +1,72 @@
+import ast
+
+import pytest
+
+from wemake_python_styleguide.logic.walk import is_contained, is_contained_by
+from wemake_python_styleguide.transformations.ast_tree import transform
+
+_CODE = """
+for first in items:
+    use(first)
+
+for second in items:
+    for third in items:
+        use(second, third)
+"""
+
+_GENERATOR = """
+def outer():
+    def inner():
+        yield -1
+    return inner
+"""
+
+
+def test_is_contained_by():
+    """Ensures that containers are found on any depth."""
+    module = transform(ast.parse(_CODE))
+    first_loop, second_loop = module.body
+    nested_loop = second_loop.body[0]
+    nested_call = nested_loop.body[0].value
+
+    assert [
+        is_contained_by(nested_call, container)
+        for container in (
+            module,
+            first_loop,
+            second_loop,
+            nested_loop,
+            nested_call,
+        )
+    ] == [True, False, True, True, False]
+    assert not is_contained_by(second_loop, nested_loop)
+
+
+def test_not_transformed():
+    """Ensures that nodes without tour numbers are not contained."""
+    module = transform(ast.parse(_CODE))
+    other_module = ast.parse(_CODE)
+
+    assert not is_contained_by(module.body[0], other_module)
+    assert not is_contained_by(other_module.body[0], module)
+
+
+@pytest.mark.parametrize(
+    ('to_check', 'expected'),
+    [
+        (ast.Yield, [True, True, True]),
+        ((ast.YieldFrom, ast.USub), [True, True, True]),
+        (ast.YieldFrom, [False, False, False]),
+        (ast.Return, [True, False, True]),
+        (ast.FunctionDef, [True, True, True]),
+    ],
+)
+def test_is_contained(to_check, expected):
+    """Ensures that subtree masks and walks find the same nodes."""
+    module = transform(ast.parse(_GENERATOR))
+    outer = module.body[0]
+
+    assert [
+        is_contained(node, to_check)
+        for node in (outer, outer.body[0], ast.parse(_GENERATOR))
+    ] == expected
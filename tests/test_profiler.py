@@ -0,0 +1,241 @@
+import ast
+import atexit
+import multiprocessing
+import os
+from unittest import mock
+
+import attr
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.profiler import (
+    PROFILE_DIRECTORY_ENV,
+    FileProfile,
+    Profiler,
+    ProfileReport,
+    VisitorProfile,
+    load_profiles,
+    print_report,
+)
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    BaseTokenVisitor,
+)
+from wemake_python_styleguide.visitors.engine import FusedEngine
+
+_SOURCE = 'some_value = 1\nx = some_value\n'
+
+
+class _NameVisitor(BaseNodeVisitor):
+    def visit_Name(self, node):  # noqa: N802
+        self.generic_visit(node)
+
+
+class _NumberVisitor(BaseNodeVisitor):
+    def visit_Num(self, node):  # noqa: N802
+        self.generic_visit(node)
+
+
+class _CatchAllVisitor(BaseNodeVisitor):
+    def visit(self, node):
+        self.generic_visit(node)
+
+
+class _TokenVisitor(BaseTokenVisitor):
+    def visit_name(self, token):
+        """Only tokens are visited, no nodes."""
+
+
+@pytest.fixture
+def profile_directory(tmp_path, monkeypatch):
+    """Makes the current process a worker with the given directory."""
+    monkeypatch.setattr(multiprocessing, 'parent_process', object)
+    monkeypatch.setenv(PROFILE_DIRECTORY_ENV, str(tmp_path))
+    monkeypatch.setattr(Checker, 'profiler', None)
+    return tmp_path
+
+
+def test_main_process_start(tmp_path, monkeypatch):
+    """Ensures that the main process creates directory and registers report."""
+    registered = []
+    monkeypatch.setenv(PROFILE_DIRECTORY_ENV, str(tmp_path))  # inherited
+    monkeypatch.setattr(
+        atexit,
+        'register',
+        lambda *args: registered.append(args),
+    )
+
+    main_profiler = Profiler.start()
+
+    assert main_profiler.directory != tmp_path
+    assert os.environ[PROFILE_DIRECTORY_ENV] == str(main_profiler.directory)
+    assert registered == [(print_report, main_profiler.directory)]
+    main_profiler.directory.rmdir()
+
+
+def test_child_process_start(monkeypatch):
+    """Ensures that child processes without the directory create one."""
+    registered = []
+    monkeypatch.setattr(multiprocessing, 'parent_process', object)
+    monkeypatch.delenv(PROFILE_DIRECTORY_ENV, raising=False)
+    monkeypatch.setattr(
+        atexit,
+        'register',
+        lambda *args: registered.append(args),
+    )
+
+    child_profiler = Profiler.start()
+
+    assert os.environ[PROFILE_DIRECTORY_ENV] == str(child_profiler.directory)
+    assert registered == [(print_report, child_profiler.directory)]
+    child_profiler.directory.rmdir()
+
+
+def test_worker_process_start(profile_directory):
+    """Ensures that workers reuse the directory of the main process."""
+    assert Profiler.start().directory == profile_directory
+
+
+def test_checker_profile(profile_directory, options):
+    """Ensures that checker records all selected visitors."""
+    Checker.parse_options(options(wps_profile=True))
+    checker = Checker(
+        tree=ast.parse(_SOURCE),
+        file_tokens=[],
+        filename='example.py',
+    )
+
+    violations = list(checker.run())
+    file_profiles = load_profiles(profile_directory)
+
+    nodes = list(ast.walk(checker.tree))
+    selected_visitors = Checker._selected_visitors  # noqa: SLF001
+
+    assert len(file_profiles) == 1
+    assert file_profiles[0].filename == 'example.py'
+    assert file_profiles[0].nodes == len(nodes)
+    assert len(file_profiles[0].visitors) == len(selected_visitors)
+    assert sum(
+        visitor_profile.violations
+        for visitor_profile in file_profiles[0].visitors
+    ) == len(violations)
+
+
+@pytest.mark.parametrize('fused_engine', [True, False])
+def test_handled_nodes(profile_directory, options, monkeypatch, fused_engine):
+    """Ensures that nodes handled by each visitor are counted."""
+    engine_run = mock.patch.object(
+        FusedEngine,
+        'run',
+        autospec=True,
+        side_effect=FusedEngine.run,
+    )
+    monkeypatch.setattr(
+        Checker,
+        '_visitors',
+        (_NameVisitor, _NumberVisitor, _CatchAllVisitor, _TokenVisitor),
+    )
+    Checker.parse_options(
+        options(wps_profile=True, wps_fused_engine=fused_engine),
+    )
+    checker = Checker(
+        tree=ast.parse(_SOURCE),
+        file_tokens=[],
+        filename='example.py',
+    )
+
+    with engine_run as engine_run_mock:
+        list(checker.run())
+    file_profile = load_profiles(profile_directory)[0]
+
+    assert engine_run_mock.called is fused_engine
+    assert all(
+        visitor_profile.seconds > 0 for visitor_profile in file_profile.visitors
+    )
+    assert [
+        (visitor_profile.visitor, visitor_profile.nodes)
+        for visitor_profile in file_profile.visitors
+    ] == [
+        ('_NameVisitor', 3),
+        ('_NumberVisitor', 1),
+        ('_CatchAllVisitor', file_profile.nodes),
+        ('_TokenVisitor', 0),
+    ]
+
+
+def test_rendered_nodes(profile_directory, options):
+    """Ensures that rendered nodes are counted."""
+    Checker.parse_options(options(wps_profile=True))
+    checker = Checker(
+        tree=ast.parse('call(first)\ncall(first)\n'),
+        file_tokens=[],
+        filename='example.py',
+    )
+
+    list(checker.run())
+    file_profile = load_profiles(profile_directory)[0]
+    report = ProfileReport([
+        attr.evolve(file_profile, rendered=3, unparsed=1),
+        attr.evolve(file_profile, rendered=2, unparsed=2),
+    ]).format()
+
+    assert 0 < file_profile.unparsed < file_profile.rendered
+    assert 'Rendered nodes: 5, unparsed: 3' in report
+
+
+def test_merged_report(profile_directory, capsys):
+    """Ensures that measurements of all processes are merged and removed."""
+    shard_profiler = Profiler(profile_directory)
+    shard_profiler._record(  # noqa: SLF001
+        FileProfile('first.py', 5, [VisitorProfile('Slow', 0.5, 2, 7)]),
+    )
+    (profile_directory / 'other.jsonl').write_text(
+        (profile_directory / f'{os.getpid()}.jsonl')
+        .read_text()
+        .replace('first.py', 'second.py')
+        .replace('0.5', '0.00005'),
+    )
+
+    print_report(profile_directory)
+
+    report = capsys.readouterr().err
+    assert 'profile: 2 files, 1 visitors, 0.5000s' in report
+    assert '4          14  Slow' in report
+    assert '       1       0       0       0       1  Slow' in report
+    assert report.index('first.py') < report.index('second.py')
+    assert not profile_directory.exists()
+
+
+def test_report_each_run(profile_directory, capsys):
+    """Ensures that each report only has measurements since the last one."""
+    run_profiler = Profiler(profile_directory)
+    run_profiler._record(  # noqa: SLF001
+        FileProfile('first.py', 5, [VisitorProfile('Slow', 0.5, 2, 7)]),
+    )
+
+    run_profiler.report()
+    first_report = capsys.readouterr().err
+    run_profiler.report()
+
+    assert 'profile: 1 files' in first_report
+    assert not capsys.readouterr().err
+    assert profile_directory.exists()
+
+
+def test_empty_report():
+    """Ensures that the report can be created when nothing was checked."""
+    report = ProfileReport([]).format()
+
+    assert 'profile: 0 files, 0 visitors' in report
+
+
+def test_histogram_buckets():
+    """Ensures that timings are put into correct histogram buckets."""
+    file_profiles = [
+        FileProfile('example.py', 1, [VisitorProfile('Visitor', seconds, 0)])
+        for seconds in (0, 0.0005, 0.005, 0.05, 0.5, 5)
+    ]
+
+    report = ProfileReport(file_profiles).format()
+
+    assert '       1       1       1       1       2  Visitor' in report
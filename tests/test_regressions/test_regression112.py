@@ -42,7 +42,7 @@ def test_regression112(default_options):
     Checker.parse_options(default_options)
 
     # Now we create modifications to the tree:
-    Checker(tree=module, file_tokens=[], filename='custom.py')
+    list(Checker(tree=module, file_tokens=[], filename='custom.py').run())
 
     # It was failing on this line:
     # AttributeError: 'ExceptHandler' object has no attribute 'depth'
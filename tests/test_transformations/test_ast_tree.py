@@ -0,0 +1,115 @@
+import ast
+import itertools
+
+from wemake_python_styleguide.logic.nodes import (
+    IN_ASSERT,
+    get_context,
+    get_flags,
+    get_parent,
+)
+from wemake_python_styleguide.logic.walk import is_contained_by
+from wemake_python_styleguide.transformations.ast_tree import transform
+
+#: Recursive implementation used to fail on this depth.
+_DEPTH = 2000
+
+_NESTED_CONTEXTS = """
+class Example:
+    def method(self):
+        if self:
+            number = 1
+"""
+
+_ANCESTOR_FLAGS = """
+@decorator(lambda: lambda_body)
+def function(arg: int = default) -> 'Returned':
+    assert f'{formatted}'
+    annotated: Final = default
+"""
+
+_SHARED_NODES = """
+def first(a):
+    assert [[a == 1]]
+
+def second(b):
+    return [b == [], -b, b + 1]
+
+total = a + b == c
+"""
+
+
+def test_parent_and_context():
+    """Ensures that parents and contexts are set for all nodes."""
+    module = transform(ast.parse(_NESTED_CONTEXTS))
+    class_def = module.body[0]
+    method = class_def.body[0]
+    assign = method.body[0].body[0]
+
+    assert get_parent(module) is None
+    assert get_parent(assign) is method.body[0]
+    assert [
+        get_context(node)
+        for node in (module, class_def, method, assign, assign.value)
+    ] == [None, module, class_def, method, method]
+
+
+def test_deeply_nested_expressions():
+    """Ensures that deeply nested modules do not hit the recursion limit."""
+    module = transform(
+        ast.parse(' + '.join(itertools.repeat('number', _DEPTH))),
+    )
+    deepest_name = next(
+        node for node in ast.walk(module) if isinstance(node, ast.Name)
+    )
+
+    assert get_context(deepest_name) is module
+
+
+def test_ancestor_flags():
+    """Ensures that ancestor flags are set for nested nodes."""
+    module = transform(ast.parse(_ANCESTOR_FLAGS))
+    flags = {
+        node.id: get_flags(node)
+        for node in ast.walk(module)
+        if isinstance(node, ast.Name)
+    }
+    returned = module.body[0].returns
+
+    assert flags == {
+        'decorator': 2,
+        'lambda_body': 2,
+        'default': 0,
+        'int': 1,
+        'formatted': 12,
+        'annotated': 0,
+        'Final': 1,
+    }
+    assert get_flags(returned) == 1
+
+
+def test_shared_nodes():
+    """Ensures that shared nodes get the last parent of ``ast.walk``."""
+    module = transform(ast.parse(_SHARED_NODES))
+    expected_parents = {
+        child: node
+        for node in ast.walk(module)
+        for child in ast.iter_child_nodes(node)
+    }
+    shared_nodes = [
+        node
+        for node in expected_parents
+        if isinstance(node, ast.expr_context | ast.operator | ast.cmpop)
+    ]
+    equal = next(
+        node for node in ast.walk(module.body[0]) if isinstance(node, ast.Eq)
+    )
+
+    assert [get_parent(node) for node in shared_nodes] == [
+        expected_parents[node] for node in shared_nodes
+    ]
+    assert [get_context(node) for node in shared_nodes] == [
+        get_context(expected_parents[node]) for node in shared_nodes
+    ]
+    assert get_flags(equal) == IN_ASSERT
+    assert is_contained_by(equal, module.body[0])
+    assert not is_contained_by(equal, module.body[1])
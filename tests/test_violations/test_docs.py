@@ -2,6 +2,14 @@ from wemake_python_styleguide.options.config import Configuration
 
 FORMATTING_OPTIONS = frozenset(('--show-violation-links',))
 
+PERFORMANCE_OPTIONS = frozenset((
+    '--wps-fused-engine',
+    '--wps-profile',
+    '--wps-cache-dir',
+    '--wps-cache-max-size',
+    '--wps-incremental',
+))
+
 
 def test_all_violations_have_versionadded(all_violations):
     """Ensures that all violations have `versionadded` tag."""
@@ -28,6 +36,7 @@ def test_configuration(all_violations):
         option.long_option_name: False
         for option in Configuration._options  # noqa: SLF001
         if option.long_option_name not in FORMATTING_OPTIONS
+        and option.long_option_name not in PERFORMANCE_OPTIONS
     }
 
     for violation in all_violations:
@@ -30,6 +30,13 @@ def _produce_error_message(visitor: BaseVisitor) -> str:  # pragma: no cover
     return ''
 
 
+def _assert_emitted_violations(visitor: BaseVisitor) -> None:
+    assert all(
+        isinstance(error, type(visitor).emitted_violations)
+        for error in visitor.violations
+    ), 'Visitor emits violations that it does not declare'
+
+
 @pytest.fixture(scope='session')
 def assert_errors():
     """Helper function to assert visitor violations."""
@@ -52,6 +59,7 @@ def assert_errors():
         assert len(real_errors) == len(expected_errors), _produce_error_message(
             visitor,
         )
+        _assert_emitted_violations(visitor)
 
         for index, error in enumerate(real_errors):
             assert expected_errors[index].disabled_since is None
@@ -50,6 +50,13 @@ def wrapper():
     assert i == 0
 """
 
+correct_for_loop7 = """
+def wrapper():
+    print(i)
+    for i in ():
+        ...
+"""
+
 correct_for_multi_loops = """
 def wrapper():
     for my_var in range(3):
@@ -262,6 +269,7 @@ def test_control_variable_used_after_block(
         correct_for_loop4,
         correct_for_loop5,
         correct_for_loop6,
+        correct_for_loop7,
         correct_for_multi_loops,
         correct_for_comprehension1,
         correct_for_comprehension2,
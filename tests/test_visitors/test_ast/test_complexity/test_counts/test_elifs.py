@@ -130,6 +130,27 @@ def test_module():
         ...
 """
 
+function_with_two_chains = """
+def test_module():
+    if 1 > 2:
+        ...
+    elif 2 > 3:
+        ...
+    elif 3 > 4:
+        ...
+    elif 4 > 5:
+        ...
+
+    if 5 > 6:
+        ...
+    elif 6 > 7:
+        ...
+    elif 7 > 8:
+        ...
+    elif 8 > 9:
+        ...
+"""
+
 function_with_ifs = """
 def test_module():
     if True:
@@ -169,6 +190,7 @@ def with_ternary(some_value):
         function_with_one_elif,
         function_with_two_elifs,
         function_with_three_elifs,
+        function_with_two_chains,
         function_with_ifs,
         function_with_raw_if,
         function_with_if_else,
@@ -24,6 +24,13 @@ async def function():  # has two awaits
     await two()
 """
 
+function_with_awaits_in_nested_signature = """
+async def function():  # has two awaits
+    @decorate(await one())
+    async def factory(arg=await two()):  # has no awaits
+        ...
+"""
+
 
 @pytest.mark.parametrize(
     'code',
@@ -54,6 +61,7 @@ def test_awaits_correct_count(
     [
         function_with_awaits,
         function_with_nested_function_and_awaits,
+        function_with_awaits_in_nested_signature,
     ],
 )
 def test_awaits_wrong_count(
@@ -72,3 +80,20 @@ def test_awaits_wrong_count(
 
     assert_errors(visitor, [TooManyAwaitsViolation])
     assert_error_text(visitor, '2', option_values.max_awaits)
+
+
+def test_awaits_in_top_level_signature(
+    assert_errors,
+    parse_ast_tree,
+    options,
+):
+    """Testing that awaits in signatures are not counted in the function."""
+    tree = parse_ast_tree(
+        'async def function(arg=await one()):\n    await two()',
+        do_compile=False,  # top level `await` is only valid in REPL
+    )
+
+    visitor = FunctionComplexityVisitor(options(max_awaits=1), tree=tree)
+    visitor.run()
+
+    assert_errors(visitor, [])
@@ -26,6 +26,15 @@ def function():
         print(2)
 """
 
+function_with_deeply_nested_functions = """
+def function():
+    def first():
+        def second():
+            print(1)
+        print(2)
+    print(3)
+"""
+
 
 @pytest.mark.parametrize(
     'code',
@@ -75,3 +84,21 @@ def test_expressions_wrong_count(
 
     assert_errors(visitor, [TooManyExpressionsViolation])
     assert_error_text(visitor, '2', option_values.max_expressions)
+
+
+def test_expressions_of_nested_functions(
+    assert_errors,
+    assert_error_text,
+    parse_ast_tree,
+    options,
+    mode,
+):
+    """Testing that expressions of nested functions are counted once."""
+    tree = parse_ast_tree(mode(function_with_deeply_nested_functions))
+
+    option_values = options(max_expressions=2)
+    visitor = FunctionComplexityVisitor(option_values, tree=tree)
+    visitor.run()
+
+    assert_errors(visitor, [TooManyExpressionsViolation])
+    assert_error_text(visitor, '3', option_values.max_expressions)
@@ -43,6 +43,13 @@ def function():
     variable2 = [xml for xml in variable1]
 """
 
+function_with_decorator = """
+@decorator(decorated := 1)
+def function():
+    local_variable1 = 1
+    local_variable2 = 2
+"""
+
 function_with_nested = """
 def function():
     def factory():
@@ -91,6 +98,7 @@ def test():
         function_with_locals_redefinition,
         function_with_locals_and_params,
         function_with_comprehension,
+        function_with_decorator,
         function_with_nested,
         function_with_nested_and_params,
         method_with_locals,
@@ -130,6 +138,7 @@ def test_locals_correct_count(
         function_with_locals_redefinition,
         function_with_locals_and_params,
         function_with_comprehension,
+        function_with_decorator,
         method_with_locals,
         function_nested_class,
     ],
@@ -1,3 +1,5 @@
+import ast
+
 import pytest
 
 from wemake_python_styleguide.compat.constants import PY312, PY314
@@ -20,6 +22,11 @@ line_with_complex_typealias = pytest.param(
         ),
     ],
 )
+lines_with_annotations = """
+x: Dict[str, int] = call(1, 2)
+y: List[int]
+z = y
+"""
 line_with_comprehension = 'x = [f for f in "abc"]'
 line_with_math = 'x = y * 2 + 19 / 9.3'
 line_inside_function = """
@@ -160,26 +167,37 @@ def test_complex_lines(
     )
 
 
-def test_same_complexity(parse_ast_tree, default_options):
-    """Ensures that complexity is counted correctly."""
-    tree_without_types = parse_ast_tree(line_simple)
-    tree_with_types = parse_ast_tree(line_with_types)
+def _reported_complexity(visitor):
+    visitor.run()
+    return {
+        violation.node_items()[0]: violation.message()
+        for violation in visitor.violations
+        if isinstance(violation, LineComplexityViolation)
+    }
+
 
+def _complexity_message(complexity):
+    return f'WPS221 Found line with high Jones Complexity: {complexity} > 0'
+
+
+def test_same_complexity(parse_ast_tree, options):
+    """Ensures that complexity is counted correctly."""
+    option_values = options(max_line_complexity=0)
     simple_visitor = JonesComplexityVisitor(
-        default_options,
-        tree=tree_without_types,
+        option_values,
+        tree=parse_ast_tree(line_simple),
     )
     typed_visitor = JonesComplexityVisitor(
-        default_options,
-        tree=tree_with_types,
+        option_values,
+        tree=parse_ast_tree(line_with_types),
     )
 
-    simple_visitor.run()
-    typed_visitor.run()
-
-    assert len(simple_visitor._lines) == 1  # noqa: SLF001
-    assert len(simple_visitor._lines[1]) == 3  # noqa: SLF001
-    assert len(typed_visitor._lines[1]) == 3  # noqa: SLF001
+    assert _reported_complexity(simple_visitor) == {
+        1: _complexity_message(3),
+    }
+    assert _reported_complexity(typed_visitor) == {
+        1: _complexity_message(3),
+    }
 
 
 @pytest.mark.parametrize(
@@ -192,15 +210,15 @@ def test_same_complexity(parse_ast_tree, default_options):
         _with_values(regression3350_tstring, 10),  # used to be 15
     ],
 )
-def test_exact_complexity(parse_ast_tree, default_options, code, complexity):
+def test_exact_complexity(parse_ast_tree, options, code, complexity):
     """Ensures that complexity is counted correctly."""
     tree = parse_ast_tree(code)
 
-    visitor = JonesComplexityVisitor(default_options, tree=tree)
-    visitor.run()
+    visitor = JonesComplexityVisitor(options(max_line_complexity=0), tree=tree)
 
-    assert len(visitor._lines) == 1  # noqa: SLF001
-    assert len(visitor._lines[1]) == complexity  # noqa: SLF001
+    assert _reported_complexity(visitor) == {
+        1: _complexity_message(complexity),
+    }
 
 
 @pytest.mark.parametrize(
@@ -216,14 +234,31 @@ def test_exact_complexity(parse_ast_tree, default_options, code, complexity):
 )
 def test_that_some_nodes_are_ignored(
     parse_ast_tree,
-    default_options,
+    options,
     code,
     number_of_lines,
 ):
     """Ensures that complexity is counted correctly."""
     tree = parse_ast_tree(code)
 
-    visitor = JonesComplexityVisitor(default_options, tree=tree)
-    visitor.run()
+    visitor = JonesComplexityVisitor(options(max_line_complexity=0), tree=tree)
+
+    assert len(_reported_complexity(visitor)) == number_of_lines
+
+
+@pytest.mark.parametrize('transform', [True, False])
+def test_annotations_are_skipped(parse_ast_tree, options, transform):
+    """Ensures that only annotations are skipped, not the following nodes."""
+    tree = (
+        parse_ast_tree(lines_with_annotations)
+        if transform
+        else ast.parse(lines_with_annotations)
+    )
+
+    visitor = JonesComplexityVisitor(options(max_line_complexity=0), tree=tree)
 
-    assert len(visitor._lines) == number_of_lines  # noqa: SLF001
+    assert _reported_complexity(visitor) == {
+        2: _complexity_message(6),
+        3: _complexity_message(2),
+        4: _complexity_message(3),
+    }
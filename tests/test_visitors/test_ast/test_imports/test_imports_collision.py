@@ -86,6 +86,12 @@ from .. import first
 from first import other
 """
 
+colliding_repeated_imports = """
+import public
+from public import something
+import public
+"""
+
 
 @pytest.mark.parametrize(
     'code',
@@ -146,3 +152,20 @@ def test_imports_collision(
         [ImportCollisionViolation],
         ignored_types=(DottedRawImportViolation, LocalFolderImportViolation),
     )
+
+
+def test_repeated_imports_collision(
+    assert_errors,
+    parse_ast_tree,
+    default_options,
+):
+    """Testing that each import of a parent module is a collision."""
+    tree = parse_ast_tree(colliding_repeated_imports)
+
+    visitor = WrongImportVisitor(default_options, tree=tree)
+    visitor.run()
+
+    assert_errors(
+        visitor,
+        [ImportCollisionViolation, ImportCollisionViolation],
+    )
@@ -1,7 +1,13 @@
+import ast
 from unittest.mock import MagicMock
 
+import pytest
+
 from wemake_python_styleguide import constants
-from wemake_python_styleguide.visitors.base import BaseFilenameVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseFilenameVisitor,
+    BaseNodeVisitor,
+)
 
 
 class _TestingFilenameVisitor(BaseFilenameVisitor):
@@ -19,3 +25,40 @@ def test_base_filename_run_do_not_call_visit(default_options):
     instance.run()
 
     instance.visit_filename.assert_not_called()
+
+
+class _TestingNodeVisitor(BaseNodeVisitor):
+    def visit_Str(self, node: ast.Constant) -> None:  # noqa: N802
+        self.visited.append(node)
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> None:  # noqa: N802
+        self.visited.append(node)
+        self.generic_visit(node)
+
+
+def test_base_node_dispatch_table():
+    """Ensures that dispatch table contains all handlers of a class."""
+    assert _TestingNodeVisitor.dispatch_table == {
+        str: _TestingNodeVisitor.visit_Str,
+        ast.Name: _TestingNodeVisitor.visit_Name,
+    }
+
+
+@pytest.mark.parametrize(
+    ('code', 'visited_count'),
+    [
+        ('x', 1),
+        ('"x"', 1),
+        ('x + "x"', 2),
+        ('x + 1', 1),
+        ('1 + ...', 0),
+    ],
+)
+def test_base_node_routes_visits(default_options, code, visited_count):
+    """Ensures that nodes and constants are routed to the right handlers."""
+    visitor = _TestingNodeVisitor(default_options, tree=ast.parse(code))
+    visitor.visited = []
+    visitor.run()
+
+    assert len(visitor.visited) == visited_count
@@ -1,5 +1,9 @@
+import ast
+from typing import ClassVar
+
 import pytest
 
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 from wemake_python_styleguide.visitors.decorators import alias
 
 
@@ -33,3 +37,49 @@ def test_raises_for_existing_alias():
     """Ensures that decorator raises an exception for existing alias."""
     with pytest.raises(AttributeError):
         alias('existing', ('first', 'second'))(_HasAliasedProp)
+
+
+@alias('first', ('second', 'third'))
+class _AliasedProp:
+    def first(self):
+        """First."""
+
+
+@alias('visit_any_loop', ('visit_For', 'visit_While'))
+class _AliasedVisitor(BaseNodeVisitor):
+    def visit_any_loop(self, node: ast.AST) -> None:
+        """Handles all loops."""
+
+
+class _HookedVisitor(BaseNodeVisitor):
+    subclasses: ClassVar[list[type]] = []
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        _HookedVisitor.subclasses.append(cls)
+
+
+@alias('visit_any_loop', ('visit_For', 'visit_While'))
+class _AliasedHookedVisitor(_HookedVisitor):
+    def visit_any_loop(self, node: ast.AST) -> None:
+        """Handles all loops."""
+
+
+def test_alias_updates_dispatch_table():
+    """Ensures that aliased handlers are added to the dispatch table."""
+    assert _AliasedVisitor.dispatch_table == {
+        ast.For: _AliasedVisitor.visit_any_loop,
+        ast.While: _AliasedVisitor.visit_any_loop,
+    }
+
+
+def test_alias_for_regular_class():
+    """Ensures that decorator works for classes without dispatch tables."""
+    assert _AliasedProp.second is _AliasedProp.first
+    assert _AliasedProp.third is _AliasedProp.first
+
+
+def test_alias_does_not_rerun_class_hooks():
+    """Ensures that class creation hooks are not called again."""
+    assert _HookedVisitor.subclasses == [_AliasedHookedVisitor]
+    assert ast.While in _AliasedHookedVisitor.dispatch_table
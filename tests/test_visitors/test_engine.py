@@ -0,0 +1,219 @@
+import ast
+import inspect
+import tokenize
+from collections.abc import Sequence
+
+import pytest
+
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    BaseTokenVisitor,
+)
+from wemake_python_styleguide.visitors.engine import (
+    FusedEngine,
+    TokenMultiplexer,
+    VisitorTimer,
+)
+
+
+class _RecordingVisitor(BaseNodeVisitor):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.visited: list[str] = []
+
+    def visit_Name(self, node: ast.Name) -> None:  # noqa: N802
+        self.visited.append(node.id)
+        self.generic_visit(node)
+
+    def visit_Num(self, node: ast.Constant) -> None:  # noqa: N802
+        self.visited.append(repr(node.value))
+        self.generic_visit(node)
+
+
+class _PruningVisitor(_RecordingVisitor):
+    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
+        """Does not visit call arguments."""
+
+
+class _ManualVisitor(_RecordingVisitor):
+    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
+        for argument in node.args:
+            self.generic_visit(argument)
+        self.generic_visit(node)
+
+
+class _CatchAllVisitor(BaseNodeVisitor):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.visited: list[str] = []
+
+    def visit(self, node: ast.AST) -> None:
+        self.visited.append(type(node).__name__)
+        self.generic_visit(node)
+
+
+class _BrokenVisitor(_RecordingVisitor):
+    def visit_Num(self, node: ast.Constant) -> None:  # noqa: N802
+        raise ValueError(node.value)
+
+    def _post_visit(self) -> None:  # pragma: no cover
+        pytest.fail('Failed visitor must not be called again')
+
+
+class _BrokenPostVisitor(_RecordingVisitor):
+    def _post_visit(self) -> None:
+        raise ValueError('post')
+
+
+_CODE = 'first(1, second(2)) + third[3]'
+
+
+@pytest.mark.parametrize(
+    'visitor_class',
+    [
+        _RecordingVisitor,
+        _PruningVisitor,
+        _ManualVisitor,
+        _CatchAllVisitor,
+    ],
+)
+def test_fused_engine_order(
+    visitor_class,
+    default_options,
+    parse_ast_tree,
+):
+    """Ensures that fused engine visits nodes in the same order."""
+    tree = parse_ast_tree(_CODE)
+
+    regular = visitor_class(default_options, tree=tree)
+    regular.run()
+    fused = visitor_class(default_options, tree=tree)
+    FusedEngine([fused], on_error=pytest.fail).run(tree)
+
+    assert fused.visited == regular.visited
+    assert inspect.ismethod(fused.generic_visit)
+
+
+def test_fused_engine_errors(
+    default_options,
+    parse_ast_tree,
+):
+    """Ensures that failed visitors do not affect other ones."""
+    tree = parse_ast_tree(_CODE)
+    failed = []
+    visitors = [
+        _BrokenVisitor(default_options, tree=tree),
+        _BrokenPostVisitor(default_options, tree=tree),
+        _RecordingVisitor(default_options, tree=tree),
+    ]
+
+    FusedEngine(visitors, on_error=failed.append).run(tree)
+
+    assert failed == visitors[:2]
+    assert visitors[0].visited == ['first']
+    assert visitors[1].visited == visitors[2].visited
+    assert visitors[2].visited == ['first', '1', 'second', '2', 'third', '3']
+
+
+def test_timed_fused_engine(
+    default_options,
+    parse_ast_tree,
+):
+    """Ensures that timed visitors are still isolated from each other."""
+    tree = parse_ast_tree(_CODE)
+    failed = []
+    timer = VisitorTimer()
+    visitors = [
+        _BrokenVisitor(default_options, tree=tree),
+        _RecordingVisitor(default_options, tree=tree),
+    ]
+
+    FusedEngine(visitors, on_error=failed.append, timer=timer).run(tree)
+
+    assert failed == visitors[:1]
+    assert visitors[1].visited == ['first', '1', 'second', '2', 'third', '3']
+    assert list(timer.seconds) == visitors
+    assert all(seconds > 0 for seconds in timer.seconds.values())
+
+
+class _RecordingTokenVisitor(BaseTokenVisitor):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.visited: list[str] = []
+
+    def visit_name(self, token: tokenize.TokenInfo) -> None:
+        self.visited.append(token.string)
+
+    def visit_number(self, token: tokenize.TokenInfo) -> None:
+        self.visited.append(token.string)
+
+
+class _CatchAllTokenVisitor(_RecordingTokenVisitor):
+    def visit(self, token: tokenize.TokenInfo) -> None:
+        self.visited.append(tokenize.tok_name[token.exact_type])
+
+
+class _StreamTokenVisitor(_RecordingTokenVisitor):
+    def visit_token_stream(
+        self,
+        file_tokens: Sequence[tokenize.TokenInfo],
+    ) -> None:
+        self.visited.append(str(len(file_tokens)))
+
+
+class _BrokenTokenVisitor(_RecordingTokenVisitor):
+    def visit_number(self, token: tokenize.TokenInfo) -> None:
+        raise ValueError(token.string)
+
+    def _post_visit(self) -> None:  # pragma: no cover
+        pytest.fail('Failed visitor must not be called again')
+
+
+@pytest.mark.parametrize(
+    'visitor_class',
+    [
+        _RecordingTokenVisitor,
+        _CatchAllTokenVisitor,
+        _StreamTokenVisitor,
+    ],
+)
+def test_token_multiplexer_order(
+    visitor_class,
+    default_options,
+    parse_tokens,
+):
+    """Ensures that token multiplexer visits tokens in the same order."""
+    file_tokens = parse_tokens(_CODE)
+
+    regular = visitor_class(default_options, file_tokens=file_tokens)
+    regular.run()
+    multiplexed = visitor_class(default_options, file_tokens=file_tokens)
+    TokenMultiplexer([multiplexed], on_error=pytest.fail).run(file_tokens)
+
+    assert multiplexed.visited == regular.visited
+
+
+def test_token_multiplexer_errors(
+    default_options,
+    parse_tokens,
+):
+    """Ensures that failed token visitors do not affect other ones."""
+    file_tokens = parse_tokens(_CODE)
+    failed = []
+    visitors = [
+        _BrokenTokenVisitor(default_options, file_tokens=file_tokens),
+        _RecordingTokenVisitor(default_options, file_tokens=file_tokens),
+    ]
+
+    TokenMultiplexer(visitors, on_error=failed.append).run(file_tokens)
+
+    assert failed == visitors[:1]
+    assert visitors[0].visited == ['first']
+    assert visitors[1].visited == [
+        'first',
+        '1',
+        'second',
+        '2',
+        'third',
+        '3',
+    ]
@@ -0,0 +1,200 @@
+"""
+On-disk cache of checker results.
+
+When ``--wps-cache-dir`` option is passed, :term:`checker` stores
+violations of each module in this directory.
+Unchanged modules are not checked again, their violations are loaded.
+
+Cache key consists of:
+
+- file name and source code of a module
+- options that can change violations
+- selected :term:`visitors <visitor>`
+- version of this package
+
+Entries are written to temporary files first and then are renamed,
+so concurrent ``flake8`` worker processes never see partial entries.
+Corrupt entries are removed and checked again.
+
+Violations are not stored when some visitor has failed,
+so its traceback is shown again on the next run.
+
+Entries are touched on each read.
+So, when the cache is bigger than ``--wps-cache-max-size``,
+least recently used entries are removed before the next run.
+
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import tempfile
+from collections.abc import Generator, Iterable, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, TypeAlias, final
+
+import attr
+
+from wemake_python_styleguide.version import pkg_version
+from wemake_python_styleguide.violations.system import InternalErrorViolation
+
+if TYPE_CHECKING:
+    from wemake_python_styleguide.options.validation import ValidatedOptions
+
+#: Violation without the checker type, as it is stored in the cache.
+CachedResult: TypeAlias = tuple[int, int, str]
+
+#: Options with this prefix do not change violations, only the speed.
+_PERFORMANCE_OPTIONS_PREFIX: Final = 'wps_'
+
+_MEGABYTE: Final = 1024 * 1024
+
+
+@final
+class ResultCache:
+    """Loads and stores violations of modules."""
+
+    def __init__(self, directory: Path, fingerprint: str) -> None:
+        """
+        Creates cache in the given directory.
+
+        Arguments:
+            directory: where entries are stored.
+            fingerprint: hash of everything except modules
+                that changes violations.
+
+        """
+        self.directory = directory
+        self._fingerprint = fingerprint
+
+    @classmethod
+    def start(
+        cls,
+        options: 'ValidatedOptions',
+        visitor_names: Iterable[str],
+    ) -> 'ResultCache':
+        """
+        Creates cache for the current run.
+
+        The main process also evicts old entries, workers just use the cache.
+        """
+        directory = Path(options.wps_cache_dir)
+        if multiprocessing.parent_process() is None:
+            evict(directory, options.wps_cache_max_size * _MEGABYTE)
+
+        fingerprint = hashlib.sha256(pkg_version.encode())
+        fingerprint.update(
+            json.dumps(
+                attr.asdict(
+                    options,
+                    filter=lambda field, _: (
+                        not field.name.startswith(
+                            _PERFORMANCE_OPTIONS_PREFIX,
+                        )
+                    ),
+                ),
+                sort_keys=True,
+            ).encode(),
+        )
+        fingerprint.update('\n'.join(visitor_names).encode())
+        return cls(directory, fingerprint.hexdigest())
+
+    def entry(
+        self,
+        filename: str,
+        lines: Sequence[str],
+        kind: str = 'module',
+    ) -> Path:
+        """Returns path to the entry of the given module or its part."""
+        key = hashlib.sha256(self._fingerprint.encode())
+        key.update(kind.encode())
+        key.update(b'\0')
+        key.update(filename.encode())
+        key.update(b'\0')
+        key.update(''.join(lines).encode())
+        digest = key.hexdigest()
+        return self.directory / digest[:2] / digest
+
+    def load(self, entry: Path) -> list[CachedResult] | None:
+        """Returns cached violations or ``None`` when there are none."""
+        try:
+            raw_results = self._read(entry)
+        except OSError:
+            return None
+        try:
+            return [
+                (line_number, column, message)
+                for line_number, column, message in json.loads(raw_results)
+            ]
+        except (ValueError, TypeError):
+            _remove(entry)  # corrupt entry is a miss, it is written again
+            return None
+
+    def store(self, entry: Path, check_results: Sequence[CachedResult]) -> None:
+        """Atomically writes violations to the cache."""
+        if has_internal_errors(check_results):
+            return  # incomplete results must not be loaded later
+        try:
+            self._write(entry, check_results)
+        except OSError:
+            return  # broken cache must not break the checks
+
+    def _read(self, entry: Path) -> str:
+        raw_results = entry.read_text(encoding='utf8')
+        os.utime(entry)  # marks entry as recently used
+        return raw_results
+
+    def _write(
+        self,
+        entry: Path,
+        check_results: Sequence[CachedResult],
+    ) -> None:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        with _temp_file(entry.parent) as (file_descriptor, temp_path):
+            with os.fdopen(file_descriptor, 'w', encoding='utf8') as temp_file:
+                json.dump(check_results, temp_file)
+            temp_path.replace(entry)
+
+
+def has_internal_errors(check_results: Iterable[CachedResult]) -> bool:
+    """Tells whether some visitor has failed during the check."""
+    internal_error = f'{InternalErrorViolation.full_code} '
+    return any(
+        message.startswith(internal_error) for _, _, message in check_results
+    )
+
+
+@contextmanager
+def _temp_file(directory: Path) -> Generator[tuple[int, Path], None, None]:
+    file_descriptor, temp_name = tempfile.mkstemp(dir=directory)
+    try:
+        yield file_descriptor, Path(temp_name)
+    finally:
+        _remove(Path(temp_name))  # does nothing when it is renamed
+
+
+def _remove(entry: Path) -> None:
+    try:
+        entry.unlink(missing_ok=True)
+    except OSError:
+        return  # broken cache must not break the checks
+
+
+def evict(directory: Path, max_size: int) -> None:
+    """Removes least recently used entries until the cache fits the size."""
+    entries = []
+    for entry in directory.glob('*/*'):
+        try:
+            entry_stat = entry.stat()
+        except OSError:
+            continue  # another process has removed it
+        entries.append((entry_stat.st_mtime, entry_stat.st_size, entry))
+
+    cache_size = sum(entry_size for _, entry_size, _ in entries)
+    for _, entry_size, entry in sorted(entries):
+        if cache_size <= max_size:
+            break
+        entry.unlink(missing_ok=True)
+        cache_size -= entry_size
@@ -29,7 +29,7 @@ Checker API
 
 .. autoclass:: Checker
    :no-undoc-members:
-   :exclude-members: name, version, visitors, _run_checks
+   :exclude-members: name, version, visitors
    :special-members: __init__
 
 """
@@ -40,22 +40,36 @@ import ast
 import tokenize
 import traceback
 from collections.abc import Iterator, Sequence
-from typing import TYPE_CHECKING, ClassVar, TypeAlias, final
+from typing import TYPE_CHECKING, ClassVar, TypeAlias, cast, final
 
 from flake8.options.manager import OptionManager
+from flake8.style_guide import Decision, DecisionEngine
 
 from wemake_python_styleguide import constants, types
 from wemake_python_styleguide import version as pkg_version
+from wemake_python_styleguide.cache import ResultCache
+from wemake_python_styleguide.incremental import ModuleDefinitions
+from wemake_python_styleguide.logic.tokens.index import TokenIndex
 from wemake_python_styleguide.options.config import Configuration
 from wemake_python_styleguide.options.validation import validate_options
+from wemake_python_styleguide.presets.loader import load_visitors
 from wemake_python_styleguide.presets.types import file_tokens as tokens_preset
 from wemake_python_styleguide.presets.types import filename as filename_preset
 from wemake_python_styleguide.presets.types import tree as tree_preset
+from wemake_python_styleguide.profiler import Profiler
 from wemake_python_styleguide.transformations.ast_tree import transform
 from wemake_python_styleguide.violations import system
 from wemake_python_styleguide.visitors import base
+from wemake_python_styleguide.visitors.engine import (
+    FusedEngine,
+    FusedVisitor,
+    TokenMultiplexer,
+    VisitorTimer,
+)
 
 if TYPE_CHECKING:
+    from argparse import Namespace
+
     from wemake_python_styleguide.options.validation import ValidatedOptions
 
 VisitorClass: TypeAlias = type[base.BaseVisitor]
@@ -80,6 +94,12 @@ class Checker:
 
         visitors: :term:`preset` of visitors that are run by this checker.
 
+        profiler: measures visitors, when ``--wps-profile`` is passed:
+        :class:`wemake_python_styleguide.profiler.Profiler`.
+
+        token_index: lookups over ``file_tokens`` shared by all visitors:
+        :class:`wemake_python_styleguide.logic.tokens.index.TokenIndex`.
+
     """
 
     name: ClassVar[str] = pkg_version.pkg_name
@@ -87,18 +107,23 @@ class Checker:
 
     options: ValidatedOptions
     config = Configuration()
+    profiler: ClassVar[Profiler | None] = None
 
-    _visitors: ClassVar[Sequence[VisitorClass]] = (
+    _preset: ClassVar[Sequence[str]] = (
         *filename_preset.PRESET,
         *tree_preset.PRESET,
         *tokens_preset.PRESET,
     )
+    _visitors: ClassVar[Sequence[VisitorClass] | None] = None
+    _selected_visitors: ClassVar[Sequence[VisitorClass]] = ()
+    _cache: ClassVar[ResultCache | None] = None
 
     def __init__(
         self,
         tree: ast.AST,
         file_tokens: Sequence[tokenize.TokenInfo],
         filename: str = constants.STDIN,
+        lines: Sequence[str] = (),
     ) -> None:
         """
         Creates new checker instance.
@@ -114,11 +139,14 @@ class Checker:
             tree: ``ast`` tree parsed by ``flake8``.
             file_tokens: ``tokenize.tokenize`` parsed file tokens.
             filename: module file name, might be empty if piping is used.
+            lines: module source lines, used to find cached violations.
 
         """
-        self.tree = transform(tree)
+        self.tree = tree
         self.filename = filename
         self.file_tokens = file_tokens
+        self.token_index = TokenIndex(file_tokens)
+        self.lines = lines
 
     @classmethod
     def add_options(cls, parser: OptionManager) -> None:
@@ -135,9 +163,38 @@ class Checker:
         cls.config.register_options(parser)
 
     @classmethod
-    def parse_options(cls, options: ValidatedOptions) -> None:
-        """Parses registered options for providing them to each visitor."""
+    def parse_options(cls, options: Namespace) -> None:
+        """
+        Parses registered options for providing them to each visitor.
+
+        We also use ``flake8``'s ``--select`` and ``--ignore`` options
+        to skip visitors that can only emit violations
+        which will be ignored anyway.
+        Visitors are imported here, unless all our violations are ignored.
+
+        Profiling and caching are also started here, when they are enabled.
+        """
+        decision_engine = DecisionEngine(options)
         cls.options = validate_options(options)
+        cls.profiler = Profiler.start() if cls.options.wps_profile else None
+        if cls._visitors is None and _is_plugin_selected(decision_engine):
+            cls._visitors = load_visitors(cls._preset)
+        cls._selected_visitors = tuple(
+            visitor_class
+            for visitor_class in cls._visitors or ()
+            if _is_selected(visitor_class, decision_engine)
+        )
+        cls._cache = (
+            ResultCache.start(
+                cls.options,
+                (
+                    f'{visitor_class.__module__}.{visitor_class.__qualname__}'
+                    for visitor_class in cls._selected_visitors
+                ),
+            )
+            if cls.options.wps_cache_dir
+            else None
+        )
 
     def run(self) -> Iterator[types.CheckResult]:
         """
@@ -150,19 +207,151 @@ class Checker:
             Violations that were found by the passed visitors.
 
         """
-        for visitor_class in self._visitors:
-            visitor = visitor_class.from_checker(self)
-
-            try:
-                visitor.run()
-            except Exception:
-                # In case we fail miserably, we want users to see at
-                # least something! Full stack trace
-                # and some rules that still work.
-                print(traceback.format_exc())  # noqa: WPS421
-                visitor.add_violation(system.InternalErrorViolation())
+        if self._cache is None or not self.lines:
+            yield from self._check()
+            return
+
+        cache_entry = self._cache.entry(self.filename, self.lines)
+        cached_results = self._cache.load(cache_entry)
+        if cached_results is None:
+            definitions = (
+                ModuleDefinitions(
+                    self._cache,
+                    self.filename,
+                    cast(ast.Module, self.tree),
+                    self.lines,
+                )
+                if self.options.wps_incremental
+                else None
+            )
+            cached_results = [
+                check_result[:3] for check_result in self._check(definitions)
+            ]
+            self._cache.store(cache_entry, cached_results)
+        yield from (
+            (*cached_result, type(self)) for cached_result in cached_results
+        )
+
+    def _check(
+        self,
+        definitions: ModuleDefinitions | None = None,
+    ) -> Iterator[types.CheckResult]:
+        self.tree = transform(self.tree)
+        visitors = [
+            visitor_class.from_checker(self)
+            for visitor_class in self._selected_visitors
+        ]
+        if definitions is not None:
+            incremental_visitors = [
+                visitor
+                for visitor in visitors
+                if isinstance(visitor, base.BaseNodeVisitor)
+                and visitor.incremental
+            ]
+            visitors = [
+                visitor
+                for visitor in visitors
+                if visitor not in incremental_visitors
+            ]
+            yield from (
+                (*check_result, type(self))
+                for check_result in definitions.run(
+                    incremental_visitors,
+                    _run_visitor,
+                )
+            )
+        if self.profiler is None:
+            self._run_visitors(visitors)
+        else:
+            self.profiler.profile(
+                self.filename,
+                self.tree,
+                visitors,
+                self._run_visitors,
+            )
 
+        for visitor in visitors:
             yield from (
                 (*error.node_items(), type(self))
                 for error in visitor.violations
             )
+
+    def _run_visitors(
+        self,
+        visitors: Sequence[base.BaseVisitor],
+        timer: VisitorTimer | None = None,
+    ) -> None:
+        finished_visitors = self._run_engines(visitors, timer)
+        for visitor in visitors:
+            if visitor not in finished_visitors:
+                _run_visitor(visitor, timer)
+
+    def _run_engines(
+        self,
+        visitors: Sequence[base.BaseVisitor],
+        timer: VisitorTimer | None,
+    ) -> set[base.BaseVisitor]:
+        token_visitors = [
+            visitor
+            for visitor in visitors
+            if isinstance(visitor, base.BaseTokenVisitor)
+        ]
+        TokenMultiplexer(
+            token_visitors,
+            on_error=_report_internal_error,
+            timer=timer,
+        ).run(self.file_tokens)
+
+        fused_visitors: list[FusedVisitor] = []
+        if self.options.wps_fused_engine:
+            fused_visitors.extend(
+                visitor
+                for visitor in visitors
+                if isinstance(visitor, FusedVisitor)
+            )
+            FusedEngine(
+                fused_visitors,
+                on_error=_report_internal_error,
+                timer=timer,
+            ).run(self.tree)
+        return {*token_visitors, *fused_visitors}
+
+
+def _is_plugin_selected(decision_engine: DecisionEngine) -> bool:
+    return any(
+        decision_engine.decision_for(code) == Decision.Selected
+        for code in map('WPS{0:03}'.format, range(1000))
+    )
+
+
+def _is_selected(
+    visitor_class: VisitorClass,
+    decision_engine: DecisionEngine,
+) -> bool:
+    if not visitor_class.emitted_violations:
+        return True  # we don't know what this visitor does, so we run it
+    return any(
+        decision_engine.decision_for(violation.full_code) == Decision.Selected
+        for violation in visitor_class.emitted_violations
+    )
+
+
+def _run_visitor(
+    visitor: base.BaseVisitor,
+    timer: VisitorTimer | None = None,
+) -> None:
+    try:
+        if timer is None:
+            visitor.run()
+        else:
+            timer.call(visitor, visitor.run)
+    except Exception:
+        _report_internal_error(visitor)
+
+
+def _report_internal_error(visitor: base.BaseVisitor) -> None:
+    # In case we fail miserably, we want users to see at
+    # least something! Full stack trace
+    # and some rules that still work.
+    print(traceback.format_exc())  # noqa: WPS421
+    visitor.add_violation(system.InternalErrorViolation())
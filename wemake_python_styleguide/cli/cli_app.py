@@ -1,6 +1,11 @@
 import argparse
 
 from wemake_python_styleguide.cli.commands.explain.command import ExplainCommand
+from wemake_python_styleguide.cli.commands.serve.command import (
+    ClientCommand,
+    ServeCommand,
+)
+from wemake_python_styleguide.cli.commands.serve.server import DEFAULT_SOCKET
 
 
 def _configure_arg_parser() -> argparse.ArgumentParser:
@@ -24,9 +29,54 @@ def _configure_arg_parser() -> argparse.ArgumentParser:
     )
     parser_explain.set_defaults(func=ExplainCommand())
 
+    _configure_serve_parsers(sub_parsers)
+
     return parser
 
 
+def _configure_serve_parsers(
+    sub_parsers: 'argparse._SubParsersAction[argparse.ArgumentParser]',
+) -> None:
+    """Configures server and client subcommands."""
+    parser_serve = sub_parsers.add_parser(
+        'serve',
+        help='Start a server that checks files without startup costs',
+    )
+    parser_serve.add_argument(
+        '--socket',
+        default=DEFAULT_SOCKET,
+        dest='socket_path',
+        help='Path to the unix socket to listen on',
+    )
+    parser_serve.add_argument(
+        'flake8_args',
+        nargs='*',
+        help='Options for flake8, configuration files are also used',
+    )
+    parser_serve.set_defaults(func=ServeCommand())
+
+    parser_client = sub_parsers.add_parser(
+        'client',
+        help='Check a file with the running server',
+    )
+    parser_client.add_argument(
+        'filename',
+        help='File to check',
+    )
+    parser_client.add_argument(
+        '--socket',
+        default=DEFAULT_SOCKET,
+        dest='socket_path',
+        help='Path to the unix socket of the server',
+    )
+    parser_client.add_argument(
+        '--stdin',
+        action='store_true',
+        help='Check source from stdin instead of the file contents',
+    )
+    parser_client.set_defaults(func=ClientCommand())
+
+
 def parse_args() -> argparse.Namespace:
     """Parse CLI arguments."""
     parser = _configure_arg_parser()
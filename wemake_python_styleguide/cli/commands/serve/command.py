@@ -0,0 +1,97 @@
+import sys
+from pathlib import Path
+from typing import final
+
+from attrs import frozen
+
+from wemake_python_styleguide.cli.commands.base import AbstractCommand
+from wemake_python_styleguide.cli.commands.serve.server import (
+    LintServer,
+    send_request,
+)
+from wemake_python_styleguide.cli.output import print_stderr, print_stdout
+
+
+@final
+@frozen
+class ServeCommandArgs:
+    """Arguments for wps serve command."""
+
+    socket_path: str
+    flake8_args: list[str]
+
+
+@final
+class ServeCommand(AbstractCommand[ServeCommandArgs]):
+    """Serve command impl."""
+
+    _args_type = ServeCommandArgs
+
+    def _run(self, args: ServeCommandArgs) -> int:
+        """Run command."""
+        # `flake8` is slow to import, the client must start fast without it:
+        from wemake_python_styleguide.cli.commands.serve.linter import (  # noqa: PLC0415, WPS433
+            Linter,
+        )
+
+        linter = Linter(args.flake8_args)
+        try:
+            server = LintServer(args.socket_path, linter)
+        except OSError as exc:
+            print_stderr(f'Cannot listen on {args.socket_path}: {exc}')
+            return 1
+
+        print_stderr(f'Listening on {args.socket_path}')
+        with server:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                print_stderr('Stopped')
+            finally:
+                Path(args.socket_path).unlink(missing_ok=True)
+        return 0
+
+
+@final
+@frozen
+class ClientCommandArgs:
+    """Arguments for wps client command."""
+
+    filename: str
+    socket_path: str
+    stdin: bool
+
+
+@final
+class ClientCommand(AbstractCommand[ClientCommandArgs]):
+    """Client command impl."""
+
+    _args_type = ClientCommandArgs
+
+    def _run(self, args: ClientCommandArgs) -> int:
+        """Run command."""
+        request = {'filename': str(Path(args.filename).absolute())}
+        if args.stdin:
+            request['source'] = sys.stdin.read()
+
+        try:
+            response = send_request(args.socket_path, request)
+        except OSError as exc:
+            print_stderr(
+                f'Cannot connect to {args.socket_path}: {exc}',
+                '(is `wps serve` running?)',
+            )
+            return 1
+
+        error = response.get('error')
+        if error is not None:
+            print_stderr(error)
+            return 1
+        for violation in response['violations']:
+            print_stdout(
+                '{filename}:{line}:{column}: {code} {text}'.format(
+                    filename=args.filename,
+                    **violation,
+                ),
+            )
+        return int(bool(response['violations']))
@@ -0,0 +1,122 @@
+"""Runs ``flake8`` checks in the current process."""
+
+import operator
+from collections.abc import Sequence
+from typing import TypeAlias, final
+
+from flake8.checker import FileChecker, Results
+from flake8.formatting.base import BaseFormatter
+from flake8.options.parse_args import parse_args
+from flake8.processor import FileProcessor
+from flake8.style_guide import StyleGuideManager
+from flake8.violation import Violation
+
+from wemake_python_styleguide.checker import Checker
+
+#: Violation as it is sent to clients.
+LintResult: TypeAlias = dict[str, str | int]
+
+
+@final
+class _CollectingFormatter(BaseFormatter):
+    """Collects reported violations instead of printing them."""
+
+    def after_init(self) -> None:
+        """Creates an empty list of violations."""
+        self.violations: list[Violation] = []
+
+    def handle(self, error: Violation) -> None:  # noqa: WPS110
+        """Stores reported violation."""
+        self.violations.append(error)
+
+    def format(self, error: Violation) -> str | None:  # noqa: WPS125
+        """Violations are never formatted."""
+
+
+def _make_file_checker(
+    filename: str,
+    lines: list[str] | None,
+    linter: 'Linter',
+) -> FileChecker:
+    """Creates a file checker, which checks passed lines when there are any."""
+    file_checker = FileChecker(
+        filename=filename,
+        plugins=linter.plugins.checkers,
+        options=linter.options,
+    )
+    if lines is not None:
+        # The file might be missing, so reading errors are not reported:
+        file_checker.results.clear()
+        file_checker.processor = FileProcessor(
+            filename,
+            linter.options,
+            lines=lines,
+        )
+        file_checker.should_process = (
+            not file_checker.processor.should_ignore_file()
+        )
+    return file_checker
+
+
+@final
+class Linter:
+    """
+    Keeps parsed ``flake8`` options and loaded plugins.
+
+    Configuration files are only read once,
+    so each file is checked without the ``flake8`` startup cost.
+    """
+
+    def __init__(self, argv: Sequence[str]) -> None:
+        """Parses ``flake8`` options and loads plugins."""
+        plugins, options = parse_args(argv)
+        self.plugins = plugins
+        self.options = options
+        self._formatter = _CollectingFormatter(self.options)
+        self._style_guide = StyleGuideManager(self.options, self._formatter)
+
+    def lint(
+        self,
+        filename: str,
+        source: str | None = None,
+    ) -> list[LintResult]:
+        """
+        Checks a single file.
+
+        When ``source`` is passed, it is checked instead of the file contents.
+        ``noqa`` comments, ``--select``, ``--ignore``,
+        and ``--per-file-ignores`` options are respected,
+        but ``--exclude`` is not: passed files are always checked.
+        With ``--wps-profile`` the profile of this check is printed.
+        """
+        lines = None if source is None else source.splitlines(keepends=True)
+        file_checker = _make_file_checker(filename, lines, self)
+        _, check_results, _ = file_checker.run_checks()
+        if Checker.profiler is not None:
+            Checker.profiler.report()  # each request is a separate run
+
+        self._formatter.violations.clear()
+        self._handle_results(filename, check_results)
+        return [
+            {
+                'code': violation.code,
+                'line': violation.line_number,
+                'column': violation.column_number,
+                'text': violation.text,
+            }
+            for violation in self._formatter.violations
+        ]
+
+    def _handle_results(self, filename: str, check_results: Results) -> None:
+        for error_code, line_number, column, text, physical_line in sorted(
+            check_results,
+            key=operator.itemgetter(1, 2),
+        ):
+            self._style_guide.handle_error(
+                code=error_code,
+                filename=filename,
+                line_number=line_number,
+                column_number=column,
+                text=text,
+                physical_line=physical_line,
+            )
@@ -0,0 +1,106 @@
+"""
+Local server that keeps ``flake8`` warm between checks.
+
+Each connection carries a single request and a single response,
+both are JSON objects on a single line.
+
+Request:
+
+- ``filename``: path to the checked file
+- ``source``: optional source code to check instead of the file contents
+
+Response is either ``{"violations": [...]}``
+with ``code``, ``line``, ``column``, and ``text`` of each violation,
+or ``{"error": "..."}`` when the request cannot be processed.
+
+Only the owner can connect to the socket.
+Socket of a server that was killed is removed on the next start,
+sockets of running servers and other files are never removed.
+"""
+
+import json
+import os
+import socket
+import socketserver
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, final
+
+if TYPE_CHECKING:
+    from wemake_python_styleguide.cli.commands.serve.linter import Linter
+
+#: Default path to the server socket, relative to the current directory.
+DEFAULT_SOCKET: Final = '.wps.sock'
+
+#: Seconds to wait for a client, so it cannot block other clients forever.
+REQUEST_TIMEOUT: Final = 10
+
+#: Socket is created with ``0o600`` permissions.
+_OWNER_ONLY_UMASK: Final = 0o177
+
+
+@final
+class LintServer(socketserver.UnixStreamServer):
+    """Handles lint requests one by one, plugins are not thread safe."""
+
+    def __init__(self, socket_path: str, linter: 'Linter') -> None:
+        """Binds the server to the given socket."""
+        _remove_stale_socket(socket_path)
+        with _owner_only_files():
+            super().__init__(socket_path, _LintRequestHandler)
+        self.linter = linter
+
+
+@final
+class _LintRequestHandler(socketserver.StreamRequestHandler):
+    server: LintServer
+    timeout = REQUEST_TIMEOUT
+
+    def handle(self) -> None:  # noqa: WPS110
+        try:
+            response = self._lint(self.rfile.readline())
+        except Exception as exc:  # the server must answer every request
+            response = {'error': f'{type(exc).__name__}: {exc}'}
+        if response is not None:
+            self.wfile.write(f'{json.dumps(response)}\n'.encode())
+
+    def _lint(self, request_line: bytes) -> dict[str, Any] | None:
+        if not request_line:
+            return None  # the client has closed the connection
+        request = json.loads(request_line)
+        return {
+            'violations': self.server.linter.lint(
+                request['filename'],
+                request.get('source'),
+            ),
+        }
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    if not Path(socket_path).is_socket():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path)
+        except ConnectionRefusedError:
+            # Nothing listens on it, the server was killed:
+            Path(socket_path).unlink(missing_ok=True)
+
+
+@contextmanager
+def _owner_only_files() -> Generator[None, None, None]:
+    umask = os.umask(_OWNER_ONLY_UMASK)
+    try:
+        yield
+    finally:
+        os.umask(umask)
+
+
+def send_request(socket_path: str, request: dict[str, Any]) -> dict[str, Any]:
+    """Sends a single request to the running server."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        connection.sendall(f'{json.dumps(request)}\n'.encode())
+        with connection.makefile('rb') as response_file:
+            return json.loads(response_file.readline())  # type: ignore[no-any-return]
@@ -1,10 +1,14 @@
 import ast
-from typing import Final
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any, Final, TypeAlias
 
 from wemake_python_styleguide.compat.constants import make_immutable
 
+#: Maps dispatch keys to visitor's methods that handle them.
+DispatchTable: TypeAlias = Mapping[type, Callable[[Any, ast.AST], Any]]
+
 #: That's how python types and ast types map to each other, copied from ast.
-_CONST_NODE_TYPE_NAMES: Final = make_immutable(
+_CONST_NODE_TYPE_NAMES: Final[Mapping[type, str]] = make_immutable(
     {
         bool: 'NameConstant',  # should be before int
         type(None): 'NameConstant',
@@ -18,21 +22,68 @@ _CONST_NODE_TYPE_NAMES: Final = make_immutable(
 )
 
 
-def route_visit(self: ast.NodeVisitor, node: ast.AST) -> None:
+def dispatch_key(node: ast.AST) -> type:
+    """
+    Returns the type that is used to find a handler for the node.
+
+    It is a node type for all nodes, except ``ast.Constant``.
+    For constants we use the type of the wrapped value.
+    """
+    if isinstance(node, ast.Constant):
+        return type(node.value)
+    return type(node)
+
+
+def handler_name(key: type) -> str:
+    """Returns the name of visitor's method to handle the given dispatch key."""
+    # That's the hack itself, we don't get the name of the constant node.
+    # We get the name of wrapped type from it.
+    type_name = _CONST_NODE_TYPE_NAMES.get(key, key.__name__)
+    return f'visit_{type_name}'
+
+
+def build_dispatch_table(visitor_class: type) -> DispatchTable:
+    """
+    Creates a dispatch table for a visitor class.
+
+    It contains all ``visit_`` methods that the class has,
+    including the ones created with aliases.
+    """
+    dispatch_table: dict[type, Callable[[Any, ast.AST], Any]] = {}
+    for key in _DISPATCH_KEYS:
+        visit_method = getattr(visitor_class, handler_name(key), None)
+        if visit_method is not None:
+            dispatch_table[key] = visit_method
+    return dispatch_table
+
+
+def route_visit(
+    self: ast.NodeVisitor,
+    node: ast.AST,
+    dispatch_table: DispatchTable,
+) -> None:
     """
     Custom router for python3.8+ release.
 
     Hacked to make sure that everything we had defined before is working.
+    Uses precomputed dispatch table to find a handler for the node.
     """
-    if isinstance(node, ast.Constant):
-        # That's the hack itself, we don't get the name of the node.
-        # We get the name of wrapped type from it.
-        type_name = _CONST_NODE_TYPE_NAMES.get(type(node.value))
+    visit_method = dispatch_table.get(dispatch_key(node))
+    if visit_method is None:
+        self.generic_visit(node)
     else:
-        type_name = node.__class__.__name__
+        visit_method(self, node)
 
-    return getattr(  # type: ignore[no-any-return]
-        self,
-        f'visit_{type_name}',
-        self.generic_visit,
-    )(node)
+
+def _node_types(base_type: type[ast.AST]) -> Iterator[type[ast.AST]]:
+    for node_type in base_type.__subclasses__():
+        if node_type is not ast.Constant:  # we route constants by values
+            yield node_type
+            yield from _node_types(node_type)
+
+
+#: All keys that can be returned by ``dispatch_key``.
+_DISPATCH_KEYS: Final[tuple[type, ...]] = (
+    *_node_types(ast.AST),
+    *_CONST_NODE_TYPE_NAMES,
+)
@@ -0,0 +1,163 @@
+"""
+Incremental checks of top-level definitions.
+
+Editing a single function changes the whole module,
+so violations of this module cannot be loaded from ``--wps-cache-dir``.
+With ``--wps-incremental`` option violations are also cached
+for each top-level function and class.
+
+Only :term:`visitors <visitor>` with ``incremental = True`` are incremental:
+violations they find inside a top-level definition
+depend only on this definition.
+These visitors skip unchanged definitions,
+their violations are loaded from the cache instead.
+
+All other visitors check the whole module as usual.
+For example, ones that find module-level aggregate violations
+from :mod:`wemake_python_styleguide.violations.complexity`:
+
+- ``JonesScoreViolation``
+- ``TooManyModuleMembersViolation``
+- ``CognitiveModuleComplexityViolation``
+
+"""
+
+import ast
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import final
+
+from attrs import frozen
+
+from wemake_python_styleguide.cache import (
+    CachedResult,
+    ResultCache,
+    has_internal_errors,
+)
+from wemake_python_styleguide.visitors import base
+
+#: Top-level statements that are cached separately.
+_DEFINITIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+@final
+@frozen
+class _Definition:
+    node: ast.stmt
+    start: int
+    end: int
+    entry: Path
+
+
+@final
+class ModuleDefinitions:
+    """Splits a module into changed and unchanged top-level definitions."""
+
+    def __init__(
+        self,
+        result_cache: ResultCache,
+        filename: str,
+        tree: ast.Module,
+        lines: Sequence[str],
+    ) -> None:
+        """Loads cached violations of unchanged definitions."""
+        self._result_cache = result_cache
+        self._changed: list[_Definition] = []
+        self._cached_results: list[CachedResult] = []
+
+        unchanged: set[ast.stmt] = set()
+        for definition in _top_level_definitions(
+            result_cache,
+            filename,
+            tree,
+            lines,
+        ):
+            cached_results = result_cache.load(definition.entry)
+            if cached_results is None:
+                self._changed.append(definition)
+                continue
+            unchanged.add(definition.node)
+            self._cached_results.extend(
+                _shift(cached_results, definition.start),
+            )
+        self._tree = ast.Module(
+            body=[node for node in tree.body if node not in unchanged],
+            type_ignores=[],
+        )
+
+    def run(
+        self,
+        visitors: Sequence[base.BaseNodeVisitor],
+        run_visitor: Callable[[base.BaseVisitor], None],
+    ) -> list[CachedResult]:
+        """Runs visitors on changed parts of the module, caches violations."""
+        check_results: list[CachedResult] = []
+        for visitor in visitors:
+            visitor.tree = self._tree
+            run_visitor(visitor)
+            check_results.extend(
+                violation.node_items() for violation in visitor.violations
+            )
+        if has_internal_errors(check_results):
+            # Failed visitors might miss violations of changed definitions:
+            return [*self._cached_results, *check_results]
+
+        for definition in self._changed:
+            self._result_cache.store(
+                definition.entry,
+                _shift(
+                    [
+                        check_result
+                        for check_result in check_results
+                        if definition.start <= check_result[0] <= definition.end
+                    ],
+                    -definition.start,
+                ),
+            )
+        return [*self._cached_results, *check_results]
+
+
+def _top_level_definitions(
+    result_cache: ResultCache,
+    filename: str,
+    tree: ast.Module,
+    lines: Sequence[str],
+) -> list[_Definition]:
+    previous_end = 0
+    definitions = []
+    for node in tree.body:
+        start = min((
+            node.lineno,
+            *(
+                decorator.lineno
+                for decorator in getattr(node, 'decorator_list', [])
+            ),
+        ))
+        end = node.end_lineno or node.lineno
+        if start <= previous_end:
+            return []  # statements share lines, we cannot split them
+        previous_end = end
+        if isinstance(node, _DEFINITIONS):
+            definitions.append(
+                _Definition(
+                    node=node,
+                    start=start,
+                    end=end,
+                    entry=result_cache.entry(
+                        filename,
+                        lines[start - 1 : end],
+                        kind='definition',
+                    ),
+                ),
+            )
+    return definitions
+
+
+def _shift(
+    check_results: Sequence[CachedResult],
+    offset: int,
+) -> list[CachedResult]:
+    return [
+        (line_number + offset, column, message)
+        for line_number, column, message in check_results
+    ]
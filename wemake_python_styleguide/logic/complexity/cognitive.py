@@ -12,13 +12,19 @@ Basic criteria. We boiled that guiding principle down into three simple rules:
 - Ignore "shorthand" structures that readably condense
   multiple lines of code into one
 
+Scores of all nested functions are counted in a single pass
+with an explicit stack, so deeply nested code does not hit the recursion limit.
+
 Adapted from https://github.com/Melevir/cognitive_complexity
 """
 
 import ast
-from collections.abc import Callable
+from typing import TypeAlias, final
+
+import attr
 
-from wemake_python_styleguide.logic.tree import bools, recursion
+from wemake_python_styleguide.compat.aliases import FunctionNodes
+from wemake_python_styleguide.logic.tree import recursion
 from wemake_python_styleguide.types import AnyFunctionDef, AnyNodes
 
 #: Control flow nodes that increment and can be nested.
@@ -46,76 +52,165 @@ _INCREMENTERS: AnyNodes = (
 )
 
 
-def _process_child_nodes(
-    node: ast.AST,
-    increment_by: int,
-    complexity_calculator: Callable[[ast.AST, int], int],
-) -> int:
-    child_complexity = 0
-
-    for node_num, child_node in enumerate(ast.iter_child_nodes(node)):
-        if isinstance(node, ast.Try):
-            if node_num == 1:
-                increment_by += 1  # add +1 for all try nodes except body
-            if node_num:
-                child_complexity += max(1, increment_by)
-        child_complexity += complexity_calculator(
-            child_node,
-            increment_by,
+@final
+@attr.dataclass(slots=True)
+class _FunctionScore:
+    """
+    Increments of a single function body.
+
+    Each increment is multiplied by its nesting,
+    but increments without nesting are counted as ``1``.
+    So, the body can be scored as nested into its parent function
+    by shifting the nesting, without walking it again.
+    """
+
+    function: AnyFunctionDef
+    offset: int = 0  # nesting of the function body in its parent
+    increments: int = 0
+    nested: int = 0
+    unnested: int = 0
+
+    def add(self, increments: int, nesting: int) -> None:
+        """Adds increments of a node with the given nesting."""
+        self.increments += increments
+        self.nested += increments * nesting
+        if not nesting:
+            self.unnested += increments
+
+    def merge(self, nested_function: '_FunctionScore') -> None:
+        """Adds increments of the nested function to this one."""
+        self.increments += nested_function.increments
+        self.nested += (
+            nested_function.offset * nested_function.increments
+            + nested_function.nested
         )
 
-    return child_complexity
 
+_StackItem: TypeAlias = tuple[ast.AST, int, _FunctionScore] | _FunctionScore
+
+
+@final
+class _CognitiveComplexityCounter:
+    """
+    Counts complexity of a function and all its nested functions.
+
+    Nodes are visited with an explicit stack.
+    Function scores are pushed to the stack before their nodes,
+    so they are left after all their nodes, like in post-order.
+    Then they are added to the enclosing function scores.
+    """
 
-def _process_node_itself(
-    node: ast.AST,
-    increment_by: int,
-) -> tuple[int, int, bool]:
+    def __init__(self, funcdef: AnyFunctionDef) -> None:
+        self.scores: dict[AnyFunctionDef, int] = {}
+        self._recursion = recursion.RecursiveCallsFinder()
+        # Signature of the given function is not a part of any body:
+        outer_score = _FunctionScore(funcdef)
+        self._functions = [outer_score]
+        self._stack: list[_StackItem] = [(funcdef, 0, outer_score)]
+
+    def count(self) -> None:
+        """Counts scores of all functions."""
+        while self._stack:
+            stack_item = self._stack.pop()
+            if isinstance(stack_item, _FunctionScore):
+                self._leave_function(stack_item)
+            else:
+                self._visit(*stack_item)
+
+    def _visit(
+        self,
+        node: ast.AST,
+        nesting: int,
+        score: _FunctionScore,
+    ) -> None:
+        if isinstance(node, ast.Call):
+            self._recursion.check_call(node)
+
+        if isinstance(node, FunctionNodes):
+            self._enter_function(node, nesting, score)
+        elif isinstance(node, ast.BoolOp):
+            self._count_boolops(node, nesting, score)
+        else:
+            nesting, increments = _process_node_itself(node, nesting)
+            score.add(increments, nesting)
+            self._push_children(node, nesting, score)
+
+    def _enter_function(
+        self,
+        node: AnyFunctionDef,
+        nesting: int,
+        score: _FunctionScore,
+    ) -> None:
+        function_score = _FunctionScore(node, offset=nesting + 1)
+        self.scores[node] = 0  # keeps functions in the document order
+        self._recursion.enter_function(node)
+        self._functions.append(function_score)
+        self._stack.append(function_score)
+        self._push_children(node, nesting + 1, score, function_score)
+
+    def _leave_function(self, score: _FunctionScore) -> None:
+        has_recursion = self._recursion.leave_function(score.function)
+        self.scores[score.function] = (
+            score.nested + score.unnested + int(has_recursion)
+        )
+        self._functions.pop()
+        self._functions[-1].merge(score)
+
+    def _push_children(
+        self,
+        node: ast.AST,
+        nesting: int,
+        score: _FunctionScore,
+        body_score: _FunctionScore | None = None,
+    ) -> None:
+        children: list[_StackItem] = []
+        for node_num, child_node in enumerate(ast.iter_child_nodes(node)):
+            if body_score and isinstance(child_node, ast.stmt):
+                children.append((child_node, 0, body_score))
+            elif isinstance(node, ast.Try) and node_num:
+                # add +1 for all try nodes except body
+                score.add(1, nesting + 1)
+                children.append((child_node, nesting + 1, score))
+            else:
+                children.append((child_node, nesting, score))
+        self._stack.extend(reversed(children))
+
+    def _count_boolops(
+        self,
+        node: ast.BoolOp,
+        nesting: int,
+        score: _FunctionScore,
+    ) -> None:
+        inner_boolops_amount = 0
+        for subnode in ast.walk(node):
+            if isinstance(subnode, ast.BoolOp):
+                inner_boolops_amount += 1
+            elif isinstance(subnode, ast.Call):
+                self._recursion.check_call(subnode)
+        score.add(inner_boolops_amount, nesting)
+
+
+def _process_node_itself(node: ast.AST, nesting: int) -> tuple[int, int]:
     if isinstance(node, _SHORT_CIRCUITS):
-        return increment_by, max(1, increment_by), True
+        return nesting, 1
     if isinstance(node, _CONTROL_FLOW_BREAKERS):
-        increment_by += 1
-        return increment_by, max(1, increment_by), True
+        return nesting + 1, 1
     if isinstance(node, _INCREMENTERS):
-        increment_by += 1
-        return increment_by, 0, True
-    if isinstance(node, ast.BoolOp):
-        inner_boolops_amount = bools.count_boolops(node)
-        base_complexity = inner_boolops_amount * max(increment_by, 1)
-        return increment_by, base_complexity, False
-    return increment_by, 0, True
-
-
-def _get_cognitive_complexity_for_node(
-    node: ast.AST,
-    increment_by: int = 0,
-) -> int:
-    increment_by, base_complexity, should_iter_children = _process_node_itself(
-        node,
-        increment_by,
-    )
-
-    child_complexity = 0
-    if should_iter_children:
-        child_complexity += _process_child_nodes(
-            node,
-            increment_by,
-            _get_cognitive_complexity_for_node,
-        )
-
-    return base_complexity + child_complexity
+        return nesting + 1, 0
+    return nesting, 0
 
 
-def cognitive_score(funcdef: AnyFunctionDef) -> int:
+def cognitive_scores(funcdef: AnyFunctionDef) -> dict[AnyFunctionDef, int]:
     """
-    A thin wrapper around 3rd party dependency.
+    Returns complexity of a function and all its nested functions.
 
-    We only need to be sure that our visitors API does not directly
-    related to some 3rd party code.
+    Functions are returned in the document order.
     """
-    complexity = sum(
-        _get_cognitive_complexity_for_node(node) for node in funcdef.body
-    )
-    if recursion.has_recursive_calls(funcdef):
-        complexity += 1
-    return complexity
+    counter = _CognitiveComplexityCounter(funcdef)
+    counter.count()
+    return counter.scores
+
+
+def cognitive_score(funcdef: AnyFunctionDef) -> int:
+    """Returns complexity of a single function."""
+    return cognitive_scores(funcdef)[funcdef]
@@ -1,10 +1,9 @@
 import ast
 
-from wemake_python_styleguide.compat.aliases import FunctionNodes
 from wemake_python_styleguide.constants import (
     SPECIAL_ARGUMENT_NAMES_WHITELIST,
 )
-from wemake_python_styleguide.logic import nodes, walk
+from wemake_python_styleguide.logic import nodes
 from wemake_python_styleguide.logic.arguments import call_args
 
 
@@ -38,13 +37,7 @@ def is_decorator(node: ast.AST) -> bool:
     We use this predicates because decorators can be used multiple times.
     Like ``@auth_required(login_url=LOGIN_URL)`` and similar.
     """
-    parent = walk.get_closest_parent(node, FunctionNodes)
-    if isinstance(parent, FunctionNodes) and parent.decorator_list:
-        return any(
-            node == decorator or walk.is_contained_by(node, decorator)
-            for decorator in parent.decorator_list
-        )
-    return False
+    return nodes.has_flag(node, nodes.IN_DECORATOR)
 
 
 def is_self(node: ast.AST) -> bool:
@@ -1,7 +1,33 @@
 import ast
+from collections.abc import Mapping
+from typing import Final
 
+from wemake_python_styleguide.compat.constants import make_immutable
 from wemake_python_styleguide.types import ContextNodes
 
+#: Node is an annotation or a part of it.
+IN_ANNOTATION: Final = 1
+
+#: Node is a function decorator or a part of it.
+IN_DECORATOR: Final = 2
+
+#: Node is inside an f-string or a t-string.
+IN_FORMATTED_STRING: Final = 4
+
+#: Node is inside an ``assert`` statement.
+IN_ASSERT: Final = 8
+
+#: Subtree masks have bits for these node types.
+SUBTREE_BITS: Final[Mapping[type, int]] = make_immutable({
+    ast.Yield: 1,
+    ast.YieldFrom: 2,
+    ast.USub: 4,
+})
+
+#: Euler tour of a node is packed as ``entry * TOUR_BASE + exit``,
+#: modules never have that many steps.
+TOUR_BASE: Final = 1024**3
+
 
 def is_literal(node: ast.AST) -> bool:
     """
@@ -25,3 +51,41 @@ def get_parent(node: ast.AST) -> ast.AST | None:
 def get_context(node: ast.AST) -> ContextNodes | None:
     """Returns the context or ``None`` if node has no context."""
     return getattr(node, 'wps_context', None)
+
+
+def get_flags(node: ast.AST) -> int:
+    """Returns ancestor flags or ``0`` if node has no flags."""
+    return getattr(node, 'wps_flags', 0)
+
+
+def has_flag(node: ast.AST, flag: int) -> bool:
+    """
+    Tells whether node has the given ancestor flag.
+
+    Flags are set once by the transformation,
+    so we don't have to walk up the parents for each check.
+    """
+    return bool(get_flags(node) & flag)
+
+
+def get_tour(node: ast.AST) -> tuple[int, int]:
+    """
+    Returns Euler tour entry and exit or ``-1`` if node was not visited.
+
+    Both steps are packed into a single prop:
+    each extra prop makes ``__dict__`` of many nodes grow twice.
+    """
+    tour: int | None = getattr(node, 'wps_tour', None)
+    if tour is None:
+        return -1, -1
+    return divmod(tour, TOUR_BASE)
+
+
+def get_subtree_mask(node: ast.AST) -> int:
+    """
+    Returns bits of node types found inside the node.
+
+    Only types from ``SUBTREE_BITS`` are tracked,
+    the node itself is not included.
+    """
+    return getattr(node, 'wps_subtree', 0)
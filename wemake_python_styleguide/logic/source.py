@@ -1,11 +1,56 @@
 import ast
+from typing import Final, final
 
 from wemake_python_styleguide.types import AnyTextPrimitive
 
+#: How many rendered nodes are kept at once.
+MAX_RENDERED_NODES: Final = 10_000
+
+
+@final
+class RenderedNodes:
+    """
+    Bounded memo of already rendered nodes.
+
+    ``ast.unparse`` is slow, while the same nodes are rendered
+    by many visitors. So, each node is unparsed once per tree.
+
+    The memo is cleared by ``transform`` for each new tree,
+    and when it is full.
+    Counters are never reset, they are used for profiling.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Creates an empty memo."""
+        self.max_size = max_size
+        self.calls = 0
+        self.unparsed = 0
+        self._sources: dict[ast.AST, str] = {}
+
+    def render(self, node: ast.AST) -> str:
+        """Returns the memoized source code of a node."""
+        self.calls += 1
+        node_source = self._sources.get(node)
+        if node_source is None:
+            if len(self._sources) >= self.max_size:
+                self.clear()
+            node_source = ast.unparse(node).strip()
+            self._sources[node] = node_source
+            self.unparsed += 1
+        return node_source
+
+    def clear(self) -> None:
+        """Removes all rendered nodes."""
+        self._sources.clear()
+
+
+#: Rendered nodes of the current tree.
+rendered_nodes: Final = RenderedNodes(MAX_RENDERED_NODES)
+
 
 def node_to_string(node: ast.AST) -> str:
     """Returns the source code by doing ``ast`` to string convert."""
-    return ast.unparse(node).strip()
+    return rendered_nodes.render(node)
 
 
 def render_string(text_data: AnyTextPrimitive) -> str:
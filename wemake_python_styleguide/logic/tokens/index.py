@@ -0,0 +1,103 @@
+import ast
+import bisect
+import tokenize
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from functools import cached_property
+from operator import attrgetter
+from typing import TypeAlias, final
+
+from attrs import frozen
+
+from wemake_python_styleguide.compat.constants import make_immutable
+
+#: Line and column of a token or a node.
+Position: TypeAlias = tuple[int, int]
+
+
+@final
+@frozen
+class TokenLine:
+    """
+    Tokens that start on a single line, sorted by their start positions.
+
+    Attributes:
+        tokens: tokens of this line.
+        previous_token: last token of the previous line with tokens.
+        next_token: first token of the next line with tokens.
+
+    """
+
+    tokens: Sequence[tokenize.TokenInfo]
+    previous_token: tokenize.TokenInfo | None
+    next_token: tokenize.TokenInfo | None
+
+
+@final
+class TokenIndex:
+    """
+    Lookups over tokens of a single module.
+
+    The checker creates a single index for each module,
+    so all visitors share it.
+    Each lookup is built on the first request, and then it is reused.
+    """
+
+    def __init__(self, file_tokens: Sequence[tokenize.TokenInfo]) -> None:
+        """Creates an index, does not build any lookups yet."""
+        self._file_tokens = file_tokens
+
+    @cached_property
+    def by_start(self) -> Mapping[Position, tokenize.TokenInfo]:
+        """Tokens by their start positions."""
+        return make_immutable({
+            token.start: token for token in self._file_tokens
+        })
+
+    @cached_property
+    def by_line(self) -> Mapping[int, Sequence[tokenize.TokenInfo]]:
+        """Tokens that start on each line, in the stream order."""
+        lines: defaultdict[int, list[tokenize.TokenInfo]] = defaultdict(list)
+        for token in self._file_tokens:
+            lines[token.start[0]].append(token)
+        return make_immutable({
+            line_number: tuple(line_tokens)
+            for line_number, line_tokens in lines.items()
+        })
+
+    @cached_property
+    def lines(self) -> Sequence[TokenLine]:
+        """Lines with tokens in their order, linked to their neighbours."""
+        line_tokens = [
+            sorted(self.by_line[line_number], key=attrgetter('start'))
+            for line_number in sorted(self.by_line)
+        ]
+        return tuple(
+            TokenLine(
+                tokens=tuple(tokens),
+                previous_token=line_tokens[index - 1][-1] if index else None,
+                next_token=(
+                    line_tokens[index + 1][0]
+                    if index + 1 < len(line_tokens)
+                    else None
+                ),
+            )
+            for index, tokens in enumerate(line_tokens)
+        )
+
+    def get_span(self, node: ast.expr) -> Sequence[tokenize.TokenInfo]:
+        """Tokens that start and end inside the node."""
+        start = (node.lineno, node.col_offset)
+        end = (
+            node.end_lineno or node.lineno,
+            node.end_col_offset or node.col_offset,
+        )
+        first = bisect.bisect_left(self._starts, start)
+        last = bisect.bisect_right(self._starts, end, lo=first)
+        return [
+            token for token in self._file_tokens[first:last] if token.end <= end
+        ]
+
+    @cached_property
+    def _starts(self) -> Sequence[Position]:
+        return [token.start for token in self._file_tokens]
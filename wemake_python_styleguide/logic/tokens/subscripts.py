@@ -18,7 +18,7 @@ def _is_token_in_span(node: ast.Subscript, token: tokenize.TokenInfo) -> bool:
 
 def has_redundant_step(
     node: ast.Subscript,
-    tokens: Sequence[tokenize.TokenInfo],
+    subscript_tokens: Sequence[tokenize.TokenInfo],
 ) -> bool:
     """
     Find patterns like ``[start:stop:]`` or ``[start::]``.
@@ -28,7 +28,9 @@ def has_redundant_step(
     pattern = r'\[\d+:\d+:\]'  # [<start>:<stop>:]
 
     sub_tokens: list[str] = [
-        token.string for token in tokens if _is_token_in_span(node, token)
+        token.string
+        for token in subscript_tokens
+        if _is_token_in_span(node, token)
     ]
 
     sub_tokens_str = ''.join(sub_tokens)
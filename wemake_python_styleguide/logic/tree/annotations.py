@@ -1,11 +1,7 @@
 import ast
 from typing import Final
 
-from wemake_python_styleguide.compat.aliases import FunctionNodes
-from wemake_python_styleguide.logic import walk
-
-#: Nodes that can be directly annotated.
-_AnnNodes: Final = (ast.AnnAssign, ast.arg)
+from wemake_python_styleguide.logic.nodes import IN_ANNOTATION, has_flag
 
 #: Nodes that can be a part of an annotation.
 _AnnParts: Final = (
@@ -31,16 +27,4 @@ def is_annotation(node: ast.AST) -> bool:
     ):
         return False
 
-    annotated = walk.get_closest_parent(node, (*_AnnNodes, *FunctionNodes))
-    if isinstance(annotated, FunctionNodes):
-        contains_node = bool(
-            annotated.returns and walk.is_contained_by(node, annotated.returns),
-        )
-        return node == annotated.returns or contains_node
-    if isinstance(annotated, _AnnNodes):
-        contains_node = bool(
-            annotated.annotation
-            and walk.is_contained_by(node, annotated.annotation),
-        )
-        return node == annotated.annotation or contains_node
-    return False
+    return has_flag(node, IN_ANNOTATION)
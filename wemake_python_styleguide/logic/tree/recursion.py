@@ -1,39 +1,63 @@
 import ast
+from collections import defaultdict
+from typing import final
 
 from wemake_python_styleguide.logic.nodes import get_context
-from wemake_python_styleguide.logic.tree.functions import given_function_called
 from wemake_python_styleguide.types import AnyFunctionDef
 
 
-def _is_self_call(func: AnyFunctionDef, node: ast.AST) -> bool:
-    return (
-        isinstance(node, ast.Call)
-        and isinstance(node.func, ast.Attribute)
-        and bool(given_function_called(node, {f'self.{func.name}'}))
-    )
-
-
-def _check_method_recursion(func: AnyFunctionDef) -> bool:
-    return bool([node for node in ast.walk(func) if _is_self_call(func, node)])
-
-
-def _check_function_recursion(func: AnyFunctionDef) -> bool:
-    return bool(
-        [
-            node
-            for node in ast.walk(func)
-            if isinstance(node, ast.Call)
-            and given_function_called(node, {func.name})
-        ],
-    )
-
-
-def has_recursive_calls(func: AnyFunctionDef) -> bool:
+@final
+class RecursiveCallsFinder:
     """
-    Determines whether function has recursive calls or not.
+    Finds recursive calls of a function and all its nested functions.
 
-    Does not work for methods.
+    Does it in a single pass over the tree: functions must be entered
+    before all their nodes and left after them.
+    Calls are compared by names, nodes are not rendered.
     """
+
+    def __init__(self) -> None:
+        """Creates an empty stack of entered functions."""
+        self._callers: defaultdict[str, list[AnyFunctionDef]] = defaultdict(
+            list,
+        )
+        self._recursive: set[AnyFunctionDef] = set()
+
+    def enter_function(self, func: AnyFunctionDef) -> None:
+        """Starts looking for recursive calls of a function."""
+        self._callers[_get_recursive_call_name(func)].append(func)
+
+    def check_call(self, node: ast.Call) -> None:
+        """Marks the innermost entered function that is called."""
+        call_name = _get_call_name(node)
+        if call_name is not None and self._callers[call_name]:
+            # Outer functions are marked when this one is left:
+            self._recursive.add(self._callers[call_name][-1])
+
+    def leave_function(self, func: AnyFunctionDef) -> bool:
+        """Tells whether the left function has recursive calls."""
+        callers = self._callers[_get_recursive_call_name(func)]
+        callers.pop()
+        has_recursion = func in self._recursive
+        if has_recursion and callers:
+            self._recursive.add(callers[-1])
+        return has_recursion
+
+
+def _get_recursive_call_name(func: AnyFunctionDef) -> str:
     if isinstance(get_context(func), ast.ClassDef):
-        return _check_method_recursion(func)
-    return _check_function_recursion(func)
+        return f'self.{func.name}'
+    return func.name
+
+
+def _get_call_name(node: ast.Call) -> str | None:
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if (
+        isinstance(node.func, ast.Attribute)
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == 'self'
+    ):
+        method_name = node.func.attr
+        return f'self.{method_name}'
+    return None  # other calls cannot be recursive
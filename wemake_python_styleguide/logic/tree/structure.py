@@ -0,0 +1,66 @@
+import ast
+from typing import TypeAlias, final
+
+#: Node type and its fields, where subnodes are replaced with their keys.
+_Structure: TypeAlias = tuple[object, ...]
+
+
+@final
+class StructuralKeys:
+    """
+    Gives equal keys to structurally equal nodes.
+
+    Each node is described by its type and fields,
+    where subnodes are replaced with their own keys.
+    So, keys are computed bottom-up once per subtree
+    and descriptions stay small even for deeply nested nodes.
+
+    Descriptions are compared as a whole on each lookup,
+    so different structures never share a key.
+
+    Positions and expression contexts are ignored,
+    constants of different types, like ``1`` and ``1.0``, are different.
+    Structurally equal nodes have the same source code.
+    """
+
+    def __init__(self) -> None:
+        """Creates empty keys."""
+        self._keys: dict[ast.AST, int] = {}
+        self._structures: dict[_Structure, int] = {}
+
+    def get_key(self, node: ast.AST) -> int:
+        """Returns the key of a node, computes missing keys of subnodes."""
+        nodes = [node]
+        while nodes:
+            subnode = nodes[-1]
+            missing = [
+                child
+                for child in ast.iter_child_nodes(subnode)
+                if child not in self._keys
+            ]
+            if missing:
+                nodes.extend(missing)
+                continue
+            nodes.pop()
+            self._keys[subnode] = self._structures.setdefault(
+                self._describe(subnode),
+                len(self._structures),
+            )
+        return self._keys[node]
+
+    def _describe(self, node: ast.AST) -> _Structure:
+        return (
+            type(node),
+            *(
+                self._describe_field(field_value)
+                for field_name, field_value in ast.iter_fields(node)
+                if field_name != 'ctx'
+            ),
+        )
+
+    def _describe_field(self, field_value: object) -> object:
+        if isinstance(field_value, ast.AST):
+            return self._keys[field_value]
+        if isinstance(field_value, list):
+            return tuple(map(self._describe_field, field_value))
+        return type(field_value), field_value
@@ -1,9 +1,3 @@
-from wemake_python_styleguide.logic.walk.deletion import (
-    are_variables_deleted as are_variables_deleted,
-)
-from wemake_python_styleguide.logic.walk.deletion import (
-    extract_deleted_names as extract_deleted_names,
-)
 from wemake_python_styleguide.logic.walk.targets import (
     extract_names_from_targets as extract_names_from_targets,
 )
@@ -0,0 +1,101 @@
+import ast
+import heapq
+from array import array
+from collections.abc import Iterator, Mapping
+from typing import TypeAlias, final
+
+import attr
+
+from wemake_python_styleguide.compat.routing import DispatchTable, dispatch_key
+from wemake_python_styleguide.logic.walk.tree import get_closest_parent
+from wemake_python_styleguide.types import AnyNodes
+
+#: Node with its position in the document order.
+PositionedNode: TypeAlias = tuple[int, ast.AST]
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class CensusNodes:
+    """
+    All nodes of a single type in the document order.
+
+    Positions are stored in a compact array,
+    so the census adds only a few bytes per node to the module.
+    """
+
+    nodes: list[ast.AST] = attr.ib(factory=list)
+    positions: 'array[int]' = attr.ib(factory=lambda: array('I'))
+
+    def append(self, position: int, node: ast.AST) -> None:
+        """Adds the next node of this type."""
+        self.nodes.append(node)
+        self.positions.append(position)
+
+    def positioned(self) -> Iterator[PositionedNode]:
+        """Returns nodes together with their positions."""
+        return zip(self.positions, self.nodes, strict=True)
+
+
+#: Node type to all nodes of this type in the document order.
+NodeCensus: TypeAlias = Mapping[type[ast.AST], CensusNodes]
+
+
+def get_census(tree: ast.AST) -> NodeCensus | None:
+    """Returns the census of a module or ``None`` if it was not created."""
+    return getattr(tree, 'wps_census', None)
+
+
+def get_positioned_nodes(
+    census: NodeCensus,
+    node_types: AnyNodes,
+) -> Iterator[PositionedNode]:
+    """Returns nodes of given types with their positions in document order."""
+    return heapq.merge(
+        *(
+            census[node_type].positioned()
+            for node_type in node_types
+            if node_type in census
+        ),
+    )
+
+
+def get_outermost_nodes(
+    census: NodeCensus,
+    node_types: AnyNodes,
+) -> Iterator[ast.AST]:
+    """
+    Returns nodes of given types in document order.
+
+    Skips nodes that are contained by other nodes of given types.
+    So, visiting returned nodes recursively visits all nodes of given types
+    exactly once and in the same order as the full tree traversal does.
+    """
+    for _, node in get_positioned_nodes(census, node_types):
+        if get_closest_parent(node, node_types) is None:
+            yield node
+
+
+def count_nodes(census: NodeCensus) -> int:
+    """Returns the number of all nodes in a module."""
+    return sum(len(census_nodes.nodes) for census_nodes in census.values())
+
+
+def count_dispatched_nodes(
+    census: NodeCensus,
+    dispatch_table: DispatchTable,
+) -> int:
+    """
+    Returns the number of nodes that have handlers in a dispatch table.
+
+    Constants are dispatched by the types of their values.
+    """
+    node_types = dispatch_table.keys() & census.keys()
+    node_types.discard(ast.Constant)
+    constants = census.get(ast.Constant, CensusNodes())
+    dispatched_constants = sum(
+        dispatch_key(constant) in dispatch_table for constant in constants.nodes
+    )
+    return dispatched_constants + sum(
+        len(census[node_type].nodes) for node_type in node_types
+    )
@@ -0,0 +1,48 @@
+import ast
+from collections import defaultdict
+from typing import TypeAlias, final
+
+import attr
+
+from wemake_python_styleguide.logic.walk.census import PositionedNode
+
+#: Block variable names to their blocks in the document order.
+BlockBindings: TypeAlias = defaultdict[str, list[PositionedNode]]
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class ContextSymbols:
+    """
+    Names of a single context: module, class, or function.
+
+    Names belong to the same context as ``nodes.get_context`` returns.
+    So, names of nested classes and functions are not included.
+
+    Loads and blocks are positioned in the document order,
+    so checks can tell which blocks were defined before each load.
+    Positions are the same as in the node census.
+
+    Attributes:
+        definitions: all ``ast.Name`` nodes that store values.
+        loads: all ``ast.Name`` nodes that load values.
+        deleted: all names that are deleted with ``del``.
+        blocks: variables of ``for`` and ``with`` blocks,
+            each block is positioned where it defines variables.
+
+    """
+
+    definitions: list[ast.Name] = attr.ib(factory=list)
+    loads: list[PositionedNode] = attr.ib(factory=list)
+    deleted: set[str] = attr.ib(factory=set)
+    blocks: BlockBindings = attr.ib(factory=lambda: defaultdict(list))
+
+
+def get_symbols(context: ast.AST) -> ContextSymbols:
+    """
+    Returns names of the given context.
+
+    Contexts of trees that were not transformed have no names.
+    """
+    symbols: ContextSymbols | None = getattr(context, 'wps_symbols', None)
+    return symbols or ContextSymbols()
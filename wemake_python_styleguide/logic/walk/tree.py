@@ -2,7 +2,12 @@ import ast
 from collections.abc import Iterator
 from typing import TypeAlias, TypeVar
 
-from wemake_python_styleguide.logic.nodes import get_parent
+from wemake_python_styleguide.logic.nodes import (
+    SUBTREE_BITS,
+    get_parent,
+    get_subtree_mask,
+    get_tour,
+)
 from wemake_python_styleguide.types import AnyNodes
 
 _SubnodeType = TypeVar('_SubnodeType', bound=ast.AST)
@@ -16,8 +21,19 @@ def is_contained(
     """
     Checks whether node does contain given subnode types.
 
-    Goes down by the tree to check all children.
+    Types tracked by the subtree mask of a transformed node
+    are checked in constant time.
+    Otherwise, goes down by the tree to check all children.
     """
+    node_types = to_check if isinstance(to_check, tuple) else (to_check,)
+    node_entry, _ = get_tour(node)
+    if node_entry >= 0 and all(
+        node_type in SUBTREE_BITS for node_type in node_types
+    ):
+        mask = sum(SUBTREE_BITS[node_type] for node_type in set(node_types))
+        return isinstance(node, to_check) or bool(
+            get_subtree_mask(node) & mask,
+        )
     return any(isinstance(child, to_check) for child in ast.walk(node))
 
 
@@ -39,16 +55,18 @@ def is_contained_by(node: ast.AST, container: ast.AST) -> bool:
     """
     Tells you if a node is contained by a given container.
 
-    Goes up by the tree of ``node`` to check all parents.
+    Compares Euler tour numbers of both nodes, so it takes constant time.
     Works with specific instances.
     """
-    parent = get_parent(node)
-    while True:
+    node_entry, node_exit = get_tour(node)
+    if node_entry < 0:
+        # Shared nodes like `ast.Load` have no tour, but their parent does:
+        parent = get_parent(node)
         if parent is None:
             return False
-        if parent == container:
-            return True
-        parent = get_parent(parent)
+        return parent is container or is_contained_by(parent, container)
+    container_entry, container_exit = get_tour(container)
+    return container_entry < node_entry and node_exit < container_exit
 
 
 def get_subnodes_by_type(
@@ -167,6 +167,31 @@ You can also show all options that ``flake8`` supports by running:
     defaults to
     :str:`wemake_python_styleguide.options.defaults.MAX_CONDITIONS`
 
+.. rubric:: Performance options
+
+- ``wps-fused-engine`` - whether to run all ``ast`` based visitors
+    with a single tree traversal instead of one traversal per visitor,
+    defaults to
+    :str:`wemake_python_styleguide.options.defaults.WPS_FUSED_ENGINE`
+- ``wps-profile`` - whether to measure each visitor on each file
+    and to print an aggregated report to ``stderr`` at the end of the run,
+    or after each request of ``wps serve``,
+    defaults to
+    :str:`wemake_python_styleguide.options.defaults.WPS_PROFILE`
+- ``wps-cache-dir`` - directory to cache violations of unchanged modules in,
+    caching is disabled when it is empty,
+    defaults to
+    :str:`wemake_python_styleguide.options.defaults.WPS_CACHE_DIR`
+- ``wps-cache-max-size`` - maximum size of the cache in megabytes,
+    least recently used entries are removed when it is exceeded,
+    defaults to
+    :str:`wemake_python_styleguide.options.defaults.WPS_CACHE_MAX_SIZE`
+- ``wps-incremental`` - whether to also cache violations
+    of each top-level function and class,
+    works only together with ``wps-cache-dir``,
+    defaults to
+    :str:`wemake_python_styleguide.options.defaults.WPS_INCREMENTAL`
+
 .. rubric:: Formatter options
 
 - ``show-violation-links`` - whether to show violation shortlinks in the
@@ -185,6 +210,7 @@ from wemake_python_styleguide.options import defaults
 _Type: TypeAlias = type
 ConfigValuesTypes: TypeAlias = str | int | bool | Sequence[str]
 String: Final = str
+_STORE_TRUE: Final = 'store_true'
 
 
 @final
@@ -461,12 +487,48 @@ class Configuration:
             'Maximum number of conditions in a single ``if`` or ``while`` '
             'statement.',
         ),
+        # Performance:
+        _Option(
+            '--wps-fused-engine',
+            defaults.WPS_FUSED_ENGINE,
+            'Whether to run all ast visitors with a single tree traversal.',
+            action=_STORE_TRUE,
+            type=None,
+            dest='wps_fused_engine',
+        ),
+        _Option(
+            '--wps-profile',
+            defaults.WPS_PROFILE,
+            'Whether to print per-visitor profiling report.',
+            action=_STORE_TRUE,
+            type=None,
+            dest='wps_profile',
+        ),
+        _Option(
+            '--wps-cache-dir',
+            defaults.WPS_CACHE_DIR,
+            'Directory to cache violations of unchanged modules in.',
+            type=String,
+        ),
+        _Option(
+            '--wps-cache-max-size',
+            defaults.WPS_CACHE_MAX_SIZE,
+            'Maximum size of the cache in megabytes.',
+        ),
+        _Option(
+            '--wps-incremental',
+            defaults.WPS_INCREMENTAL,
+            'Whether to cache violations of each top-level definition.',
+            action=_STORE_TRUE,
+            type=None,
+            dest='wps_incremental',
+        ),
         # Formatter:
         _Option(
             '--show-violation-links',
             defaults.SHOW_VIOLATION_LINKS,
             'Whether to show violation shortlinks in the formatter output.',
-            action='store_true',
+            action=_STORE_TRUE,
             type=None,
             dest='show_violation_links',
         ),
@@ -159,6 +159,26 @@ MAX_MATCH_CASES: Final = 7  # guessed
 MAX_CONDITIONS: Final = 4  # reasonable enough
 
 
+# ============
+# Performance:
+# ============
+
+#: Whether to run all ``ast`` visitors with a single tree traversal.
+WPS_FUSED_ENGINE: Final = False
+
+#: Whether to print per-visitor profiling report.
+WPS_PROFILE: Final = False
+
+#: Directory to cache violations in, empty value disables caching.
+WPS_CACHE_DIR: Final = ''
+
+#: Maximum size of the cache in megabytes.
+WPS_CACHE_MAX_SIZE: Final = 256
+
+#: Whether to cache violations of each top-level definition.
+WPS_INCREMENTAL: Final = False
+
+
 # ==========
 # Formatter:
 # ==========
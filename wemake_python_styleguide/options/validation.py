@@ -105,6 +105,11 @@ class ValidatedOptions:
     max_lines_in_finally: int = attr.ib(validator=[_min_max(min=1)])
     max_conditions: int = attr.ib(validator=[_min_max(min=1)])
     show_violation_links: bool
+    wps_fused_engine: bool
+    wps_profile: bool
+    wps_cache_dir: str
+    wps_cache_max_size: int = attr.ib(validator=[_min_max(min=1)])
+    wps_incremental: bool
     exps_for_one_empty_line: int
 
 
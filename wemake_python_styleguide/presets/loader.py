@@ -0,0 +1,28 @@
+"""
+Loads :term:`visitors <visitor>` of :term:`presets <preset>`.
+
+Presets reference visitors by their import paths
+relative to :mod:`wemake_python_styleguide.visitors`.
+So, importing presets is cheap: visitor and violation modules
+are only imported when visitors are actually going to run.
+"""
+
+import importlib
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from wemake_python_styleguide.visitors.base import BaseVisitor
+
+#: All preset paths are relative to this package.
+VISITORS_PACKAGE: Final = 'wemake_python_styleguide.visitors'
+
+
+def load_visitors(preset: Iterable[str]) -> tuple[type['BaseVisitor'], ...]:
+    """Imports visitor classes by their paths in the given order."""
+    visitors = []
+    for visitor_path in preset:
+        module_name, _, class_name = visitor_path.rpartition('.')
+        module = importlib.import_module(f'{VISITORS_PACKAGE}.{module_name}')
+        visitors.append(getattr(module, class_name))
+    return tuple(visitors)
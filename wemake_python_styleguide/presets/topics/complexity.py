@@ -1,42 +1,27 @@
 from typing import Final
 
-from wemake_python_styleguide.visitors.ast.complexity import (  # noqa: WPS235
-    access,
-    annotations,
-    calls,
-    classes,
-    counts,
-    function,
-    imports,
-    jones,
-    nested,
-    offset,
-    overuses,
-    pm,
-)
-
 #: Used to store all complexity related visitors to be later passed to checker:
 PRESET: Final = (
-    function.FunctionComplexityVisitor,
-    function.CognitiveComplexityVisitor,
-    imports.ImportMembersVisitor,
-    jones.JonesComplexityVisitor,
-    nested.NestedComplexityVisitor,
-    offset.OffsetVisitor,
-    counts.ModuleMembersVisitor,
-    counts.ConditionsVisitor,
-    counts.ElifVisitor,
-    counts.TryExceptVisitor,
-    counts.ReturnLikeStatementTupleVisitor,
-    counts.TupleUnpackVisitor,
-    counts.TypeParamsVisitor,
-    classes.ClassComplexityVisitor,
-    classes.MethodMembersVisitor,
-    overuses.StringOveruseVisitor,
-    overuses.ExpressionOveruseVisitor,
-    access.AccessVisitor,
-    calls.CallChainsVisitor,
-    annotations.AnnotationComplexityVisitor,
-    pm.MatchSubjectsVisitor,
-    pm.MatchCasesVisitor,
+    'ast.complexity.function.FunctionComplexityVisitor',
+    'ast.complexity.function.CognitiveComplexityVisitor',
+    'ast.complexity.imports.ImportMembersVisitor',
+    'ast.complexity.jones.JonesComplexityVisitor',
+    'ast.complexity.nested.NestedComplexityVisitor',
+    'ast.complexity.offset.OffsetVisitor',
+    'ast.complexity.counts.ModuleMembersVisitor',
+    'ast.complexity.counts.ConditionsVisitor',
+    'ast.complexity.counts.ElifVisitor',
+    'ast.complexity.counts.TryExceptVisitor',
+    'ast.complexity.counts.ReturnLikeStatementTupleVisitor',
+    'ast.complexity.counts.TupleUnpackVisitor',
+    'ast.complexity.counts.TypeParamsVisitor',
+    'ast.complexity.classes.ClassComplexityVisitor',
+    'ast.complexity.classes.MethodMembersVisitor',
+    'ast.complexity.overuses.StringOveruseVisitor',
+    'ast.complexity.overuses.ExpressionOveruseVisitor',
+    'ast.complexity.access.AccessVisitor',
+    'ast.complexity.calls.CallChainsVisitor',
+    'ast.complexity.annotations.AnnotationComplexityVisitor',
+    'ast.complexity.pm.MatchSubjectsVisitor',
+    'ast.complexity.pm.MatchCasesVisitor',
 )
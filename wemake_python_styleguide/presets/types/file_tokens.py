@@ -1,24 +1,16 @@
 from typing import Final
 
-from wemake_python_styleguide.visitors.tokenize import (
-    comments,
-    conditions,
-    primitives,
-    statements,
-    syntax,
-)
-
 #: Used to store all token related visitors to be later passed to checker:
 PRESET: Final = (
-    comments.WrongCommentVisitor,
-    comments.ShebangVisitor,
-    comments.NoqaVisitor,
-    comments.EmptyCommentVisitor,
-    comments.CommentInFormattedStringVisitor,
-    syntax.WrongKeywordTokenVisitor,
-    primitives.WrongNumberTokenVisitor,
-    primitives.WrongStringTokenVisitor,
-    statements.MultilineStringVisitor,
-    conditions.IfElseVisitor,
-    primitives.MultilineFormattedStringTokenVisitor,
+    'tokenize.comments.WrongCommentVisitor',
+    'tokenize.comments.ShebangVisitor',
+    'tokenize.comments.NoqaVisitor',
+    'tokenize.comments.EmptyCommentVisitor',
+    'tokenize.comments.CommentInFormattedStringVisitor',
+    'tokenize.syntax.WrongKeywordTokenVisitor',
+    'tokenize.primitives.WrongNumberTokenVisitor',
+    'tokenize.primitives.WrongStringTokenVisitor',
+    'tokenize.statements.MultilineStringVisitor',
+    'tokenize.conditions.IfElseVisitor',
+    'tokenize.primitives.MultilineFormattedStringTokenVisitor',
 )
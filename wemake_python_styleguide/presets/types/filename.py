@@ -1,8 +1,4 @@
 from typing import Final
 
-from wemake_python_styleguide.visitors.filenames.module import (
-    WrongModuleNameVisitor,
-)
-
 #: Here we define all filename-based visitors.
-PRESET: Final = (WrongModuleNameVisitor,)
+PRESET: Final = ('filenames.module.WrongModuleNameVisitor',)
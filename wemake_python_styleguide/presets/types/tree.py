@@ -1,90 +1,68 @@
 from typing import Final
 
 from wemake_python_styleguide.presets.topics import classes, complexity, naming
-from wemake_python_styleguide.visitors.ast import (  # noqa: WPS235
-    blocks,
-    builtins,
-    compares,
-    conditions,
-    decorators,
-    exceptions,
-    functions,
-    imports,
-    iterables,
-    keywords,
-    loops,
-    modules,
-    operators,
-    pm,
-    redundancy,
-    statements,
-    subscripts,
-)
-from wemake_python_styleguide.visitors.tokenize import (
-    functions as tokenize_functions,
-)
 
 #: Used to store all general visitors to be later passed to checker:
 PRESET: Final = (
     # General:
-    statements.StatementsWithBodiesVisitor,
-    statements.PointlessStarredVisitor,
-    statements.WrongNamedKeywordVisitor,
-    statements.AssignmentPatternsVisitor,
-    statements.WrongMethodArgumentsVisitor,
-    keywords.WrongRaiseVisitor,
-    keywords.WrongKeywordVisitor,
-    keywords.WrongContextManagerVisitor,
-    keywords.ConsistentReturningVisitor,
-    keywords.ConstantKeywordVisitor,
-    keywords.GeneratorKeywordsVisitor,
-    loops.WrongComprehensionVisitor,
-    loops.WrongLoopVisitor,
-    loops.WrongLoopDefinitionVisitor,
-    loops.WrongStatementInLoopVisitor,
-    functions.WrongFunctionCallVisitor,
-    functions.FunctionDefinitionVisitor,
-    functions.UselessLambdaDefinitionVisitor,
-    functions.WrongFunctionCallContextVisitor,
-    functions.FunctionSignatureVisitor,
-    tokenize_functions.WrongEmptyLinesCountVisitor,
-    exceptions.WrongTryExceptVisitor,
-    exceptions.NestedTryBlocksVisitor,
-    exceptions.WrongExceptHandlerVisitor,
-    imports.WrongImportVisitor,
-    builtins.WrongNumberVisitor,
-    builtins.WrongStringVisitor,
-    builtins.WrongFormatStringVisitor,
-    builtins.WrongAssignmentVisitor,
-    builtins.WrongCollectionVisitor,
-    operators.UselessOperatorsVisitor,
-    operators.WrongMathOperatorVisitor,
-    operators.WalrusVisitor,
-    compares.WrongConditionalVisitor,
-    compares.CompareSanityVisitor,
-    compares.WrongConstantCompareVisitor,
-    compares.InCompareSanityVisitor,
-    compares.WrongFloatComplexCompareVisitor,
-    compares.NotInUnaryVisitor,
-    conditions.IfStatementVisitor,
-    conditions.BooleanConditionVisitor,
-    conditions.MatchVisitor,
-    conditions.ChainedIsVisitor,
-    conditions.SimplifiableMatchVisitor,
-    conditions.LeakingForLoopVisitor,
-    iterables.IterableUnpackingVisitor,
-    blocks.AfterBlockVariablesVisitor,
-    subscripts.SubscriptVisitor,
-    subscripts.ImplicitDictGetVisitor,
-    subscripts.CorrectKeyVisitor,
-    subscripts.StrictSliceOperations,
-    decorators.WrongDecoratorVisitor,
-    redundancy.RedundantEnumerateVisitor,
-    pm.MatchSubjectVisitor,
+    'ast.statements.StatementsWithBodiesVisitor',
+    'ast.statements.PointlessStarredVisitor',
+    'ast.statements.WrongNamedKeywordVisitor',
+    'ast.statements.AssignmentPatternsVisitor',
+    'ast.statements.WrongMethodArgumentsVisitor',
+    'ast.keywords.WrongRaiseVisitor',
+    'ast.keywords.WrongKeywordVisitor',
+    'ast.keywords.WrongContextManagerVisitor',
+    'ast.keywords.ConsistentReturningVisitor',
+    'ast.keywords.ConstantKeywordVisitor',
+    'ast.keywords.GeneratorKeywordsVisitor',
+    'ast.loops.WrongComprehensionVisitor',
+    'ast.loops.WrongLoopVisitor',
+    'ast.loops.WrongLoopDefinitionVisitor',
+    'ast.loops.WrongStatementInLoopVisitor',
+    'ast.functions.WrongFunctionCallVisitor',
+    'ast.functions.FunctionDefinitionVisitor',
+    'ast.functions.UselessLambdaDefinitionVisitor',
+    'ast.functions.WrongFunctionCallContextVisitor',
+    'ast.functions.FunctionSignatureVisitor',
+    'tokenize.functions.WrongEmptyLinesCountVisitor',
+    'ast.exceptions.WrongTryExceptVisitor',
+    'ast.exceptions.NestedTryBlocksVisitor',
+    'ast.exceptions.WrongExceptHandlerVisitor',
+    'ast.imports.WrongImportVisitor',
+    'ast.builtins.WrongNumberVisitor',
+    'ast.builtins.WrongStringVisitor',
+    'ast.builtins.WrongFormatStringVisitor',
+    'ast.builtins.WrongAssignmentVisitor',
+    'ast.builtins.WrongCollectionVisitor',
+    'ast.operators.UselessOperatorsVisitor',
+    'ast.operators.WrongMathOperatorVisitor',
+    'ast.operators.WalrusVisitor',
+    'ast.compares.WrongConditionalVisitor',
+    'ast.compares.CompareSanityVisitor',
+    'ast.compares.WrongConstantCompareVisitor',
+    'ast.compares.InCompareSanityVisitor',
+    'ast.compares.WrongFloatComplexCompareVisitor',
+    'ast.compares.NotInUnaryVisitor',
+    'ast.conditions.IfStatementVisitor',
+    'ast.conditions.BooleanConditionVisitor',
+    'ast.conditions.MatchVisitor',
+    'ast.conditions.ChainedIsVisitor',
+    'ast.conditions.SimplifiableMatchVisitor',
+    'ast.conditions.LeakingForLoopVisitor',
+    'ast.iterables.IterableUnpackingVisitor',
+    'ast.blocks.AfterBlockVariablesVisitor',
+    'ast.subscripts.SubscriptVisitor',
+    'ast.subscripts.ImplicitDictGetVisitor',
+    'ast.subscripts.CorrectKeyVisitor',
+    'ast.subscripts.StrictSliceOperations',
+    'ast.decorators.WrongDecoratorVisitor',
+    'ast.redundancy.RedundantEnumerateVisitor',
+    'ast.pm.MatchSubjectVisitor',
     # Modules:
-    modules.EmptyModuleContentsVisitor,
-    modules.MagicModuleFunctionsVisitor,
-    modules.ModuleConstantsVisitor,
+    'ast.modules.EmptyModuleContentsVisitor',
+    'ast.modules.MagicModuleFunctionsVisitor',
+    'ast.modules.ModuleConstantsVisitor',
     # Topics:
     *complexity.PRESET,
     *naming.PRESET,
@@ -0,0 +1,309 @@
+"""
+Per-visitor profiling.
+
+When ``--wps-profile`` option is passed, :term:`checker` measures
+each :term:`visitor` on each checked file:
+
+- wall time spent in this visitor
+- number of ``ast`` nodes handled by this visitor
+- number of violations found by this visitor
+- number of ``ast`` nodes in this file
+- number of nodes rendered to source code on this file,
+  and how many of them were not memoized yet
+
+Visitors are run by the same engines as without profiling.
+Engines measure each call to a visitor separately,
+so timings of visitors are not mixed together.
+
+``flake8`` might check files in several worker processes.
+So, each process appends its measurements to a shared directory.
+The main process merges them and prints a report to ``stderr`` on exit.
+``wps serve`` runs checks in its only process
+and prints a report after each request.
+
+"""
+
+import ast
+import atexit
+import bisect
+import heapq
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import Final, final
+
+from attrs import asdict, frozen
+
+from wemake_python_styleguide.logic import source
+from wemake_python_styleguide.logic.walk import census as node_census
+from wemake_python_styleguide.visitors import base, engine
+
+#: Environment variable to share the profile directory with workers.
+PROFILE_DIRECTORY_ENV: Final = 'WPS_PROFILE_DIRECTORY'
+
+#: How many visitors and files are shown in the report.
+REPORT_SIZE: Final = 10
+
+#: Upper bounds of histogram buckets in seconds, the last one is unbounded.
+HISTOGRAM_BUCKETS: Final = (0.0001, 0.001, 0.01, 0.1)
+
+_HISTOGRAM_HEADER: Final = ('<0.1ms', '<1ms', '<10ms', '<100ms', '>=100ms')
+
+
+@final
+@frozen
+class VisitorProfile:
+    """Measurements of a single visitor on a single file."""
+
+    visitor: str
+    seconds: float
+    violations: int
+    nodes: int = 0
+
+
+@final
+@frozen
+class FileProfile:
+    """Measurements of all visitors on a single file."""
+
+    filename: str
+    nodes: int
+    visitors: Sequence[VisitorProfile]
+    rendered: int = 0
+    unparsed: int = 0
+
+    @property
+    def seconds(self) -> float:
+        """Total time spent on this file."""
+        return sum(profile.seconds for profile in self.visitors)
+
+
+@final
+class Profiler:
+    """Runs visitors and records their measurements."""
+
+    def __init__(self, directory: Path) -> None:
+        """Creates profiler that writes to the given directory."""
+        self.directory = directory
+
+    @classmethod
+    def start(cls) -> 'Profiler':
+        """
+        Creates profiler for the current process.
+
+        The main process creates the profile directory
+        and registers the report.
+        Workers inherit the directory via the environment variable,
+        the main process never reads it: it might be inherited
+        from another profiled process.
+        Child processes without this variable are not ``flake8`` workers,
+        like ``pytest-xdist`` ones, so they are profiled as the main process.
+        """
+        inherited = os.environ.get(PROFILE_DIRECTORY_ENV)
+        is_child = multiprocessing.parent_process() is not None
+        if inherited is not None and is_child:
+            return cls(Path(inherited))
+
+        directory = tempfile.mkdtemp(prefix='wps-profile-')
+        os.environ[PROFILE_DIRECTORY_ENV] = directory  # for workers
+        atexit.register(print_report, Path(directory))
+        return cls(Path(directory))
+
+    def profile(
+        self,
+        filename: str,
+        tree: ast.AST,
+        visitors: Sequence[base.BaseVisitor],
+        run_visitors: Callable[
+            [Sequence[base.BaseVisitor], engine.VisitorTimer],
+            None,
+        ],
+    ) -> None:
+        """Runs visitors with a timer and records their measurements."""
+        rendered_nodes = source.rendered_nodes
+        rendered, unparsed = rendered_nodes.calls, rendered_nodes.unparsed
+        timer = engine.VisitorTimer()
+        run_visitors(visitors, timer)
+        census = node_census.get_census(tree) or {}
+        self._record(
+            FileProfile(
+                filename=filename,
+                nodes=node_census.count_nodes(census),
+                visitors=[
+                    VisitorProfile(
+                        visitor=type(visitor).__qualname__,
+                        seconds=timer.seconds[visitor],
+                        violations=len(visitor.violations),
+                        nodes=_count_handled_nodes(visitor, census),
+                    )
+                    for visitor in visitors
+                ],
+                rendered=rendered_nodes.calls - rendered,
+                unparsed=rendered_nodes.unparsed - unparsed,
+            ),
+        )
+
+    def report(self) -> None:
+        """Prints the report of measurements that were not reported yet."""
+        file_profiles = load_profiles(self.directory)
+        if file_profiles:
+            sys.stderr.write(ProfileReport(file_profiles).format())
+        for shard in self.directory.glob('*.jsonl'):
+            shard.unlink()
+
+    def _record(self, file_profile: FileProfile) -> None:
+        # Each process has its own shard, so writes never interleave:
+        shard = self.directory / f'{os.getpid()}.jsonl'
+        with shard.open('a', encoding='utf8') as shard_file:
+            shard_file.write(f'{json.dumps(asdict(file_profile))}\n')
+
+
+def _count_handled_nodes(
+    visitor: base.BaseVisitor,
+    census: node_census.NodeCensus,
+) -> int:
+    if not isinstance(visitor, engine.FusedVisitor):
+        return 0  # only tokens or filenames are visited
+    if engine.handles_all_nodes(visitor):
+        return node_census.count_nodes(census)
+    return node_census.count_dispatched_nodes(census, visitor.dispatch_table)
+
+
+def load_profiles(directory: Path) -> list[FileProfile]:
+    """Merges measurements of all processes together."""
+    file_profiles = []
+    for shard in sorted(directory.glob('*.jsonl')):
+        for line in shard.read_text(encoding='utf8').splitlines():
+            raw_profile = json.loads(line)
+            file_profiles.append(
+                FileProfile(
+                    filename=raw_profile['filename'],
+                    nodes=raw_profile['nodes'],
+                    visitors=[
+                        VisitorProfile(**visitor_profile)
+                        for visitor_profile in raw_profile['visitors']
+                    ],
+                    rendered=raw_profile['rendered'],
+                    unparsed=raw_profile['unparsed'],
+                ),
+            )
+    return file_profiles
+
+
+def print_report(directory: Path) -> None:
+    """Prints the report to ``stderr`` and removes the profile directory."""
+    Profiler(directory).report()
+    directory.rmdir()
+
+
+@final
+class ProfileReport:
+    """Aggregated report: top visitors, top files, and histograms."""
+
+    def __init__(self, file_profiles: Sequence[FileProfile]) -> None:
+        """Groups measurements by visitors."""
+        self._file_profiles = file_profiles
+        self._visitor_profiles: defaultdict[str, list[VisitorProfile]] = (
+            defaultdict(list)
+        )
+        self._visitor_seconds: defaultdict[str, float] = defaultdict(float)
+        for file_profile in file_profiles:
+            for visitor_profile in file_profile.visitors:
+                visitor_name = visitor_profile.visitor
+                self._visitor_profiles[visitor_name].append(visitor_profile)
+                self._visitor_seconds[visitor_name] += visitor_profile.seconds
+        self._total_seconds = sum(self._visitor_seconds.values())
+
+    def format(self) -> str:  # noqa: WPS125
+        """Formats the report as a plain text."""
+        slowest_visitors = heapq.nlargest(
+            REPORT_SIZE,
+            self._visitor_seconds,
+            key=self._visitor_seconds.__getitem__,
+        )
+        total_seconds = format(self._total_seconds, '.4f')
+        return '\n'.join((
+            ' '.join((
+                'wemake-python-styleguide profile:',
+                f'{len(self._file_profiles)} files,',
+                f'{len(self._visitor_profiles)} visitors,',
+                f'{total_seconds}s',
+            )),
+            self._format_rendered(),
+            '',
+            *self._format_visitors(slowest_visitors),
+            '',
+            *self._format_files(),
+            '',
+            *self._format_histograms(slowest_visitors),
+            '',
+        ))
+
+    def _format_rendered(self) -> str:
+        rendered = sum(
+            file_profile.rendered for file_profile in self._file_profiles
+        )
+        unparsed = sum(
+            file_profile.unparsed for file_profile in self._file_profiles
+        )
+        return f'Rendered nodes: {rendered}, unparsed: {unparsed}'
+
+    def _format_visitors(self, slowest_visitors: list[str]) -> Iterable[str]:
+        yield 'Slowest visitors:'
+        yield '   seconds    share  violations       nodes  visitor'
+        for visitor_name in slowest_visitors:
+            seconds = self._visitor_seconds[visitor_name]
+            share = seconds / self._total_seconds if self._total_seconds else 0
+            visitor_profiles = self._visitor_profiles[visitor_name]
+            yield '  '.join((
+                format(seconds, '10.4f'),
+                format(share, '7.1%'),
+                format(
+                    sum(profile.violations for profile in visitor_profiles),
+                    '10',
+                ),
+                format(
+                    sum(profile.nodes for profile in visitor_profiles),
+                    '10',
+                ),
+                visitor_name,
+            ))
+
+    def _format_files(self) -> Iterable[str]:
+        yield 'Slowest files:'
+        yield '   seconds     nodes  filename'
+        slowest_files = heapq.nlargest(
+            REPORT_SIZE,
+            self._file_profiles,
+            key=lambda file_profile: file_profile.seconds,
+        )
+        for file_profile in slowest_files:
+            yield '  '.join((
+                format(file_profile.seconds, '10.4f'),
+                format(file_profile.nodes, '8'),
+                file_profile.filename,
+            ))
+
+    def _format_histograms(self, slowest_visitors: list[str]) -> Iterable[str]:
+        yield 'Files per time spent by a visitor on a file:'
+        yield ''.join((
+            *(bucket.rjust(8) for bucket in _HISTOGRAM_HEADER),
+            '  visitor',
+        ))
+        for visitor_name in slowest_visitors:
+            histogram = Counter(
+                bisect.bisect(HISTOGRAM_BUCKETS, visitor_profile.seconds)
+                for visitor_profile in self._visitor_profiles[visitor_name]
+            )
+            yield ''.join((
+                *(
+                    format(histogram[bucket], '8')
+                    for bucket in range(len(_HISTOGRAM_HEADER))
+                ),
+                f'  {visitor_name}',
+            ))
@@ -1,61 +1,112 @@
 import ast
-from typing import Final
+from collections import defaultdict
+from collections.abc import Iterator
+from typing import Final, cast
 
-from wemake_python_styleguide.compat.aliases import FunctionNodes
-from wemake_python_styleguide.logic.nodes import get_parent
-from wemake_python_styleguide.types import ContextNodes
-
-_CONTEXTS: Final = (
-    ast.Module,
-    ast.ClassDef,
-    *FunctionNodes,
+from wemake_python_styleguide.compat.aliases import ForNodes
+from wemake_python_styleguide.logic.naming.name_nodes import (
+    get_variables_from_node,
+)
+from wemake_python_styleguide.logic.nodes import get_context, get_parent
+from wemake_python_styleguide.logic.walk import census as node_census
+from wemake_python_styleguide.logic.walk.symbols import ContextSymbols
+from wemake_python_styleguide.logic.walk.targets import (
+    extract_names_from_targets,
 )
 
+#: Nodes that define block variables.
+_BLOCK_DEFINITIONS: Final = (*ForNodes, ast.withitem)
 
-def set_node_context(tree: ast.AST) -> ast.AST:
+
+def set_node_census(tree: ast.AST) -> ast.AST:
     """
-    Used to set proper context to all nodes.
+    Used to create an index of all nodes by their types.
+
+    Nodes of each type are stored in the document order,
+    the same order that ``ast.NodeVisitor`` uses.
+    Each node is stored together with its position in this order.
 
-    What we call "a context"?
-    Context is where exactly this node belongs on a global level.
+    Visitors that are interested only in some node types
+    use this index instead of traversing the whole tree.
 
-    Example:
-    .. code:: python
+    The census is stored as ``wps_census`` attribute of the tree itself.
+    """
+    census: defaultdict[type[ast.AST], node_census.CensusNodes] = defaultdict(
+        node_census.CensusNodes,
+    )
+    for position, node in enumerate(_walk_in_order(tree)):
+        census[type(node)].append(position, node)
 
-        if some_value > 2:
-            test = 'passed'
+    full_census: node_census.NodeCensus = dict(census)
+    setattr(tree, 'wps_census', full_census)  # noqa: B010
+    return tree
 
-    Despite the fact ``test`` variable has ``Assign`` as it parent
-    it will have ``Module`` as a context.
 
-    What contexts do we respect?
+def set_symbols(tree: ast.AST) -> ast.AST:
+    """
+    Used to create a symbol table of each context.
 
-    - :py:class:`ast.Module`
-    - :py:class:`ast.ClassDef`
-    - :py:class:`ast.FunctionDef` and :py:class:`ast.AsyncFunctionDef`
+    Names are taken from the node census, so the census must exist.
+    This step does not walk the tree itself.
 
-    .. versionchanged:: 0.8.1
+    Visitors use these symbols instead of walking each context again:
+    to count local variables, to find deleted names,
+    and to find block variables that are used after their blocks.
 
+    Symbols are stored as ``wps_symbols`` attribute of each context.
     """
-    for statement in ast.walk(tree):
-        current_context = _find_context(statement, _CONTEXTS)
-        setattr(statement, 'wps_context', current_context)  # noqa: B010
+    census = cast(node_census.NodeCensus, node_census.get_census(tree))
+    for position, name_node in node_census.get_positioned_nodes(
+        census,
+        (ast.Name,),
+    ):
+        _add_name(position, cast(ast.Name, name_node))
+    for position, definition in node_census.get_positioned_nodes(
+        census,
+        _BLOCK_DEFINITIONS,
+    ):
+        _add_block_variables(position, definition)
+    for _, delete in node_census.get_positioned_nodes(census, (ast.Delete,)):
+        _get_context_symbols(delete).deleted.update(
+            extract_names_from_targets(cast(ast.Delete, delete).targets),
+        )
     return tree
 
 
-def _find_context(
-    node: ast.AST,
-    contexts: tuple[type[ContextNodes], ...],
-) -> ast.AST | None:
-    """
-    We changed how we find and assign contexts in 0.8.1 version.
+def _walk_in_order(tree: ast.AST) -> Iterator[ast.AST]:
+    nodes = [tree]
+    while nodes:
+        node = nodes.pop()
+        yield node
+        nodes.extend(reversed(list(ast.iter_child_nodes(node))))
 
-    It happened because of the bug #520
-    See: https://github.com/wemake-services/wemake-python-styleguide/issues/520
-    """
-    parent = get_parent(node)
-    if parent is None:
-        return None
-    if isinstance(parent, contexts):
-        return parent
-    return _find_context(parent, contexts)
+
+def _get_context_symbols(node: ast.AST) -> ContextSymbols:
+    context = get_context(node)
+    symbols: ContextSymbols | None = getattr(context, 'wps_symbols', None)
+    if symbols is None:
+        symbols = ContextSymbols()
+        setattr(context, 'wps_symbols', symbols)  # noqa: B010
+    return symbols
+
+
+def _add_name(position: int, name_node: ast.Name) -> None:
+    if isinstance(name_node.ctx, ast.Store):
+        _get_context_symbols(name_node).definitions.append(name_node)
+    elif isinstance(name_node.ctx, ast.Load):
+        _get_context_symbols(name_node).loads.append((position, name_node))
+
+
+def _add_block_variables(position: int, definition: ast.AST) -> None:
+    if isinstance(definition, ast.withitem):
+        block = cast(ast.AST, get_parent(definition))
+        variables = definition.optional_vars
+    else:
+        block = definition
+        variables = cast(ast.For, definition).target
+
+    if variables is None:
+        return
+    blocks = _get_context_symbols(block).blocks
+    for var_name in dict.fromkeys(get_variables_from_node(variables)):
+        blocks[var_name].append((position, block))
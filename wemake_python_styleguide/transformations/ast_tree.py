@@ -1,13 +1,62 @@
 import ast
+from collections.abc import Mapping
+from typing import Final, TypeAlias, cast
 
+from wemake_python_styleguide.compat.aliases import FunctionNodes
+from wemake_python_styleguide.compat.constants import make_immutable
+from wemake_python_styleguide.compat.nodes import TemplateStr
+from wemake_python_styleguide.logic import nodes, source
 from wemake_python_styleguide.transformations.ast.enhancements import (
-    set_node_context,
+    set_node_census,
+    set_symbols,
 )
+from wemake_python_styleguide.types import ContextNodes
 
+#: Fields of a node with flags of their nodes.
+_FieldFlags: TypeAlias = tuple[tuple[str, int], ...]
 
-def _set_parent(tree: ast.AST) -> ast.AST:
+#: Depth, parent, context, and flags of a shared node.
+_SharedItem: TypeAlias = tuple[int, ast.AST, ContextNodes | None, int]
+
+_CONTEXTS: Final = (
+    ast.Module,
+    ast.ClassDef,
+    *FunctionNodes,
+)
+
+#: These nodes are shared by the whole module, they are not walked into.
+_SHARED_NODES: Final = (
+    ast.expr_context,
+    ast.operator,
+    ast.cmpop,
+    ast.unaryop,
+    ast.boolop,
+)
+
+#: All nodes inside these ones have these flags.
+_DESCENDANT_FLAGS: Final[Mapping[type, int]] = make_immutable({
+    ast.Assert: nodes.IN_ASSERT,
+    ast.JoinedStr: nodes.IN_FORMATTED_STRING,
+    TemplateStr: nodes.IN_FORMATTED_STRING,
+})
+
+_FUNCTION_FIELD_FLAGS: Final = (
+    ('returns', nodes.IN_ANNOTATION),
+    ('decorator_list', nodes.IN_DECORATOR),
+)
+
+#: Nodes in these fields and all nodes inside them have these flags.
+_FIELD_FLAGS: Final[Mapping[type, _FieldFlags]] = make_immutable({
+    ast.AnnAssign: (('annotation', nodes.IN_ANNOTATION),),
+    ast.arg: (('annotation', nodes.IN_ANNOTATION),),
+    ast.FunctionDef: _FUNCTION_FIELD_FLAGS,
+    ast.AsyncFunctionDef: _FUNCTION_FIELD_FLAGS,
+})
+
+
+def _set_node_props(tree: ast.AST) -> ast.AST:
     """
-    Sets parents for all nodes that do not have this prop.
+    Sets parents, contexts, ancestor flags, and Euler tour for all nodes.
 
     This step is required due to how `flake8` works.
     It does not set the same properties as `ast` module.
@@ -16,16 +65,138 @@ def _set_parent(tree: ast.AST) -> ast.AST:
     Since the ``0.6.1`` we use ``'wps_parent'`` with a prefix.
     This should fix the issue with conflicting plugins.
 
+    What we call "a context"?
+    Context is where exactly this node belongs on a global level.
+
+    Example:
+    .. code:: python
+
+        if some_value > 2:
+            test = 'passed'
+
+    Despite the fact ``test`` variable has ``Assign`` as it parent
+    it will have ``Module`` as a context.
+
+    What contexts do we respect?
+
+    - :py:class:`ast.Module`
+    - :py:class:`ast.ClassDef`
+    - :py:class:`ast.FunctionDef` and :py:class:`ast.AsyncFunctionDef`
+
+    All props are set in a single pass without recursion:
+    each node passes its context and flags down to its children.
+    So, deeply nested modules are processed in linear time.
+
+    Contexts and operators like :py:class:`ast.Load` or :py:class:`ast.Eq`
+    are the same objects in all places of a module.
+    So, they are not entered and do not get Euler tour steps.
+    Like with ``ast.walk``, their parent is the last one in the walk order:
+    the rightmost one on the deepest level.
+
+    Ancestor flags are described in :mod:`wemake_python_styleguide.logic.nodes`.
+    Nodes without flags do not get the ``'wps_flags'`` prop at all.
+
+    Each node is entered before all its subnodes and exited after them,
+    steps of the walk are packed into the single ``'wps_tour'`` prop.
+    So, a node is contained by another one,
+    when the container's entry and exit surround the node's ones.
+
+    Subtree masks are collected on the way back:
+    each node gets the bits of its children types on entry
+    and passes its mask to the parent on exit.
+    Nodes without any bits do not get the ``'wps_subtree'`` prop.
+
+    Props are stored as node attributes:
+    they mostly take free slots of ``__dict__`` of nodes,
+    so they cost less memory than a separate table keyed by nodes.
+
     .. versionchanged:: 0.0.11
     .. versionchanged:: 0.6.1
+    .. versionchanged:: 0.8.1
 
     """
-    for statement in ast.walk(tree):
-        for child in ast.iter_child_nodes(statement):
-            setattr(child, 'wps_parent', statement)  # noqa: B010
+    setattr(tree, 'wps_context', None)  # noqa: B010
+    # `None` on the stack means that the next node is exited:
+    stack: list[ast.AST | None] = [tree]
+    shared: dict[ast.AST, _SharedItem] = {}
+    step = 0
+    depth = 0  # number of entered nodes, which are not exited yet
+    while stack:
+        node = stack.pop()
+        if node is None:
+            _exit_node(cast(ast.AST, stack.pop()), step)
+            depth -= 1
+        else:
+            setattr(node, 'wps_tour', step * nodes.TOUR_BASE)  # noqa: B010
+            stack.extend((node, None))
+            depth += 1
+            _set_children_props(node, stack, depth, shared)
+        step += 1
+    _set_shared_props(shared)
     return tree
 
 
+def _set_children_props(
+    node: ast.AST,
+    stack: list[ast.AST | None],
+    depth: int,
+    shared: dict[ast.AST, _SharedItem],
+) -> None:
+    context = node if isinstance(node, _CONTEXTS) else nodes.get_context(node)
+    flags = nodes.get_flags(node) | _DESCENDANT_FLAGS.get(type(node), 0)
+    mask = 0
+    for child in ast.iter_child_nodes(node):
+        mask |= nodes.SUBTREE_BITS.get(type(child), 0)
+        if isinstance(child, _SHARED_NODES):
+            # Siblings are entered from the last one, so the first parent
+            # on the deepest level is the last one in `ast.walk` order:
+            if depth > shared.get(child, (-1,))[0]:
+                shared[child] = (depth, node, context, flags)
+            continue
+        _set_child_props(child, node, context, flags)
+        stack.append(child)
+    if mask:
+        setattr(node, 'wps_subtree', mask)  # noqa: B010
+    _set_field_flags(node)
+
+
+def _set_child_props(
+    node: ast.AST,
+    parent: ast.AST,
+    context: ContextNodes | None,
+    flags: int,
+) -> None:
+    setattr(node, 'wps_parent', parent)  # noqa: B010
+    setattr(node, 'wps_context', context)  # noqa: B010
+    if flags:
+        setattr(node, 'wps_flags', flags)  # noqa: B010
+
+
+def _set_shared_props(shared: Mapping[ast.AST, _SharedItem]) -> None:
+    for shared_node, shared_item in shared.items():
+        _set_child_props(shared_node, *shared_item[1:])
+
+
+def _exit_node(node: ast.AST, step: int) -> None:
+    entry, _ = nodes.get_tour(node)
+    setattr(node, 'wps_tour', entry * nodes.TOUR_BASE + step)  # noqa: B010
+    mask = nodes.get_subtree_mask(node)
+    parent = nodes.get_parent(node)
+    if mask and parent is not None:
+        parent_mask = nodes.get_subtree_mask(parent) | mask
+        setattr(parent, 'wps_subtree', parent_mask)  # noqa: B010
+
+
+def _set_field_flags(node: ast.AST) -> None:
+    for field_name, flag in _FIELD_FLAGS.get(type(node), ()):
+        field_value = getattr(node, field_name)
+        children = (
+            field_value if isinstance(field_value, list) else [field_value]
+        )
+        for child in filter(None, children):
+            setattr(child, 'wps_flags', nodes.get_flags(child) | flag)  # noqa: B010
+
+
 def transform(tree: ast.AST) -> ast.AST:
     """
     Mutates the given ``ast`` tree.
@@ -37,12 +208,16 @@ def transform(tree: ast.AST) -> ast.AST:
     - bugfixes
     - enhancements
 
+    Rendered nodes of the previous tree are not needed anymore.
+
     """
+    source.rendered_nodes.clear()
     pipeline = (
         # Initial, should be the first ones, ordering inside is important:
-        _set_parent,
-        # Enhancements, order is not important:
-        set_node_context,
+        _set_node_props,
+        # Enhancements, symbols are collected from the census:
+        set_node_census,
+        set_symbols,
     )
 
     for transformation in pipeline:
@@ -62,6 +62,9 @@ ErrorNode: TypeAlias = ast.AST | tokenize.TokenInfo | None
 #: We use this type to define helper classes with callbacks to add violations.
 ErrorCallback: TypeAlias = Callable[['BaseViolation'], None]
 
+#: We use this type to declare violations that visitors can emit.
+ViolationClasses: TypeAlias = tuple[type['BaseViolation'], ...]
+
 
 @enum.unique
 class ViolationPostfixes(enum.Enum):
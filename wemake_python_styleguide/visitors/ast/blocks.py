@@ -1,85 +1,67 @@
 import ast
-from collections import defaultdict
-from typing import TypeAlias, cast, final
+from typing import ClassVar, cast, final
 
 from wemake_python_styleguide.compat.aliases import ForNodes, WithNodes
 from wemake_python_styleguide.logic import walk
-from wemake_python_styleguide.logic.naming import name_nodes
-from wemake_python_styleguide.logic.nodes import get_context, get_parent
-from wemake_python_styleguide.types import (
-    AnyFor,
-    AnyWith,
+from wemake_python_styleguide.logic.nodes import IN_ASSERT, has_flag
+from wemake_python_styleguide.logic.walk.symbols import (
+    ContextSymbols,
+    get_symbols,
 )
+from wemake_python_styleguide.types import ContextNodes
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.best_practices import (
     ControlVarUsedAfterBlockViolation,
 )
 from wemake_python_styleguide.visitors import base, decorators
 
-#: That's how we represent contexts for control variables.
-_BlockVariables: TypeAlias = defaultdict[
-    ast.AST,
-    defaultdict[str, list[ast.AST]],
-]
-
 
 @final
 @decorators.alias(
-    'visit_any_for',
+    'visit_any_context',
     (
-        'visit_For',
-        'visit_AsyncFor',
+        'visit_Module',
+        'visit_ClassDef',
+        'visit_FunctionDef',
+        'visit_AsyncFunctionDef',
     ),
 )
 class AfterBlockVariablesVisitor(base.BaseNodeVisitor):
     """Visitor that ensures that block variables are not used after block."""
 
-    def __init__(self, *args, **kwargs) -> None:
-        """We need to store complex data about variable usages."""
-        super().__init__(*args, **kwargs)
-        self._block_variables: _BlockVariables = defaultdict(
-            lambda: defaultdict(list),
-        )
-
-    # Blocks:
-
-    def visit_any_for(self, node: AnyFor) -> None:
-        """Visit loops."""
-        self._add_to_scope(
-            node,
-            set(name_nodes.get_variables_from_node(node.target)),
-        )
-        self.generic_visit(node)
+    emitted_violations: ClassVar[ViolationClasses] = (
+        ControlVarUsedAfterBlockViolation,
+    )
 
-    def visit_withitem(self, node: ast.withitem) -> None:
-        """Visits ``with`` and ``async with`` declarations."""
-        if node.optional_vars:
-            self._add_to_scope(
-                cast(AnyWith, get_parent(node)),
-                set(name_nodes.get_variables_from_node(node.optional_vars)),
+    def visit_any_context(self, node: ContextNodes) -> None:
+        """Checks variable usages in modules, classes, and functions."""
+        context_symbols = get_symbols(node)
+        for load_position, load in context_symbols.loads:
+            self._check_variable_usage(
+                cast(ast.Name, load),
+                context_symbols,
+                load_position,
             )
         self.generic_visit(node)
 
-    # Variable usages:
-
-    def visit_Name(self, node: ast.Name) -> None:
-        """Check variable usages."""
-        if isinstance(node.ctx, ast.Load):
-            self._check_variable_usage(node)
-        self.generic_visit(node)
-
-    # Utils:
-
-    def _add_to_scope(self, node: ast.AST, names: set[str]) -> None:
-        context = cast(ast.AST, get_context(node))
-        for var_name in names:
-            self._block_variables[context][var_name].append(node)
-
-    def _check_variable_usage(self, node: ast.Name) -> None:
-        if walk.get_closest_parent(node, ast.Assert):
+    def _check_variable_usage(
+        self,
+        node: ast.Name,
+        context_symbols: ContextSymbols,
+        load_position: int,
+    ) -> None:
+        if has_flag(node, IN_ASSERT):
             return  # Allow any names to be used in `assert` statements
 
-        context = cast(ast.AST, get_context(node))
-        blocks = self._block_variables[context][node.id]
+        # Only blocks that were defined before this usage are counted:
+        blocks = [
+            block
+            for block_position, block in context_symbols.blocks.get(
+                node.id,
+                (),
+            )
+            if block_position < load_position
+        ]
         is_contained_block_var = any(
             walk.is_contained_by(node, block) for block in blocks
         )
@@ -31,6 +31,7 @@ from wemake_python_styleguide.violations import (
     complexity,
     consistency,
 )
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.visitors import base, decorators
 
 #: Items that can be inside a hash.
@@ -51,6 +52,11 @@ _AnyFormattedString: TypeAlias = ast.JoinedStr | nodes.TemplateStr
 class WrongStringVisitor(base.BaseNodeVisitor):
     """Restricts several string usages."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        best_practices.StringConstantRedefinedViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _string_constants: ClassVar[frozenset[str]] = frozenset(
         (
             string.ascii_letters,
@@ -97,6 +103,11 @@ class WrongStringVisitor(base.BaseNodeVisitor):
 class WrongFormatStringVisitor(base.BaseNodeVisitor):
     """Restricts usage of ``f`` and ``t`` strings."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.TooComplexFormattedStringViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _valid_format_index: ClassVar[AnyNodes] = (
         ast.Constant,
         ast.Name,
@@ -221,6 +232,11 @@ class WrongFormatStringVisitor(base.BaseNodeVisitor):
 class WrongNumberVisitor(base.BaseNodeTokenVisitor):
     """Checks wrong numbers used in the code."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        best_practices.MagicNumberViolation,
+        best_practices.ApproximateConstantViolation,
+    )
+
     _allowed_parents: ClassVar[AnyNodes] = (
         *AssignNodesWithWalrus,
         # Constructor usages:
@@ -266,7 +282,7 @@ class WrongNumberVisitor(base.BaseNodeTokenVisitor):
         ):
             return
         try:
-            token = self._token_dict[node.lineno, node.col_offset]
+            token = self.token_index.by_start[node.lineno, node.col_offset]
         except KeyError:  # pragma: no cover
             # For some reason, the token was not found.
             # We are not sure that this will actually happen,
@@ -316,6 +332,15 @@ class WrongNumberVisitor(base.BaseNodeTokenVisitor):
 class WrongAssignmentVisitor(base.BaseNodeVisitor):
     """Visits all assign nodes."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        consistency.UnpackingIterableToListViolation,
+        best_practices.WrongUnpackingViolation,
+        best_practices.MultipleAssignmentsViolation,
+        best_practices.SingleElementDestructuringViolation,
+        best_practices.GettingElementByUnpackingViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_any_with(self, node: AnyWith) -> None:
         """Checks assignments inside context managers to be correct."""
         for withitem in node.items:
@@ -398,6 +423,12 @@ class WrongAssignmentVisitor(base.BaseNodeVisitor):
 class WrongCollectionVisitor(base.BaseNodeVisitor):
     """Ensures that collection definitions are correct."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        best_practices.UnhashableTypeInHashViolation,
+        best_practices.FloatKeyViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _unhashable_types: ClassVar[AnyNodes] = (
         ast.List,
         ast.ListComp,
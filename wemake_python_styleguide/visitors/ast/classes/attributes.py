@@ -12,6 +12,7 @@ from wemake_python_styleguide.logic.tree import (
     classes,
 )
 from wemake_python_styleguide.violations import oop
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.visitors import base, decorators
 
 
@@ -19,6 +20,12 @@ from wemake_python_styleguide.visitors import base, decorators
 class ClassAttributeVisitor(base.BaseNodeVisitor):
     """Finds incorrect attributes."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        oop.ShadowedClassAttributeViolation,
+        oop.LambdaAttributeAssignedViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Checks that assigned attributes are correct."""
         self._check_attributes_shadowing(node)
@@ -84,6 +91,9 @@ class ClassAttributeVisitor(base.BaseNodeVisitor):
 class WrongSlotsVisitor(base.BaseNodeVisitor):
     """Visits class attributes."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (oop.WrongSlotsViolation,)
+    incremental: ClassVar[bool] = True
+
     _whitelisted_slots_nodes: ClassVar[types.AnyNodes] = (
         ast.Tuple,
         ast.Attribute,
@@ -14,6 +14,7 @@ from wemake_python_styleguide.logic.tree import (
 )
 from wemake_python_styleguide.violations import best_practices as bp
 from wemake_python_styleguide.violations import oop
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.best_practices import (
     SneakyTypeVarWithDefaultViolation,
 )
@@ -28,6 +29,14 @@ class WrongClassDefVisitor(base.BaseNodeVisitor):
     Here we check for stylistic issues and design patterns.
     """
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        bp.BaseExceptionSubclassViolation,
+        bp.KwargsUnpackingInClassDefinitionViolation,
+        oop.BuiltinSubclassViolation,
+        oop.WrongBaseClassViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Checking class definitions."""
         self._check_base_classes(node)
@@ -98,6 +107,12 @@ class WrongClassBodyVisitor(base.BaseNodeVisitor):
     Here we check for stylistic issues and design patterns.
     """
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        oop.WrongClassBodyContentViolation,
+        oop.UnpythonicGetterSetterViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _allowed_body_nodes: ClassVar[types.AnyNodes] = (
         *FunctionNodes,
         ast.ClassDef,  # we allow some nested classes
@@ -139,6 +154,11 @@ class WrongClassBodyVisitor(base.BaseNodeVisitor):
 class ConsecutiveDefaultTypeVarsVisitor(base.BaseNodeVisitor):
     """Responsible for finding TypeVarTuple after a TypeVar with default."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        SneakyTypeVarWithDefaultViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_ClassDef(  # pragma: >=3.13 cover
         self,
         node: ast.ClassDef,
@@ -11,6 +11,7 @@ from wemake_python_styleguide.logic.tree import (
     strings,
 )
 from wemake_python_styleguide.violations import consistency, oop
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.visitors import base, decorators
 
 
@@ -25,6 +26,16 @@ from wemake_python_styleguide.visitors import base, decorators
 class WrongMethodVisitor(base.BaseNodeVisitor):
     """Visits functions, but treats them as methods."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        oop.StaticMethodViolation,
+        oop.BadMagicMethodViolation,
+        oop.MethodWithoutArgumentsViolation,
+        oop.AsyncMagicMethodViolation,
+        oop.YieldMagicMethodViolation,
+        oop.UselessOverwrittenMethodViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _special_async_iter: ClassVar[frozenset[str]] = frozenset(('__aiter__',))
 
     def visit_any_function(self, node: types.AnyFunctionDef) -> None:
@@ -153,6 +164,11 @@ class WrongMethodVisitor(base.BaseNodeVisitor):
 class ClassMethodOrderVisitor(base.BaseNodeVisitor):
     """Checks that all methods inside the class are ordered correctly."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        consistency.WrongMethodOrderViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Ensures that class has correct methods order."""
         self._check_method_order(node)
@@ -204,6 +220,11 @@ class BuggySuperCallVisitor(base.BaseNodeVisitor):
     number of specific contexts. Read more: https://bugs.python.org/issue46175
     """
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        oop.BuggySuperContextViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _buggy_super_contexts: ClassVar[types.AnyNodes] = (
         ast.GeneratorExp,
         ast.SetComp,
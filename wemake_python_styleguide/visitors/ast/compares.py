@@ -9,6 +9,7 @@ from wemake_python_styleguide.logic.tree import (
 )
 from wemake_python_styleguide.logic.walrus import get_assigned_expr
 from wemake_python_styleguide.types import AnyIf, AnyNodes
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.best_practices import (
     FloatComplexCompareViolation,
     HeterogeneousCompareViolation,
@@ -32,6 +33,13 @@ from wemake_python_styleguide.visitors.decorators import alias
 class CompareSanityVisitor(BaseNodeVisitor):
     """Restricts the incorrect compares."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        ConstantCompareViolation,
+        ReversedComplexCompareViolation,
+        HeterogeneousCompareViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _less_ops: ClassVar[AnyNodes] = (ast.Gt, ast.GtE)
 
     def visit_Compare(self, node: ast.Compare) -> None:
@@ -76,6 +84,11 @@ class CompareSanityVisitor(BaseNodeVisitor):
 class WrongConstantCompareVisitor(BaseNodeVisitor):
     """Restricts incorrect compares with constants."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        FalsyConstantCompareViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _eq_compares: ClassVar[AnyNodes] = (
         ast.Eq,
         ast.NotEq,
@@ -125,6 +138,12 @@ class WrongConstantCompareVisitor(BaseNodeVisitor):
 class WrongConditionalVisitor(BaseNodeVisitor):
     """Finds wrong conditional arguments."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        ConstantConditionViolation,
+        NestedTernaryViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _forbidden_nodes: ClassVar[AnyNodes] = (
         # Constants:
         ast.Constant,
@@ -199,6 +218,11 @@ class WrongConditionalVisitor(BaseNodeVisitor):
 class InCompareSanityVisitor(BaseNodeVisitor):
     """Restricts the incorrect ``in`` compares."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        MultipleInCompareViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _in_nodes: ClassVar[AnyNodes] = (
         ast.In,
         ast.NotIn,
@@ -219,6 +243,11 @@ class InCompareSanityVisitor(BaseNodeVisitor):
 class WrongFloatComplexCompareVisitor(BaseNodeVisitor):
     """Restricts incorrect compares with ``float`` and ``complex``."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        FloatComplexCompareViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_Compare(self, node: ast.Compare) -> None:
         """Ensures that compares are written correctly."""
         self._check_float_complex_compare(node)
@@ -244,6 +273,11 @@ class WrongFloatComplexCompareVisitor(BaseNodeVisitor):
 class NotInUnaryVisitor(BaseNodeVisitor):
     """Forbids ``not a in b`` which should be written as ``a not in b``."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        NotInWithUnaryOpViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_UnaryOp(self, node: ast.UnaryOp) -> None:
         """
         Detects ``not (a in b)`` pattern syntactically.
@@ -4,6 +4,7 @@ from typing import ClassVar, cast, final
 
 from wemake_python_styleguide.logic.tree import attributes
 from wemake_python_styleguide.types import AnyAccess, AnyNodes
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.complexity import (
     TooDeepAccessViolation,
 )
@@ -14,6 +15,9 @@ from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 class AccessVisitor(BaseNodeVisitor):
     """Counts access number for expressions."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (TooDeepAccessViolation,)
+    incremental: ClassVar[bool] = True
+
     _access_nodes: ClassVar[AnyNodes] = (
         ast.Attribute,
         ast.Subscript,
@@ -1,11 +1,12 @@
 import ast
-from typing import final
+from typing import ClassVar, final
 
 from wemake_python_styleguide.logic.complexity.annotations import (
     get_annotation_complexity,
 )
 from wemake_python_styleguide.logic.tree.functions import get_all_arguments
 from wemake_python_styleguide.types import AnyFunctionDef
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.complexity import (
     TooComplexAnnotationViolation,
 )
@@ -24,6 +25,11 @@ from wemake_python_styleguide.visitors.decorators import alias
 class AnnotationComplexityVisitor(BaseNodeVisitor):
     """Ensures that annotations are used correctly."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        TooComplexAnnotationViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_any_function(self, node: AnyFunctionDef) -> None:
         """Checks return type annotations."""
         self._check_function_annotations_complexity(node)
@@ -1,8 +1,9 @@
 import ast
 from itertools import takewhile
-from typing import final
+from typing import ClassVar, final
 
 from wemake_python_styleguide.logic.tree.calls import parts
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.complexity import (
     TooLongCallChainViolation,
 )
@@ -13,6 +14,11 @@ from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 class CallChainsVisitor(BaseNodeVisitor):
     """Counts number of consecutive calls."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        TooLongCallChainViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def __init__(self, *args, **kwargs) -> None:
         """Keeps visited calls to not visit them again."""
         super().__init__(*args, **kwargs)
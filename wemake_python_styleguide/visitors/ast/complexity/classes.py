@@ -1,11 +1,12 @@
 import ast
 from collections import defaultdict
-from typing import final
+from typing import ClassVar, final
 
 from wemake_python_styleguide.logic.naming import access
 from wemake_python_styleguide.logic.nodes import get_parent
 from wemake_python_styleguide.logic.tree import classes, decorators
 from wemake_python_styleguide.types import AnyFunctionDef
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.complexity import (
     TooManyBaseClassesViolation,
     TooManyMethodsViolation,
@@ -19,6 +20,12 @@ from wemake_python_styleguide.visitors.decorators import alias
 class ClassComplexityVisitor(BaseNodeVisitor):
     """Checks class complexity."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        TooManyBaseClassesViolation,
+        TooManyPublicAttributesViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """
         Checking class definitions.
@@ -88,6 +95,9 @@ class ClassComplexityVisitor(BaseNodeVisitor):
 class MethodMembersVisitor(BaseNodeVisitor):
     """Counts methods in a single class."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (TooManyMethodsViolation,)
+    incremental: ClassVar[bool] = True
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a counter for tracked methods in different classes."""
         super().__init__(*args, **kwargs)
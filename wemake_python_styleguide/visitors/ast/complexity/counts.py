@@ -1,15 +1,17 @@
 import ast
 from collections import defaultdict
-from typing import TypeAlias, final
+from typing import ClassVar, TypeAlias, cast, final
 
 from wemake_python_styleguide import constants
 from wemake_python_styleguide.compat.aliases import FunctionNodes
+from wemake_python_styleguide.compat.nodes import TryStar
 from wemake_python_styleguide.compat.nodes import TypeAlias as ast_TypeAlias
 from wemake_python_styleguide.compat.types import AnyTry
 from wemake_python_styleguide.logic.nodes import get_context
 from wemake_python_styleguide.logic.tree import decorators
-from wemake_python_styleguide.types import AnyFunctionDef
+from wemake_python_styleguide.types import AnyFunctionDef, AnyNodes
 from wemake_python_styleguide.violations import complexity
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 from wemake_python_styleguide.visitors.decorators import alias
 
@@ -31,6 +33,11 @@ _ReturnLikeStatement: TypeAlias = ast.Return | ast.Yield
 class ModuleMembersVisitor(BaseNodeVisitor):
     """Counts classes and functions in a module."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.TooManyModuleMembersViolation,
+        complexity.TooManyDecoratorsViolation,
+    )
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a counter for tracked metrics."""
         super().__init__(*args, **kwargs)
@@ -80,6 +87,12 @@ class ModuleMembersVisitor(BaseNodeVisitor):
 class ConditionsVisitor(BaseNodeVisitor):
     """Checks booleans for condition counts."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.TooManyConditionsViolation,
+        complexity.TooLongCompareViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_BoolOp(self, node: ast.BoolOp) -> None:
         """Counts the number of conditions."""
         self._check_conditions(node)
@@ -127,44 +140,42 @@ class ConditionsVisitor(BaseNodeVisitor):
 class ElifVisitor(BaseNodeVisitor):
     """Checks the number of ``elif`` cases inside conditions."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.TooManyElifsViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates internal ``elif`` counter."""
         super().__init__(*args, **kwargs)
-        self._if_children: defaultdict[ast.If, list[ast.If]] = defaultdict(
-            list,
-        )
+        self._roots: dict[ast.If, ast.If] = {}
+        self._elifs: defaultdict[ast.If, int] = defaultdict(int)
 
     def visit_If(self, node: ast.If) -> None:
         """Checks condition not to reimplement switch."""
         self._check_elifs(node)
         self.generic_visit(node)
 
-    def _get_root_if_node(self, node: ast.If) -> ast.If:
-        for root, children in self._if_children.items():
-            if node in children:
-                return root
-        return node
-
-    def _update_if_child(self, root: ast.If, node: ast.If) -> None:
-        if node is not root:
-            self._if_children[root].append(node)
-        self._if_children[root].extend(node.orelse)  # type: ignore
-
     def _check_elifs(self, node: ast.If) -> None:
+        # Chains are visited from their roots, so each `elif` is already
+        # linked to its root, when it is visited:
+        root = self._roots.pop(node, node)
         has_elif = all(isinstance(if_node, ast.If) for if_node in node.orelse)
+        if not has_elif:
+            return
 
-        if has_elif:
-            root = self._get_root_if_node(node)
-            self._update_if_child(root, node)
+        # Each `if` has a single parent, so branches are never counted twice:
+        self._elifs[root] += len(node.orelse)
+        for if_node in node.orelse:
+            self._roots[cast(ast.If, if_node)] = root
 
     def _post_visit(self) -> None:
-        for root, children in self._if_children.items():
-            real_children_length = len(set(children))
-            if real_children_length > constants.MAX_ELIFS:
+        for root, elifs in self._elifs.items():
+            if elifs > constants.MAX_ELIFS:
                 self.add_violation(
                     complexity.TooManyElifsViolation(
                         root,
-                        text=str(real_children_length),
+                        text=str(elifs),
                         baseline=constants.MAX_ELIFS,
                     ),
                 )
@@ -181,6 +192,16 @@ class ElifVisitor(BaseNodeVisitor):
 class TryExceptVisitor(BaseNodeVisitor):
     """Visits all try/except nodes to ensure that they are not too complex."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.TooManyExceptCasesViolation,
+        complexity.TooLongTryBodyViolation,
+        complexity.TooManyExceptExceptionsViolation,
+        complexity.TooLongFinallyBodyViolation,
+    )
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.Try, TryStar)
+
     def visit_any_try(self, node: AnyTry) -> None:
         """Ensures that try/except is correct."""
         self._check_except_count(node)
@@ -246,6 +267,11 @@ class TryExceptVisitor(BaseNodeVisitor):
 class ReturnLikeStatementTupleVisitor(BaseNodeVisitor):
     """Finds too long ``tuples`` in ``yield`` and ``return`` expressions."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.TooLongOutputTupleViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_return_like(self, node: _ReturnLikeStatement) -> None:
         """Helper to get all ``yield`` and ``return`` nodes in a function."""
         self._check_return_like_values(node)
@@ -269,6 +295,11 @@ class ReturnLikeStatementTupleVisitor(BaseNodeVisitor):
 class TupleUnpackVisitor(BaseNodeVisitor):
     """Finds statements with too many variables receiving an unpacked tuple."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.TooLongTupleUnpackViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_Assign(self, node: ast.Assign) -> None:
         """Finds statements using too many variables to unpack a tuple."""
         self._check_tuple_unpack(node)
@@ -303,6 +334,17 @@ class TupleUnpackVisitor(BaseNodeVisitor):
 class TypeParamsVisitor(BaseNodeVisitor):  # pragma: >=3.12 cover
     """Finds wrong type parameters."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.TooManyTypeParamsViolation,
+    )
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (
+        *FunctionNodes,
+        ast.ClassDef,
+        ast_TypeAlias,
+    )
+
     def visit_typed_params(self, node: _WithTypeParams) -> None:
         """Finds all objects with ``type_params``."""
         self._check_type_params_count(node)
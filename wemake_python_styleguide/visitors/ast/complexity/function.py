@@ -3,6 +3,7 @@ from collections import defaultdict
 from collections.abc import Mapping
 from typing import ClassVar, TypeAlias, final
 
+from wemake_python_styleguide.logic import walk
 from wemake_python_styleguide.logic.arguments import special_args
 from wemake_python_styleguide.logic.complexity import cognitive
 from wemake_python_styleguide.logic.complexity.functions import (
@@ -11,15 +12,19 @@ from wemake_python_styleguide.logic.complexity.functions import (
     FunctionCounterWithLambda,
 )
 from wemake_python_styleguide.logic.naming import access
-from wemake_python_styleguide.logic.nodes import get_context, get_parent
+from wemake_python_styleguide.logic.nodes import get_parent
 from wemake_python_styleguide.logic.tree import functions
+from wemake_python_styleguide.logic.walk.symbols import get_symbols
 from wemake_python_styleguide.types import (
     AnyFunctionDef,
     AnyFunctionDefAndLambda,
     AnyNodes,
 )
 from wemake_python_styleguide.violations import complexity
-from wemake_python_styleguide.violations.base import BaseViolation
+from wemake_python_styleguide.violations.base import (
+    BaseViolation,
+    ViolationClasses,
+)
 from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 from wemake_python_styleguide.visitors.decorators import alias
 
@@ -27,20 +32,36 @@ from wemake_python_styleguide.visitors.decorators import alias
 
 _AnyFunctionCounter: TypeAlias = FunctionCounter | FunctionCounterWithLambda
 _CheckRule: TypeAlias = tuple[_AnyFunctionCounter, int, type[BaseViolation]]
-_NodeTypeHandler: TypeAlias = Mapping[
-    type | tuple[type, ...],
-    FunctionCounter,
-]
+_CountedNode: TypeAlias = (
+    ast.Return | ast.Expr | ast.Await | ast.Assert | ast.Raise
+)
+_NodeTypeHandler: TypeAlias = Mapping[type[_CountedNode], FunctionCounter]
 
 
 @final
 class _ComplexityCounter:
-    """Helper class to encapsulate logic from the visitor."""
+    """
+    Helper class to encapsulate logic from the visitor.
+
+    Counters are updated in a single traversal.
+    We keep a stack of functions that contain the current node.
+    Statements are counted in the innermost function only,
+    when a function is left, its counters are added to the enclosing one.
+    So, nested functions are never walked twice.
+    """
 
     _not_contain_locals: ClassVar[AnyNodes] = (ast.comprehension,)
 
     def __init__(self) -> None:
         self.metrics = ComplexityMetrics()
+        self._functions: list[AnyFunctionDef] = []
+        self._counters: _NodeTypeHandler = {
+            ast.Return: self.metrics.returns,
+            ast.Expr: self.metrics.expressions,
+            ast.Await: self.metrics.awaits,
+            ast.Assert: self.metrics.asserts,
+            ast.Raise: self.metrics.raises,
+        }
 
     def check_arguments_count(self, node: AnyFunctionDefAndLambda) -> None:
         """Checks the number of the arguments in a function."""
@@ -52,71 +73,84 @@ class _ComplexityCounter:
             special_args.clean_special_argument(node, all_args),
         )
 
-    def check_function_complexity(self, node: AnyFunctionDef) -> None:
+    def enter_function(self, node: AnyFunctionDef) -> None:
         """
-        In this function we iterate all the internal body's node.
+        Starts counting the internal complexity of a function.
 
-        We check different complexity metrics based on these internals.
+        We check different complexity metrics based on its internals.
         """
-        for body_item in node.body:
-            for sub_node in ast.walk(body_item):
-                self._check_sub_node(node, sub_node)
+        self.leave_functions(node)
+        self._functions.append(node)
+        self._update_variables(node)
 
-    def _update_variables(
-        self,
-        function: AnyFunctionDef,
-        variable_def: ast.Name,
-    ) -> None:
-        """
-        Increases the counter of local variables.
-
-        What is treated as a local variable?
-        Check ``TooManyLocalsViolation`` documentation.
-        """
-        function_variables = self.metrics.variables[function]
-        if variable_def.id not in function_variables:
-            if access.is_unused(variable_def.id):
-                return
+    def update_counters(self, node: _CountedNode) -> None:
+        """Counts a statement in the function that contains it."""
+        self.leave_functions(node)
+        if not self._functions:
+            return
 
-            if get_context(variable_def) is not function:
+        function_index = -1
+        # Awaits in defaults and decorators belong to the enclosing function:
+        if isinstance(node, ast.Await) and self._is_in_signature(
+            self._functions[-1],
+            node,
+        ):
+            function_index = -2
+            if len(self._functions) == 1:
                 return
+        self._counters[type(node)][self._functions[function_index]] += 1
 
-            parent = get_parent(variable_def)
-            no_locals = self._not_contain_locals
-            if isinstance(parent, no_locals):
-                return
+    def leave_functions(self, node: ast.AST | None = None) -> None:
+        """
+        Leaves functions that do not contain the given node.
 
-            function_variables.append(variable_def.id)
+        Counters of left functions are added to their enclosing functions.
+        When no node is given, all functions are left.
+        """
+        while self._functions and (
+            node is None or not walk.is_contained_by(node, self._functions[-1])
+        ):
+            function = self._functions.pop()
+            if not self._functions:
+                continue
+            for node_type, counter in self._counters.items():
+                # We do not count returns in nested functions and classes
+                if node_type is not ast.Return:
+                    counter[self._functions[-1]] += counter[function]
 
-    def _update_counters(self, node: AnyFunctionDef, sub_node: ast.AST) -> None:
-        """Updates statement counters for the given node."""
-        error_counters: _NodeTypeHandler = {
-            ast.Return: self.metrics.returns,
-            ast.Expr: self.metrics.expressions,
-            ast.Await: self.metrics.awaits,
-            ast.Assert: self.metrics.asserts,
-            ast.Raise: self.metrics.raises,
-        }
+    def _update_variables(self, function: AnyFunctionDef) -> None:
+        """
+        Counts unique local variables of a function.
 
-        for types, counter in error_counters.items():
-            if isinstance(sub_node, types):
-                # We do not count returns in nested functions and classes
-                if types is ast.Return and get_context(sub_node) is not node:
-                    continue
-                counter[node] += 1
+        What is treated as a local variable?
+        Check ``TooManyLocalsViolation`` documentation.
+        """
+        self.metrics.variables[function].extend(
+            dict.fromkeys(
+                variable_def.id
+                for variable_def in get_symbols(function).definitions
+                if not access.is_unused(variable_def.id)
+                and not isinstance(
+                    get_parent(variable_def),
+                    self._not_contain_locals,
+                )
+                and not self._is_in_signature(function, variable_def)
+            ),
+        )
 
-    def _check_sub_node(
+    def _is_in_signature(
         self,
-        node: AnyFunctionDef,
-        sub_node: ast.AST,
-    ) -> None:
-        if isinstance(sub_node, ast.Name) and isinstance(
-            sub_node.ctx,
-            ast.Store,
-        ):
-            self._update_variables(node, sub_node)
-
-        self._update_counters(node, sub_node)
+        function: AnyFunctionDef,
+        node: ast.AST,
+    ) -> bool:
+        # Nodes in decorators and arguments have the function as a context,
+        # but they are not its internals:
+        signature = (function.args, function.returns, *function.decorator_list)
+        return any(
+            walk.is_contained_by(node, signature_node)
+            for signature_node in signature
+            if signature_node is not None
+        )
 
 
 @final
@@ -127,7 +161,17 @@ class _ComplexityCounter:
         'visit_FunctionDef',
     ),
 )
-class FunctionComplexityVisitor(BaseNodeVisitor):
+@alias(
+    'visit_any_counted',
+    (
+        'visit_Return',
+        'visit_Expr',
+        'visit_Await',
+        'visit_Assert',
+        'visit_Raise',
+    ),
+)
+class FunctionComplexityVisitor(BaseNodeVisitor):  # noqa: WPS214
     """
     This class checks for complexity inside functions.
 
@@ -140,6 +184,17 @@ class FunctionComplexityVisitor(BaseNodeVisitor):
 
     """
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.TooManyLocalsViolation,
+        complexity.TooManyArgumentsViolation,
+        complexity.TooManyReturnsViolation,
+        complexity.TooManyExpressionsViolation,
+        complexity.TooManyAwaitsViolation,
+        complexity.TooManyAssertsViolation,
+        complexity.TooManyRaisesViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a counter for tracked metrics."""
         super().__init__(*args, **kwargs)
@@ -148,7 +203,12 @@ class FunctionComplexityVisitor(BaseNodeVisitor):
     def visit_any_function(self, node: AnyFunctionDef) -> None:
         """Checks function's internal complexity."""
         self._counter.check_arguments_count(node)
-        self._counter.check_function_complexity(node)
+        self._counter.enter_function(node)
+        self.generic_visit(node)
+
+    def visit_any_counted(self, node: _CountedNode) -> None:
+        """Counts statements of the function that contains them."""
+        self._counter.update_counters(node)
         self.generic_visit(node)
 
     def visit_Lambda(self, node: ast.Lambda) -> None:
@@ -215,6 +275,7 @@ class FunctionComplexityVisitor(BaseNodeVisitor):
         ]
 
     def _post_visit(self) -> None:
+        self._counter.leave_functions()
         self._check_function_signature()
         self._check_function_internals()
 
@@ -230,14 +291,20 @@ class FunctionComplexityVisitor(BaseNodeVisitor):
 class CognitiveComplexityVisitor(BaseNodeVisitor):
     """Used to count cognitive score and average module complexity."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.CognitiveComplexityViolation,
+        complexity.CognitiveModuleComplexityViolation,
+    )
+
     def __init__(self, *args, **kwargs) -> None:
         """We use to save all functions' complexity here."""
         super().__init__(*args, **kwargs)
         self._functions: defaultdict[AnyFunctionDef, int] = defaultdict(int)
 
     def visit_any_function(self, node: AnyFunctionDef) -> None:
-        """Counts cognitive complexity."""
-        self._functions[node] = cognitive.cognitive_score(node)
+        """Counts cognitive complexity of a function and nested ones."""
+        if node not in self._functions:
+            self._functions.update(cognitive.cognitive_scores(node))
         self.generic_visit(node)
 
     def _post_visit(self) -> None:
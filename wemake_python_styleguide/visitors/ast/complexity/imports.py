@@ -1,13 +1,16 @@
 import ast
-from typing import final
+from typing import ClassVar, final
 
 from wemake_python_styleguide import constants
 from wemake_python_styleguide.logic.filenames import get_stem
 from wemake_python_styleguide.logic.tree.strings import is_doc_string
 from wemake_python_styleguide.options.validation import ValidatedOptions
-from wemake_python_styleguide.types import AnyImport
+from wemake_python_styleguide.types import AnyImport, AnyNodes
 from wemake_python_styleguide.violations import complexity
-from wemake_python_styleguide.violations.base import ErrorCallback
+from wemake_python_styleguide.violations.base import (
+    ErrorCallback,
+    ViolationClasses,
+)
 from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 
 
@@ -42,6 +45,14 @@ class _ImportFromMembersValidator:
 class ImportMembersVisitor(BaseNodeVisitor):
     """Counts imports in a module."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.TooManyImportsViolation,
+        complexity.TooManyImportedNamesViolation,
+        complexity.TooManyImportedModuleMembersViolation,
+    )
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.Import, ast.ImportFrom)
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a counter for tracked metrics."""
         super().__init__(*args, **kwargs)
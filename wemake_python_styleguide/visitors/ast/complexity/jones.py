@@ -8,13 +8,15 @@ Original project is licensed under MIT.
 """
 
 import ast
-from collections import defaultdict
+from array import array
 from statistics import median
-from typing import final
+from typing import ClassVar, final
 
 from wemake_python_styleguide.compat import nodes
 from wemake_python_styleguide.compat.aliases import FunctionNodes
 from wemake_python_styleguide.compat.nodes import TypeAlias as ast_TypeAlias
+from wemake_python_styleguide.logic.nodes import get_tour
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.complexity import (
     JonesScoreViolation,
     LineComplexityViolation,
@@ -36,8 +38,16 @@ class JonesComplexityVisitor(BaseNodeVisitor):
     so we do not count them. FormattedValue, JoinedStr, Interpolation, and
     TemplateStr nodes are not counted, because they have no visible impact
     on source code.
+
+    We only keep the number of nodes for each line
+    and the first node of each line to report violations.
     """
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        JonesScoreViolation,
+        LineComplexityViolation,
+    )
+
     _ignored_nodes = (
         ast.ClassDef,
         *FunctionNodes,
@@ -51,8 +61,10 @@ class JonesComplexityVisitor(BaseNodeVisitor):
     def __init__(self, *args, **kwargs) -> None:
         """Initializes line number counter."""
         super().__init__(*args, **kwargs)
-        self._lines: defaultdict[int, list[ast.AST]] = defaultdict(list)
-        self._to_ignore: set[ast.AST] = set()
+        self._lines = array('L')  # numbers of nodes by line numbers
+        self._first_nodes: dict[int, ast.AST] = {}
+        self._annotation_tour = (0, 0)  # empty range of the last annotation
+        self._annotation_nodes: set[ast.AST] = set()  # without tour steps
 
     def visit(self, node: ast.AST) -> None:
         """
@@ -66,9 +78,9 @@ class JonesComplexityVisitor(BaseNodeVisitor):
         if (
             line_number is not None
             and not is_ignored
-            and not self._maybe_ignore_child(node)
+            and not self._is_annotation(node)
         ):
-            self._lines[line_number].append(node)
+            self._count_node(line_number, node)
 
         self.generic_visit(node)
 
@@ -79,18 +91,18 @@ class JonesComplexityVisitor(BaseNodeVisitor):
         Checks each line for its complexity, compares it to the threshold.
         We also calculate the final Jones score for the whole module.
         """
-        for line_nodes in self._lines.values():
-            complexity = len(line_nodes)
+        for line_number, first_node in self._first_nodes.items():
+            complexity = self._lines[line_number]
             if complexity > self.options.max_line_complexity:
                 self.add_violation(
                     LineComplexityViolation(
-                        line_nodes[0],
+                        first_node,
                         text=str(complexity),
                         baseline=self.options.max_line_complexity,
                     ),
                 )
 
-        node_counts = [len(nodes) for nodes in self._lines.values()]
+        node_counts = [count for count in self._lines if count]
         total_count = median(node_counts) if node_counts else 0
 
         if total_count > self.options.max_jones_score:
@@ -101,9 +113,29 @@ class JonesComplexityVisitor(BaseNodeVisitor):
                 ),
             )
 
-    def _maybe_ignore_child(self, node: ast.AST) -> bool:
+    def _count_node(self, line_number: int, node: ast.AST) -> None:
+        missing_lines = line_number + 1 - len(self._lines)
+        if missing_lines > 0:
+            self._lines.extend(array('L', [0]) * missing_lines)
+        self._lines[line_number] += 1
+        self._first_nodes.setdefault(line_number, node)
+
+    def _is_annotation(self, node: ast.AST) -> bool:
+        # Annotations cannot be nested, so we only keep the last one.
+        # Its nodes are entered between its entry and exit,
+        # so we check the range instead of collecting them:
         if isinstance(node, ast.AnnAssign):
-            self._to_ignore.update(ast.walk(node.annotation))
+            self._enter_annotation(node.annotation)
         if isinstance(node, ast_TypeAlias):  # pragma: >=3.12 cover
-            self._to_ignore.update(ast.walk(node.value))
-        return node in self._to_ignore
+            self._enter_annotation(node.value)
+        annotation_entry, annotation_exit = self._annotation_tour
+        node_entry, _ = get_tour(node)
+        if node_entry < 0:
+            return node in self._annotation_nodes
+        return annotation_entry <= node_entry < annotation_exit
+
+    def _enter_annotation(self, annotation: ast.expr) -> None:
+        self._annotation_tour = get_tour(annotation)
+        if self._annotation_tour[0] < 0:
+            # Tree was not transformed, so we collect annotation nodes:
+            self._annotation_nodes.update(ast.walk(annotation))
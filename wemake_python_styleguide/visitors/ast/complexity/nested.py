@@ -1,11 +1,12 @@
 import ast
-from typing import final
+from typing import ClassVar, final
 
 from wemake_python_styleguide.compat.aliases import FunctionNodes
 from wemake_python_styleguide.constants import NESTED_FUNCTIONS_WHITELIST
 from wemake_python_styleguide.logic.nodes import get_context, get_parent
 from wemake_python_styleguide.logic.walk import get_closest_parent
 from wemake_python_styleguide.types import AnyFunctionDef
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.best_practices import (
     NestedClassViolation,
     NestedFunctionViolation,
@@ -32,6 +33,12 @@ class NestedComplexityVisitor(BaseNodeVisitor):
     We allow to nest function inside classes, that's called methods.
     """
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        NestedFunctionViolation,
+        NestedClassViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """
         Used to find nested classes in other classes and functions.
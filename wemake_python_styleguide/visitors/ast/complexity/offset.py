@@ -3,6 +3,7 @@ from typing import ClassVar, final
 
 from wemake_python_styleguide.compat.aliases import FunctionNodes
 from wemake_python_styleguide.logic.nodes import get_parent
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.complexity import (
     TooDeepNestingViolation,
 )
@@ -39,6 +40,9 @@ from wemake_python_styleguide.visitors.decorators import alias
 class OffsetVisitor(BaseNodeVisitor):
     """Checks offset values for several nodes."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (TooDeepNestingViolation,)
+    incremental: ClassVar[bool] = True
+
     #: Maximum number of blocks to nest different structures:
     _max_offset_blocks: ClassVar[int] = 5
 
@@ -3,17 +3,19 @@ from collections import defaultdict
 from collections.abc import Callable
 from typing import ClassVar, TypeAlias, final
 
-from wemake_python_styleguide.compat import nodes
 from wemake_python_styleguide.compat.aliases import FunctionNodes
 from wemake_python_styleguide.logic import source, walk
 from wemake_python_styleguide.logic.complexity import overuses
+from wemake_python_styleguide.logic.nodes import IN_FORMATTED_STRING, has_flag
 from wemake_python_styleguide.logic.tree import annotations
+from wemake_python_styleguide.logic.tree.structure import StructuralKeys
 from wemake_python_styleguide.types import AnyNodes, AnyTextPrimitive
 from wemake_python_styleguide.violations import complexity
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.visitors import base, decorators
 
 #: We use these types to store the number of nodes usage in different contexts.
-_Expressions: TypeAlias = defaultdict[str, list[ast.AST]]
+_Expressions: TypeAlias = defaultdict[int, list[ast.AST]]
 _FunctionExpressions: TypeAlias = defaultdict[ast.AST, _Expressions]
 _StringConstants: TypeAlias = frozenset[str | bytes]
 
@@ -35,6 +37,10 @@ class StringOveruseVisitor(base.BaseNodeVisitor):
     comma, dot).
     """
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.OverusedStringViolation,
+    )
+
     _ignored_string_constants: ClassVar[_StringConstants] = frozenset(
         (
             ' ',
@@ -85,10 +91,7 @@ class StringOveruseVisitor(base.BaseNodeVisitor):
             return
 
         # Part of the f-string or t-string:
-        if walk.get_closest_parent(
-            node,
-            parents=(ast.JoinedStr, nodes.TemplateStr),
-        ):
+        if has_flag(node, IN_FORMATTED_STRING):
             return
 
         # Some strings are so common, that it makes no sense to check if
@@ -121,6 +124,10 @@ class StringOveruseVisitor(base.BaseNodeVisitor):
 class ExpressionOveruseVisitor(base.BaseNodeVisitor):
     """Finds overused expressions."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.OverusedExpressionViolation,
+    )
+
     _expressions: ClassVar[AnyNodes] = (
         # We do not treat `ast.Attribute`s as expressions
         # because they are too widely used. That's a compromise.
@@ -157,6 +164,7 @@ class ExpressionOveruseVisitor(base.BaseNodeVisitor):
     def __init__(self, *args, **kwargs) -> None:
         """We need to track expression usage in functions and modules."""
         super().__init__(*args, **kwargs)
+        self._structural_keys = StructuralKeys()
         self._module_expressions: _Expressions = defaultdict(list)
         self._function_expressions: _FunctionExpressions = defaultdict(
             lambda: defaultdict(list),
@@ -172,33 +180,41 @@ class ExpressionOveruseVisitor(base.BaseNodeVisitor):
         if any(ignore(node) for ignore in self._ignore_predicates):
             return
 
-        source_code = source.node_to_string(node)
-        self._module_expressions[source_code].append(node)
+        # Expressions are grouped by structure, sources are rendered
+        # only for overused ones:
+        structural_key = self._structural_keys.get_key(node)
+        self._module_expressions[structural_key].append(node)
 
         maybe_function = walk.get_closest_parent(node, FunctionNodes)
         if maybe_function is not None:
-            self._function_expressions[maybe_function][source_code].append(
+            self._function_expressions[maybe_function][structural_key].append(
                 node,
             )
 
     def _post_visit(self) -> None:
-        for mod_source, module_nodes in self._module_expressions.items():
+        for module_nodes in self._module_expressions.values():
             if len(module_nodes) > self.options.max_module_expressions:
-                self.add_violation(
-                    complexity.OverusedExpressionViolation(
-                        module_nodes[0],
-                        text=self._msg.format(mod_source, len(module_nodes)),
-                        baseline=self.options.max_module_expressions,
-                    ),
+                self._add_overuse(
+                    module_nodes,
+                    self.options.max_module_expressions,
                 )
 
         for function_contexts in self._function_expressions.values():
-            for src, function_nodes in function_contexts.items():
+            for function_nodes in function_contexts.values():
                 if len(function_nodes) > self.options.max_function_expressions:
-                    self.add_violation(
-                        complexity.OverusedExpressionViolation(
-                            function_nodes[0],
-                            text=self._msg.format(src, len(function_nodes)),
-                            baseline=self.options.max_function_expressions,
-                        ),
+                    self._add_overuse(
+                        function_nodes,
+                        self.options.max_function_expressions,
                     )
+
+    def _add_overuse(self, overused: list[ast.AST], baseline: int) -> None:
+        self.add_violation(
+            complexity.OverusedExpressionViolation(
+                overused[0],
+                text=self._msg.format(
+                    source.node_to_string(overused[0]),
+                    len(overused),
+                ),
+                baseline=baseline,
+            ),
+        )
@@ -1,7 +1,9 @@
 import ast
-from typing import final
+from typing import ClassVar, final
 
+from wemake_python_styleguide.types import AnyNodes
 from wemake_python_styleguide.violations import complexity
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 
 
@@ -9,6 +11,13 @@ from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 class MatchSubjectsVisitor(BaseNodeVisitor):
     """Finds excessive match subjects in `match` statements."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.TooManyMatchSubjectsViolation,
+    )
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.Match,)
+
     def visit_Match(self, node: ast.Match) -> None:
         """Finds all `match` statements and checks their subjects."""
         self._check_match_subjects_count(node)
@@ -32,6 +41,13 @@ class MatchSubjectsVisitor(BaseNodeVisitor):
 class MatchCasesVisitor(BaseNodeVisitor):
     """Finds excessive match cases in `match` statements."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        complexity.TooManyMatchCaseViolation,
+    )
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.Match,)
+
     def visit_Match(self, node: ast.Match) -> None:
         """Finds all `match` statements and checks their cases."""
         self._check_match_cases_count(node)
@@ -4,7 +4,6 @@ from collections.abc import Mapping
 from typing import ClassVar, TypeAlias, final
 
 from wemake_python_styleguide.logic import source
-from wemake_python_styleguide.logic.nodes import get_context
 from wemake_python_styleguide.logic.tree import (
     attributes,
     compares,
@@ -13,16 +12,15 @@ from wemake_python_styleguide.logic.tree import (
     pattern_matching,
     sequence_pattern_matching,
 )
-from wemake_python_styleguide.logic.walk import (
-    are_variables_deleted,
-    get_names_from_target,
-)
+from wemake_python_styleguide.logic.walk import get_names_from_target
+from wemake_python_styleguide.logic.walk.symbols import get_symbols
 from wemake_python_styleguide.types import AnyIf, AnyNodes
 from wemake_python_styleguide.violations import (
     best_practices,
     consistency,
     refactoring,
 )
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 from wemake_python_styleguide.visitors.decorators import alias
 
@@ -40,6 +38,13 @@ _OperatorPairs: TypeAlias = Mapping[type[ast.boolop], type[ast.cmpop]]
 class IfStatementVisitor(BaseNodeVisitor):
     """Checks single and consecutive ``if`` statement nodes."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        refactoring.NegatedConditionsViolation,
+        refactoring.DuplicateIfConditionViolation,
+        refactoring.UselessTernaryViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _nodes_to_check: ClassVar[AnyNodes] = (
         ast.Name,
         ast.Attribute,
@@ -115,6 +120,11 @@ class IfStatementVisitor(BaseNodeVisitor):
 class BooleanConditionVisitor(BaseNodeVisitor):
     """Ensures that boolean conditions are correct."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        best_practices.SameElementsInConditionViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def __init__(self, *args, **kwargs) -> None:
         """We need to store some bool nodes not to visit them twice."""
         super().__init__(*args, **kwargs)
@@ -160,6 +170,13 @@ class BooleanConditionVisitor(BaseNodeVisitor):
 class MatchVisitor(BaseNodeVisitor):
     """Visits conditions in pattern matching."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        refactoring.DuplicateCasePatternViolation,
+    )
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.Match,)
+
     def visit_Match(self, node: ast.Match) -> None:
         """Finds issues in PM conditions."""
         self._check_duplicate_cases(node)
@@ -186,6 +203,11 @@ class MatchVisitor(BaseNodeVisitor):
 class ChainedIsVisitor(BaseNodeVisitor):
     """Is used to find chained `is` comparisons."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        refactoring.ChainedIsViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_Compare(self, node: ast.Compare) -> None:
         """Checks for chained 'is' operators in comparisons."""
         if len(node.ops) > 1 and all(
@@ -200,6 +222,13 @@ class ChainedIsVisitor(BaseNodeVisitor):
 class SimplifiableMatchVisitor(BaseNodeVisitor):
     """Checks for match statements that can be simplified to if/else."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        consistency.SimplifiableMatchViolation,
+    )
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.Match,)
+
     def visit_Match(self, node: ast.Match) -> None:
         """Checks match statements."""
         self._check_simplifiable_match(node)
@@ -234,28 +263,29 @@ class SimplifiableMatchVisitor(BaseNodeVisitor):
 class LeakingForLoopVisitor(BaseNodeVisitor):
     """Finds 'for' loops directly inside class or module bodies."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        best_practices.LeakingForLoopViolation,
+    )
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Checks that there are no 'for' loops inside class body."""
-        self._check_for_loops(node.body)
+        self._check_for_loops(node)
         self.generic_visit(node)
 
     def visit_Module(self, node: ast.Module) -> None:
         """Checks that there are no 'for' loops inside module body."""
-        self._check_for_loops(node.body)
+        self._check_for_loops(node)
         self.generic_visit(node)
 
-    def _check_for_loops(self, body: list[ast.stmt]) -> None:
-        for subnode in body:
+    def _check_for_loops(self, node: ast.ClassDef | ast.Module) -> None:
+        deleted = get_symbols(node).deleted
+        for subnode in node.body:
             if not isinstance(subnode, ast.For):
                 continue
 
             loop_vars = get_names_from_target(subnode.target)
 
-            if not are_variables_deleted(
-                loop_vars,
-                body,
-                context=get_context(subnode),
-            ):
+            if not loop_vars.issubset(deleted):
                 self.add_violation(
                     best_practices.LeakingForLoopViolation(subnode),
                 )
@@ -1,10 +1,11 @@
 import ast
-from typing import Final, final
+from typing import ClassVar, Final, final
 
 from wemake_python_styleguide.compat.constants import PY312
 from wemake_python_styleguide.logic.tree import attributes
 from wemake_python_styleguide.options.validation import ValidatedOptions
 from wemake_python_styleguide.types import AnyFunctionDef
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.best_practices import (
     NewStyledDecoratorViolation,
 )
@@ -34,6 +35,11 @@ _ALLOWED_DECORATOR_TYPES3_12: Final = (
 class WrongDecoratorVisitor(BaseNodeVisitor):
     """Checks decorators's correctness."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        NewStyledDecoratorViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def __init__(
         self,
         options: ValidatedOptions,
@@ -2,10 +2,12 @@ import ast
 from typing import ClassVar, final
 
 from wemake_python_styleguide.compat.aliases import FunctionNodes
+from wemake_python_styleguide.compat.nodes import TryStar
 from wemake_python_styleguide.compat.types import AnyTry
 from wemake_python_styleguide.logic import nodes
 from wemake_python_styleguide.logic.tree import exceptions
 from wemake_python_styleguide.types import AnyNodes
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.best_practices import (
     IncorrectExceptOrderViolation,
     NonTrivialExceptViolation,
@@ -29,6 +31,14 @@ from wemake_python_styleguide.visitors.decorators import alias
 class WrongTryExceptVisitor(BaseNodeVisitor):
     """Responsible for examining ``try`` and friends."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        IncorrectExceptOrderViolation,
+        UselessFinallyViolation,
+    )
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.Try, TryStar)
+
     def visit_any_try(self, node: AnyTry) -> None:
         """Used for find ``finally`` in ``try`` blocks without ``except``."""
         self._check_if_needs_except(node)
@@ -66,6 +76,11 @@ class WrongTryExceptVisitor(BaseNodeVisitor):
 class NestedTryBlocksVisitor(BaseNodeVisitor):
     """Ensures that there are no nested ``try`` blocks."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (NestedTryViolation,)
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.Try,)
+
     def visit_Try(self, node: ast.Try) -> None:
         """Visits all try nodes in the tree."""
         self._check_nested_try(node)
@@ -81,6 +96,13 @@ class NestedTryBlocksVisitor(BaseNodeVisitor):
 class WrongExceptHandlerVisitor(BaseNodeVisitor):
     """Responsible for examining ``ExceptionHandler``."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        NonTrivialExceptViolation,
+    )
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.ExceptHandler,)
+
     _trivial_except_arg_nodes: ClassVar[AnyNodes] = (ast.Name, ast.Attribute)
 
     def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
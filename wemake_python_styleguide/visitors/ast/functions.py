@@ -28,6 +28,7 @@ from wemake_python_styleguide.types import (
     AnyNodes,
 )
 from wemake_python_styleguide.violations import naming, oop
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.best_practices import (
     ComplexDefaultValueViolation,
     ForbidMappingProxyTypeViolation,
@@ -57,6 +58,14 @@ class WrongFunctionCallVisitor(base.BaseNodeVisitor):
     All these functions are defined in ``FUNCTIONS_BLACKLIST``.
     """
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        WrongFunctionCallViolation,
+        ForbidMappingProxyTypeViolation,
+        oop.WrongSuperCallViolation,
+        oop.WrongSuperCallAccessViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_Call(self, node: ast.Call) -> None:
         """Used to find ``FUNCTIONS_BLACKLIST`` calls."""
         self._check_wrong_function_called(node)
@@ -125,6 +134,13 @@ class WrongFunctionCallVisitor(base.BaseNodeVisitor):
 class WrongFunctionCallContextVisitor(base.BaseNodeVisitor):
     """Ensure that we call several functions in the correct context."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        OpenWithoutContextManagerViolation,
+        TypeCompareViolation,
+        ImplicitEnumerateViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_Call(self, node: ast.Call) -> None:
         """Visits function calls to find wrong contexts."""
         self._check_open_call_context(node)
@@ -209,6 +225,13 @@ class WrongFunctionCallContextVisitor(base.BaseNodeVisitor):
 class FunctionDefinitionVisitor(base.BaseNodeVisitor):
     """Responsible for checking function internals."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        naming.UnusedVariableIsUsedViolation,
+        StopIterationInsideGeneratorViolation,
+        oop.WrongDescriptorDecoratorViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _descriptor_decorators: ClassVar[frozenset[str]] = frozenset(
         (
             'classmethod',
@@ -306,6 +329,12 @@ class FunctionDefinitionVisitor(base.BaseNodeVisitor):
 class UselessLambdaDefinitionVisitor(base.BaseNodeVisitor):
     """This visitor is used specifically for ``lambda`` functions."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        UselessLambdaViolation,
+        ImplicitPrimitiveViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_Lambda(self, node: ast.Lambda) -> None:
         """Checks if ``lambda`` functions are defined correctly."""
         self._check_useless_lambda(node)
@@ -360,6 +389,13 @@ class FunctionSignatureVisitor(base.BaseNodeVisitor):
     Forbids to use getters with no output value.
     """
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        ComplexDefaultValueViolation,
+        GetterWithoutReturnViolation,
+        ProblematicFunctionParamsViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _allowed_default_value_types: ClassVar[AnyNodes] = (
         ast.Name,
         ast.Attribute,
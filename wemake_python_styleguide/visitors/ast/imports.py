@@ -1,7 +1,6 @@
 import ast
-from collections import defaultdict
-from itertools import product
-from typing import Final, TypeAlias, final
+from collections import Counter, defaultdict
+from typing import ClassVar, Final, TypeAlias, final
 
 from attrs import frozen
 
@@ -9,8 +8,11 @@ from wemake_python_styleguide.constants import FUTURE_IMPORTS_WHITELIST
 from wemake_python_styleguide.logic import nodes
 from wemake_python_styleguide.logic.tree import imports
 from wemake_python_styleguide.options.validation import ValidatedOptions
-from wemake_python_styleguide.types import AnyImport
-from wemake_python_styleguide.violations.base import ErrorCallback
+from wemake_python_styleguide.types import AnyImport, AnyNodes
+from wemake_python_styleguide.violations.base import (
+    ErrorCallback,
+    ViolationClasses,
+)
 from wemake_python_styleguide.violations.best_practices import (
     ForbidLazyImportViolation,
     FutureImportViolation,
@@ -122,19 +124,25 @@ class _ImportCollisionValidator:
         )
 
     def validate(self) -> None:
-        """Validates that there are no intersecting imported modules."""
-        for first, second in product(self._imported_names, repeat=2):
-            if first.module == second.module:
-                continue
-
-            if len(first.module) < len(second.module):
-                continue
-
-            if self._does_collide(first, second):
+        """
+        Validates that there are no intersecting imported modules.
+
+        Module collides with all imports of its direct parent module,
+        so parents are counted once instead of comparing all pairs.
+        """
+        imported_modules = Counter(
+            imported_name.module for imported_name in self._imported_names
+        )
+        for imported_name in self._imported_names:
+            parent_module = imported_name.module.rpartition(
+                _MODULE_MEMBERS_SEPARATOR,
+            )[0]
+            # Modules without parents get zero, since names are not empty:
+            for _ in range(imported_modules[parent_module]):
                 self._error_callback(
                     ImportCollisionViolation(
-                        first.node,
-                        second.module,
+                        imported_name.node,
+                        parent_module,
                     ),
                 )
 
@@ -171,20 +179,23 @@ class _ImportCollisionValidator:
                     ),
                 )
 
-    def _does_collide(
-        self,
-        first: imports.ImportedObjectInfo,
-        second: imports.ImportedObjectInfo,
-    ) -> bool:
-        first_path = first.module.split('.')[:-1]
-        second_path = second.module.split('.')
-        return first_path == second_path
-
 
 @final
 class WrongImportVisitor(BaseNodeVisitor):
     """Responsible for finding wrong imports."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        LocalFolderImportViolation,
+        DottedRawImportViolation,
+        VagueImportViolation,
+        FutureImportViolation,
+        ImportCollisionViolation,
+        ImportObjectCollisionViolation,
+        ForbidLazyImportViolation,
+    )
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.Import, ast.ImportFrom)
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a checker for tracked violations."""
         super().__init__(*args, **kwargs)
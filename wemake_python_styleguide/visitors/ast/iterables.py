@@ -3,6 +3,7 @@ from typing import ClassVar, final
 
 from wemake_python_styleguide.logic.nodes import get_parent
 from wemake_python_styleguide.types import AnyNodes
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.consistency import (
     IterableUnpackingViolation,
 )
@@ -13,6 +14,11 @@ from wemake_python_styleguide.visitors import base
 class IterableUnpackingVisitor(base.BaseNodeVisitor):
     """Checks iterables unpacking."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        IterableUnpackingViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _unpackable_iterable_parent_types: ClassVar[AnyNodes] = (
         ast.List,
         ast.Set,
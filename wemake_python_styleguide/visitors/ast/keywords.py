@@ -15,6 +15,7 @@ from wemake_python_styleguide.logic.tree.variables import (
     is_valid_block_variable_definition,
 )
 from wemake_python_styleguide.types import AnyFunctionDef, AnyNodes
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.best_practices import (
     ContextManagerVariableDefinitionViolation,
     RaiseFromItselfViolation,
@@ -40,6 +41,14 @@ _ReturningViolations: TypeAlias = (
 class WrongRaiseVisitor(BaseNodeVisitor):
     """Finds wrong ``raise`` keywords."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        RaiseSystemExitViolation,
+        RaiseFromItselfViolation,
+    )
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.Raise,)
+
     _system_error_name: ClassVar[str] = 'SystemExit'
 
     def visit_Raise(self, node: ast.Raise) -> None:
@@ -70,6 +79,12 @@ class WrongRaiseVisitor(BaseNodeVisitor):
 class ConsistentReturningVisitor(BaseNodeVisitor):
     """Finds incorrect and inconsistent ``return`` and ``yield`` nodes."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        InconsistentReturnViolation,
+        InconsistentYieldViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_Return(self, node: ast.Return) -> None:
         """Checks ``return`` statements for consistency."""
         self._check_last_return_in_function(node)
@@ -163,6 +178,16 @@ class ConsistentReturningVisitor(BaseNodeVisitor):
 class WrongKeywordVisitor(BaseNodeVisitor):
     """Finds wrong keywords."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (WrongKeywordViolation,)
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (
+        ast.Delete,
+        ast.Global,
+        ast.Nonlocal,
+        ast.Pass,
+    )
+
     def visit_forbidden_keyword(self, node: ast.AST) -> None:
         """Used to find wrong keywords."""
         self._check_keyword(node)
@@ -187,6 +212,11 @@ class WrongKeywordVisitor(BaseNodeVisitor):
 class WrongContextManagerVisitor(BaseNodeVisitor):
     """Checks context managers."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        ContextManagerVariableDefinitionViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_withitem(self, node: ast.withitem) -> None:
         """Variables inside context managers must be defined correctly."""
         self._check_variable_definitions(node)
@@ -206,6 +236,13 @@ class WrongContextManagerVisitor(BaseNodeVisitor):
 class GeneratorKeywordsVisitor(BaseNodeVisitor):
     """Checks how generators are defined and used."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        IncorrectYieldFromTargetViolation,
+    )
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.YieldFrom,)
+
     _allowed_nodes: ClassVar[AnyNodes] = (
         ast.Name,
         ast.Call,
@@ -234,6 +271,11 @@ class GeneratorKeywordsVisitor(BaseNodeVisitor):
 class ConstantKeywordVisitor(BaseNodeVisitor):
     """Visits keyword definitions to detect constant conditions."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        WrongKeywordConditionViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _forbidden_nodes: ClassVar[AnyNodes] = (
         ast.Constant,
         ast.List,
@@ -15,6 +15,7 @@ from wemake_python_styleguide.types import (
     AnyLoop,
     AnyNodes,
 )
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.best_practices import (
     AwaitInLoopViolation,
     InfiniteWhileLoopViolation,
@@ -52,6 +53,11 @@ _ContainerSpec: TypeAlias = Mapping[type[ast.AST], Sequence[str]]
 class WrongComprehensionVisitor(base.BaseNodeVisitor):
     """Checks comprehensions for correctness."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        TooManyForsInComprehensionViolation,
+        MultipleIfsInComprehensionViolation,
+    )
+
     _max_ifs: ClassVar[int] = 1
     _max_fors: ClassVar[int] = 2
 
@@ -108,6 +114,14 @@ class WrongComprehensionVisitor(base.BaseNodeVisitor):
 class WrongLoopVisitor(base.BaseNodeVisitor):
     """Responsible for examining loops."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        UselessContinueViolation,
+        LambdaInsideLoopViolation,
+        InfiniteWhileLoopViolation,
+        UselessLoopElseViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _can_break_loop: ClassVar[AnyNodes] = (
         ast.Break,
         ast.Return,
@@ -194,6 +208,13 @@ class WrongLoopVisitor(base.BaseNodeVisitor):
 class WrongLoopDefinitionVisitor(base.BaseNodeVisitor):
     """Responsible for ``for`` loops and comprehensions definitions."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        WrongLoopIterTypeViolation,
+        LoopVariableDefinitionViolation,
+        ImplicitSumViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _forbidden_for_iters: ClassVar[AnyNodes] = (
         ast.List,
         ast.ListComp,
@@ -246,6 +267,11 @@ class WrongLoopDefinitionVisitor(base.BaseNodeVisitor):
 class WrongStatementInLoopVisitor(base.BaseNodeVisitor):
     """Responsible for statements inside loops."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (AwaitInLoopViolation,)
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.Await,)
+
     _forbidden_await_loops: ClassVar[AnyNodes] = (
         ast.For,
         ast.DictComp,
@@ -8,6 +8,7 @@ from wemake_python_styleguide.logic.naming.constants import is_constant
 from wemake_python_styleguide.logic.nodes import get_context
 from wemake_python_styleguide.logic.tree.strings import is_doc_string
 from wemake_python_styleguide.types import AnyAssign, AnyNodes
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.best_practices import (
     BadMagicModuleFunctionViolation,
     EmptyModuleViolation,
@@ -22,6 +23,11 @@ from wemake_python_styleguide.visitors.decorators import alias
 class EmptyModuleContentsVisitor(BaseNodeVisitor):
     """Restricts to have empty modules."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        EmptyModuleViolation,
+        InitModuleHasLogicViolation,
+    )
+
     def visit_Module(self, node: ast.Module) -> None:
         """
         Checks that module has something other than module definition.
@@ -69,6 +75,10 @@ class EmptyModuleContentsVisitor(BaseNodeVisitor):
 class MagicModuleFunctionsVisitor(BaseNodeVisitor):
     """Restricts to use magic module functions."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        BadMagicModuleFunctionViolation,
+    )
+
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """
         Checks that module hasn't magic module functions.
@@ -99,6 +109,10 @@ class MagicModuleFunctionsVisitor(BaseNodeVisitor):
 class ModuleConstantsVisitor(BaseNodeVisitor):
     """Finds incorrect module constants."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        MutableModuleConstantViolation,
+    )
+
     _mutable_nodes: ClassVar[AnyNodes] = (
         ast.Dict,
         ast.List,
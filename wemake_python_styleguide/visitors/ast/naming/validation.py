@@ -286,6 +286,21 @@ class _ClassBasedNameValidator(_RegularNameValidator):
 class WrongNameVisitor(BaseNodeVisitor):
     """Performs checks based on variable names."""
 
+    emitted_violations: ClassVar[base.ViolationClasses] = (
+        naming.WrongVariableNameViolation,
+        naming.TooShortNameViolation,
+        naming.PrivateNameViolation,
+        naming.UnderscoredNumberNameViolation,
+        naming.UpperCaseAttributeViolation,
+        naming.ConsecutiveUnderscoresInNameViolation,
+        naming.ReservedArgumentNameViolation,
+        naming.TooLongNameViolation,
+        naming.TrailingUnderscoreViolation,
+        naming.WrongUnusedVariableNameViolation,
+        naming.UnreadableNameViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def __init__(self, *args, **kwargs) -> None:
         """Initializes new naming validator for this visitor."""
         super().__init__(*args, **kwargs)
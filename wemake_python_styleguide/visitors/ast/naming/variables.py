@@ -1,6 +1,6 @@
 import ast
 from collections.abc import Iterable
-from typing import cast, final
+from typing import ClassVar, cast, final
 
 from wemake_python_styleguide.compat.functions import get_assign_targets
 from wemake_python_styleguide.constants import (
@@ -15,6 +15,7 @@ from wemake_python_styleguide.types import (
     AnyFor,
 )
 from wemake_python_styleguide.violations import best_practices, naming
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 from wemake_python_styleguide.visitors.decorators import alias
 
@@ -30,6 +31,10 @@ from wemake_python_styleguide.visitors.decorators import alias
 class WrongModuleMetadataVisitor(BaseNodeVisitor):
     """Finds wrong metadata information of a module."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        best_practices.WrongModuleMetadataViolation,
+    )
+
     def visit_any_assign(self, node: AnyAssign) -> None:
         """Used to find the bad metadata variable names."""
         self._check_metadata(node)
@@ -76,6 +81,10 @@ class WrongModuleMetadataVisitor(BaseNodeVisitor):
 class UnusedVariableDefinitionVisitor(BaseNodeVisitor):
     """Checks how variables are used."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        naming.UnusedVariableIsDefinedViolation,
+    )
+
     def visit_any_assign(self, node: AnyAssignWithWalrus) -> None:
         """
         Checks that we cannot assign explicit unused variables.
@@ -161,6 +170,11 @@ class UnusedVariableDefinitionVisitor(BaseNodeVisitor):
 class UnusedVariableUsageVisitor(BaseNodeVisitor):
     """Checks how variables are used."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        naming.UnusedVariableIsUsedViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_Name(self, node: ast.Name) -> None:
         """Checks that we cannot use unused variables anywhere."""
         self._check_variable_used(
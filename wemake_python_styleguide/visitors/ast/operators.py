@@ -14,6 +14,7 @@ from wemake_python_styleguide.logic.tree.operators import (
 )
 from wemake_python_styleguide.types import AnyNodes
 from wemake_python_styleguide.violations import consistency
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.best_practices import (
     ListMultiplyViolation,
 )
@@ -38,6 +39,14 @@ _UnaryOperatorsChain: TypeAlias = Sequence[type[ast.unaryop]]
 class UselessOperatorsVisitor(base.BaseNodeVisitor):  # noqa: WPS214
     """Checks operators used in the code."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        consistency.UselessOperatorsViolation,
+        consistency.ZeroDivisionViolation,
+        consistency.MeaninglessNumberOperationViolation,
+        consistency.MeaninglessBooleanOperationViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _unary_limits: ClassVar[_OperatorLimits] = {
         ast.UAdd: 0,
         ast.Invert: 1,
@@ -239,6 +248,13 @@ class UselessOperatorsVisitor(base.BaseNodeVisitor):  # noqa: WPS214
 class WrongMathOperatorVisitor(base.BaseNodeVisitor):
     """Checks that there are not wrong math operations."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        consistency.ExplicitStringConcatViolation,
+        consistency.OperationSignNegationViolation,
+        ListMultiplyViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _string_nodes: ClassVar[AnyNodes] = (
         TextNodes,
         ast.JoinedStr,
@@ -309,6 +325,13 @@ class WrongMathOperatorVisitor(base.BaseNodeVisitor):
 class WalrusVisitor(base.BaseNodeVisitor):
     """We use this visitor to find walrus operators and ban them."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        consistency.WalrusViolation,
+    )
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.NamedExpr,)
+
     _comprehensions: ClassVar[AnyNodes] = (
         ast.ListComp,
         ast.SetComp,
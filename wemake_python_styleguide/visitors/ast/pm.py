@@ -3,6 +3,7 @@ from typing import ClassVar, final
 
 from wemake_python_styleguide.logic.tree import pattern_matching
 from wemake_python_styleguide.types import AnyNodes
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.refactoring import (
     ExtraMatchSubjectSyntaxViolation,
 )
@@ -13,6 +14,13 @@ from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 class MatchSubjectVisitor(BaseNodeVisitor):
     """Restricts the incorrect subjects in PM."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        ExtraMatchSubjectSyntaxViolation,
+    )
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.Match,)
+
     _forbidden_syntax: ClassVar[AnyNodes] = (
         ast.Dict,
         ast.Set,
@@ -1,7 +1,8 @@
 import ast
-from typing import final
+from typing import ClassVar, final
 
 from wemake_python_styleguide.types import AnyComprehension, AnyFor
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.best_practices import (
     RedundantEnumerateViolation,
 )
@@ -29,6 +30,11 @@ from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 class RedundantEnumerateVisitor(BaseNodeVisitor):
     """Responsible for detecting redundant usages of ``enumerate`` function."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        RedundantEnumerateViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_any_comprehension(self, node: AnyComprehension) -> None:
         """Finds incorrect patterns inside comprehensions."""
         for generator_node in node.generators:
@@ -14,6 +14,7 @@ from wemake_python_styleguide.logic.tree.collections import (
     first,
     sequence_of_node,
 )
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.best_practices import (
     UnreachableCodeViolation,
     WrongNamedKeywordViolation,
@@ -74,6 +75,13 @@ class StatementsWithBodiesVisitor(BaseNodeVisitor):
     This visitor checks all statements that have multiline bodies.
     """
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        UselessNodeViolation,
+        UnreachableCodeViolation,
+        AlmostSwappedViolation,
+        MisrefactoredAssignmentViolation,
+    )
+
     _closing_nodes: ClassVar[types.AnyNodes] = (
         ast.Raise,
         ast.Return,
@@ -209,6 +217,11 @@ class StatementsWithBodiesVisitor(BaseNodeVisitor):
 class PointlessStarredVisitor(BaseNodeVisitor):
     """Responsible for absence of useless starred expressions."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        PointlessStarredViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _pointless_star_nodes: ClassVar[types.AnyNodes] = (
         ast.Dict,
         ast.List,
@@ -266,6 +279,11 @@ class PointlessStarredVisitor(BaseNodeVisitor):
 class WrongNamedKeywordVisitor(BaseNodeVisitor):
     """Responsible for absence of wrong keywords."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        WrongNamedKeywordViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_Call(self, node: ast.Call) -> None:
         """Checks useless call arguments."""
         self._check_double_starred_dict(node.keywords)
@@ -300,6 +318,11 @@ class WrongNamedKeywordVisitor(BaseNodeVisitor):
 class AssignmentPatternsVisitor(BaseNodeVisitor):
     """Responsible for checking assignment patterns."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        AugmentedAssignPatternViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_Assign(self, node: ast.Assign) -> None:
         """Checks assignment patterns."""
         self._check_augmented_assign_pattern(node)
@@ -329,6 +352,11 @@ class AssignmentPatternsVisitor(BaseNodeVisitor):
 class WrongMethodArgumentsVisitor(BaseNodeVisitor):
     """Ensures that all arguments follow our rules."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        NotATupleArgumentViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     _no_tuples_collections: ClassVar[types.AnyNodes] = (
         ast.List,
         ast.ListComp,
@@ -7,11 +7,13 @@ from wemake_python_styleguide.logic.tokens.subscripts import (
     has_redundant_step,
 )
 from wemake_python_styleguide.logic.tree import functions, operators, slices
+from wemake_python_styleguide.types import AnyNodes
 from wemake_python_styleguide.violations import (
     best_practices,
     consistency,
     refactoring,
 )
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.visitors import base
 
 
@@ -19,6 +21,12 @@ from wemake_python_styleguide.visitors import base
 class SubscriptVisitor(base.BaseNodeTokenVisitor):
     """Checks subscripts used in the code."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        consistency.RedundantSubscriptViolation,
+        consistency.AssignToSliceViolation,
+        best_practices.ConsecutiveSlicesViolation,
+    )
+
     _marked_slices: ClassVar[set[ast.Subscript]] = set()
 
     def visit_Subscript(self, node: ast.Subscript) -> None:
@@ -61,7 +69,7 @@ class SubscriptVisitor(base.BaseNodeTokenVisitor):
         if not isinstance(node.slice, ast.Slice):
             return
 
-        if has_redundant_step(node, self.file_tokens):
+        if has_redundant_step(node, self.token_index.get_span(node)):
             self.add_violation(consistency.RedundantSubscriptViolation(node))
 
         lower_ok = node.slice.lower is None or (
@@ -126,6 +134,11 @@ class SubscriptVisitor(base.BaseNodeTokenVisitor):
 class ImplicitDictGetVisitor(base.BaseNodeVisitor):
     """Checks for correct ``.get`` usage in code."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        refactoring.ImplicitDictGetViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_If(self, node: ast.If) -> None:
         """Checks the compares."""
         self._check_implicit_get(node)
@@ -157,6 +170,12 @@ class ImplicitDictGetVisitor(base.BaseNodeVisitor):
 class CorrectKeyVisitor(base.BaseNodeVisitor):
     """Checks for correct keys usage in your code."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        best_practices.FloatKeyViolation,
+        refactoring.ImplicitNegativeIndexViolation,
+    )
+    incremental: ClassVar[bool] = True
+
     def visit_Subscript(self, node: ast.Subscript) -> None:
         """Checks that key usage is correct, without any errors."""
         self._check_float_key(node)
@@ -202,6 +221,13 @@ class CorrectKeyVisitor(base.BaseNodeVisitor):
 class StrictSliceOperations(base.BaseNodeVisitor):
     """Check for stricter operation with slices."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        best_practices.NonStrictSliceOperationsViolation,
+    )
+    incremental: ClassVar[bool] = True
+
+    interesting_node_types: ClassVar[AnyNodes] = (ast.Slice,)
+
     def visit_Slice(self, node: ast.Slice) -> None:
         """Visit slice."""
         self._check_reverse(node)
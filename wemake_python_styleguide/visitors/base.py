@@ -63,14 +63,33 @@ Reference
 import abc
 import ast
 import tokenize
-from collections.abc import Sequence
-from typing import final
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, ClassVar, TypeAlias, final
 
 from wemake_python_styleguide import constants
-from wemake_python_styleguide.compat.routing import route_visit
+from wemake_python_styleguide.compat.routing import (
+    DispatchTable,
+    build_dispatch_table,
+    route_visit,
+)
 from wemake_python_styleguide.logic.filenames import get_stem
+from wemake_python_styleguide.logic.tokens.index import TokenIndex
+from wemake_python_styleguide.logic.walk.census import (
+    get_census,
+    get_outermost_nodes,
+)
 from wemake_python_styleguide.options.validation import ValidatedOptions
-from wemake_python_styleguide.violations.base import BaseViolation
+from wemake_python_styleguide.types import AnyNodes
+from wemake_python_styleguide.violations.base import (
+    BaseViolation,
+    ViolationClasses,
+)
+
+#: Maps token exact types to visitor's methods that handle them.
+TokenDispatchTable: TypeAlias = Mapping[
+    int,
+    Callable[[Any, tokenize.TokenInfo], None],
+]
 
 
 class BaseVisitor(abc.ABC):
@@ -82,9 +101,14 @@ class BaseVisitor(abc.ABC):
         filename: filename passed by ``flake8``, each visitor has a file name.
         violations: list of :term:`violations <violation>`
         for the specific visitor.
+        emitted_violations: all violation classes that this visitor can emit.
+            Visitors are not executed when all of them are not selected.
+            Visitors without this declaration are always executed.
 
     """
 
+    emitted_violations: ClassVar[ViolationClasses] = ()
+
     def __init__(
         self,
         options: ValidatedOptions,
@@ -128,6 +152,14 @@ class BaseVisitor(abc.ABC):
         to do when it was told to ``run``.
         """
 
+    def _pre_visit(self) -> None:  # noqa: B027
+        """
+        Executed before any node is visited.
+
+        This method is useful for building indexes, etc.
+        By default does nothing.
+        """
+
     def _post_visit(self) -> None:  # noqa: B027
         """
         Executed after all nodes have been visited.
@@ -146,9 +178,28 @@ class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor):
 
     Attributes:
         tree: ``ast`` tree to be checked.
+        dispatch_table: node types and their handlers,
+            it is created for each subclass, when it is defined.
+        interesting_node_types: node types that this visitor handles.
+            When defined, only nodes of these types and their children
+            are visited, other parts of the tree are skipped.
+            It must contain all node types that have handlers.
+            By default, the whole tree is visited.
+        incremental: whether violations inside a top-level definition
+            depend only on this definition. Such visitors skip
+            unchanged definitions in the incremental mode.
 
     """
 
+    dispatch_table: ClassVar[DispatchTable] = {}
+    interesting_node_types: ClassVar[AnyNodes] = ()
+    incremental: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Creates a dispatch table for each new visitor class."""
+        super().__init_subclass__(**kwargs)
+        cls.update_dispatch_table()
+
     def __init__(
         self,
         options: ValidatedOptions,
@@ -159,6 +210,11 @@ class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor):
         super().__init__(options, **kwargs)
         self.tree = tree
 
+    @classmethod
+    def update_dispatch_table(cls) -> None:
+        """Recreates the dispatch table, when handlers are added later."""
+        cls.dispatch_table = build_dispatch_table(cls)
+
     @final
     @classmethod
     def from_checker(
@@ -184,12 +240,21 @@ class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor):
 
         Some classes do redefine this method to catch all nodes. This is valid.
         """
-        return route_visit(self, tree)
+        return route_visit(self, tree, self.dispatch_table)
 
     @final
     def run(self) -> None:
         """Recursively visits all ``ast`` nodes. Then executes post hook."""
-        self.visit(self.tree)
+        self._pre_visit()
+        census = get_census(self.tree)
+        if census is None or not self.interesting_node_types:
+            self.visit(self.tree)
+        else:
+            for node in get_outermost_nodes(
+                census,
+                self.interesting_node_types,
+            ):
+                self.visit(node)
         self._post_visit()
 
 
@@ -217,6 +282,7 @@ class BaseFilenameVisitor(BaseVisitor, abc.ABC):
         """
         if self.filename != constants.STDIN:
             self.stem = get_stem(self.filename)
+            self._pre_visit()
             self.visit_filename()
             self._post_visit()
 
@@ -227,19 +293,40 @@ class BaseTokenVisitor(BaseVisitor):
 
     Attributes:
         file_tokens: ``tokenize.TokenInfo`` sequence to be checked.
+        token_index: lookups over ``file_tokens``, like tokens by lines.
+        dispatch_table: token exact types and their handlers,
+            it is created for each subclass, when it is defined.
 
     """
 
+    dispatch_table: ClassVar[TokenDispatchTable] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Creates a dispatch table for each new visitor class."""
+        super().__init_subclass__(**kwargs)
+        cls.update_dispatch_table()
+
     def __init__(
         self,
         options: ValidatedOptions,
         file_tokens: Sequence[tokenize.TokenInfo],
+        token_index: TokenIndex | None = None,
         **kwargs,
     ) -> None:
-        """Creates new ``tokenize`` based visitor instance."""
+        """
+        Creates new ``tokenize`` based visitor instance.
+
+        Visitors created by the checker share its ``token_index``,
+        other ones create their own.
+        """
         super().__init__(options, **kwargs)
         self.file_tokens = file_tokens
-        self.token_index = -1
+        self.token_index = token_index or TokenIndex(file_tokens)
+
+    @classmethod
+    def update_dispatch_table(cls) -> None:
+        """Recreates the dispatch table, when handlers are added later."""
+        cls.dispatch_table = _build_token_dispatch_table(cls)
 
     @final
     @classmethod
@@ -252,6 +339,7 @@ class BaseTokenVisitor(BaseVisitor):
             options=checker.options,
             filename=checker.filename,
             file_tokens=checker.file_tokens,
+            token_index=checker.token_index,
         )
 
     def visit(self, token: tokenize.TokenInfo) -> None:
@@ -271,35 +359,64 @@ class BaseTokenVisitor(BaseVisitor):
             https://docs.python.org/3/library/tokenize.html
 
         """
-        token_type = tokenize.tok_name[token.exact_type].lower()
-        method = getattr(self, f'visit_{token_type}', None)
-        if method is not None:
-            method(token)
+        visit_method = self.dispatch_table.get(token.exact_type)
+        if visit_method is not None:
+            visit_method(self, token)
+
+    def visit_token_stream(
+        self,
+        file_tokens: Sequence[tokenize.TokenInfo],
+    ) -> None:
+        """
+        Visits the whole stream of tokens at once.
+
+        By default, it calls :meth:`visit` for each token.
+        Redefine it in visitors that need to see all tokens together.
+        """
+        for token in file_tokens:
+            self.visit(token)
 
     @final
     def run(self) -> None:
         """Visits all token types that have a handler method."""
-        for token in self.file_tokens:
-            self.visit(token)
+        self._pre_visit()
+        self.visit_token_stream(self.file_tokens)
         self._post_visit()
 
 
 class BaseNodeTokenVisitor(ast.NodeVisitor, BaseVisitor):
     """Allows storing violations during node tree traversal with real values."""
 
+    dispatch_table: ClassVar[DispatchTable] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Creates a dispatch table for each new visitor class."""
+        super().__init_subclass__(**kwargs)
+        cls.update_dispatch_table()
+
     def __init__(
         self,
         options: ValidatedOptions,
         tree: ast.AST,
         file_tokens: Sequence[tokenize.TokenInfo],
+        token_index: TokenIndex | None = None,
         **kwargs,
     ) -> None:
-        """Creates new ``ast`` based instance with tokens."""
+        """
+        Creates new ``ast`` based instance with tokens.
+
+        Visitors created by the checker share its ``token_index``,
+        other ones create their own.
+        """
         super().__init__(options, **kwargs)
         self.tree = tree
         self.file_tokens = file_tokens
-        self._token_index = -1
-        self._token_dict: dict[tuple[int, int], tokenize.TokenInfo] = {}
+        self.token_index = token_index or TokenIndex(file_tokens)
+
+    @classmethod
+    def update_dispatch_table(cls) -> None:
+        """Recreates the dispatch table, when handlers are added later."""
+        cls.dispatch_table = build_dispatch_table(cls)
 
     @final
     @classmethod
@@ -312,20 +429,32 @@ class BaseNodeTokenVisitor(ast.NodeVisitor, BaseVisitor):
             options=checker.options,
             filename=checker.filename,
             file_tokens=checker.file_tokens,
+            token_index=checker.token_index,
             tree=checker.tree,
         )
 
     def visit(self, tree: ast.AST) -> None:
         """This method does the same as :meth:`BaseNodeVisitor.visit`."""
-        return route_visit(self, tree)
+        return route_visit(self, tree, self.dispatch_table)
 
     @final
     def run(self) -> None:
-        """Recursively visits all ``ast`` nodes and create ``token_dict``."""
-        self._create_token_dict()
+        """Recursively visits all ``ast`` nodes. Then executes post hook."""
+        self._pre_visit()
         self.visit(self.tree)
         self._post_visit()
 
-    def _create_token_dict(self) -> None:
-        """Create a token dict."""
-        self._token_dict = {token.start: token for token in self.file_tokens}
+
+def _build_token_dispatch_table(
+    visitor_class: type[BaseTokenVisitor],
+) -> TokenDispatchTable:
+    dispatch_table = {}
+    for exact_type, token_name in tokenize.tok_name.items():
+        visit_method = getattr(
+            visitor_class,
+            f'visit_{token_name.lower()}',
+            None,
+        )
+        if visit_method is not None:
+            dispatch_table[exact_type] = visit_method
+    return dispatch_table
@@ -21,6 +21,12 @@ def _modify_class(
                 f'Alias {method_alias} already exists',
             )
         setattr(cls, method_alias, original_handler)
+
+    update_dispatch_table = getattr(cls, 'update_dispatch_table', None)
+    if update_dispatch_table is not None:
+        # Aliases are created after the class itself,
+        # so we need to recreate its dispatch table:
+        update_dispatch_table()
     return cls
 
 
@@ -0,0 +1,351 @@
+"""
+Engines to run many :term:`visitors <visitor>` at once.
+
+Fused engine
+------------
+
+By default, each visitor walks the whole module on its own.
+So, the same module is traversed once per visitor.
+
+Fused engine walks the tree only once.
+It dispatches each node to all visitors that have a handler for it.
+
+.. mermaid::
+   :caption: Fused engine relation with visitors.
+
+    graph TD
+        E1[Engine] --> N1[Node 1]
+        N1 --> V1[Visitor 1]
+        N1 --> V2[Visitor 2]
+        E1[Engine] --> N2[Node 2]
+        N2 --> V2[Visitor 2]
+
+How does it work?
+
+1. We call ``_pre_visit`` hooks of all visitors
+2. We walk the tree in the same order as ``ast.NodeVisitor`` does
+3. We call ``visit_`` handlers of each visitor for each node
+4. We call ``_post_visit`` hooks of all visitors
+
+We rely on the fact that ``self.generic_visit(node)`` is always
+the last statement in ``visit_`` methods.
+See ``scripts/check_generic_visit.py`` for more details.
+
+When a handler does not call ``self.generic_visit(node)``,
+children of this node are not visited by this visitor.
+Just like with the regular ``ast.NodeVisitor``.
+
+Token multiplexer
+-----------------
+
+All ``tokenize`` based visitors share the same stream of tokens.
+Token multiplexer iterates over this stream only once
+and passes each token to the handlers of all visitors
+that are interested in this token's type.
+
+Visitors that need to see all tokens together
+redefine ``visit_token_stream`` method.
+They receive the whole stream with a single call.
+
+Profiling
+---------
+
+Both engines accept an optional :class:`VisitorTimer`.
+It measures the time of each call to a visitor,
+so visitors can be profiled while they are still run together.
+
+"""
+
+import ast
+import time
+import tokenize
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from functools import partial
+from typing import TypeAlias, final
+
+from wemake_python_styleguide.compat.routing import dispatch_key
+from wemake_python_styleguide.visitors import base
+
+#: All visitors that can be fused together.
+FusedVisitor: TypeAlias = base.BaseNodeVisitor | base.BaseNodeTokenVisitor
+
+_VisitMethod: TypeAlias = Callable[[ast.AST], object]
+_Subscriber: TypeAlias = tuple[FusedVisitor, _VisitMethod, '_DescendHook']
+_Pruned: TypeAlias = frozenset[FusedVisitor]
+_TokenHandlers: TypeAlias = defaultdict[
+    int,
+    list[tuple[base.BaseTokenVisitor, Callable[..., None]]],
+]
+
+#: Visitor's ``visit`` implementations that route nodes to handlers.
+_ROUTERS = frozenset((
+    base.BaseNodeVisitor.visit,
+    base.BaseNodeTokenVisitor.visit,
+))
+
+#: Token visitor's methods that route tokens to handlers.
+_TOKEN_ROUTERS = frozenset((
+    base.BaseTokenVisitor.visit,
+    base.BaseTokenVisitor.visit_token_stream,
+))
+
+
+def handles_all_nodes(visitor: FusedVisitor) -> bool:
+    """Tells whether the visitor redefines ``visit`` to catch all nodes."""
+    return type(visitor).visit not in _ROUTERS
+
+
+@final
+class VisitorTimer:
+    """
+    Sums the time spent in each visitor.
+
+    Attributes:
+        seconds: wall time spent in each called visitor.
+
+    """
+
+    def __init__(self) -> None:
+        """Creates timer without any measurements."""
+        self.seconds: defaultdict[base.BaseVisitor, float] = defaultdict(
+            float,
+        )
+
+    def call(
+        self,
+        visitor: base.BaseVisitor,
+        method: Callable[..., object],
+        *args: object,
+    ) -> None:
+        """Calls the method of a visitor and measures its time."""
+        start = time.perf_counter()
+        method(*args)
+        self.seconds[visitor] += time.perf_counter() - start
+
+
+@final
+class _DescendHook:
+    """
+    Replaces ``generic_visit`` method of a visitor during fused traversal.
+
+    When it is called with the node that is currently dispatched,
+    it just remembers that children of this node must be visited.
+
+    Calls with any other nodes fallback to the regular recursive traversal.
+    """
+
+    __slots__ = ('_visitor', 'descended', 'node')
+
+    def __init__(self, visitor: FusedVisitor) -> None:
+        self._visitor = visitor
+        self.node: ast.AST | None = None
+        self.descended = False
+
+    def __call__(self, node: ast.AST) -> None:
+        if node is self.node:
+            self.descended = True
+        else:
+            ast.NodeVisitor.generic_visit(self._visitor, node)
+
+
+@final
+class FusedEngine:
+    """
+    Runs many ``ast`` visitors with a single tree traversal.
+
+    Attributes:
+        visitors: visitors that are run by this engine.
+
+    """
+
+    def __init__(
+        self,
+        visitors: Sequence[FusedVisitor],
+        on_error: Callable[[base.BaseVisitor], None],
+        timer: VisitorTimer | None = None,
+    ) -> None:
+        """
+        Creates new engine.
+
+        Arguments:
+            visitors: visitors to run, order is preserved.
+            on_error: callback to report failures of visitors,
+                it is called inside the ``except`` block.
+            timer: measures visitors, when they are profiled.
+
+        """
+        self.visitors = list(visitors)
+        self._on_error = on_error
+        self._timer = timer
+        self._hooks = {visitor: _DescendHook(visitor) for visitor in visitors}
+        self._subscribers: dict[type, list[_Subscriber]] = {}
+
+    def run(self, tree: ast.AST) -> None:
+        """Visits all nodes of the ``tree`` once for all visitors."""
+        for visitor, hook in self._hooks.items():
+            setattr(visitor, 'generic_visit', hook)  # noqa: B010
+        for visitor in self.visitors.copy():
+            self._safe_call(visitor, visitor._pre_visit)  # noqa: SLF001
+
+        self._traverse(tree)
+
+        for visitor in self.visitors.copy():
+            self._safe_call(visitor, visitor._post_visit)  # noqa: SLF001
+        for hooked_visitor in self._hooks:
+            del hooked_visitor.generic_visit  # noqa: WPS420
+
+    def _traverse(self, tree: ast.AST) -> None:
+        nothing_pruned: _Pruned = frozenset()
+        stack = [(tree, nothing_pruned)]
+        while stack:
+            node, pruned = stack.pop()
+            pruned = self._dispatch(node, pruned)
+            stack.extend(
+                (child, pruned)
+                for child in reversed(list(ast.iter_child_nodes(node)))
+            )
+
+    def _dispatch(self, node: ast.AST, pruned: _Pruned) -> _Pruned:
+        for visitor, visit_method, hook in self._subscribers_for(node):
+            if visitor in pruned:
+                continue
+
+            hook.node = node
+            hook.descended = False
+            is_called = self._safe_call(visitor, visit_method, node)
+            if is_called and not hook.descended:
+                pruned = pruned.union((visitor,))
+        return pruned
+
+    def _subscribers_for(self, node: ast.AST) -> list[_Subscriber]:
+        key = dispatch_key(node)
+        subscribers = self._subscribers.get(key)
+        if subscribers is None:
+            subscribers = self._subscribe(key)
+        return subscribers
+
+    def _subscribe(self, key: type) -> list[_Subscriber]:
+        subscribers: list[_Subscriber] = []
+        for visitor in self.visitors:
+            visit_method: _VisitMethod | None = None
+            if handles_all_nodes(visitor):
+                visit_method = visitor.visit
+            else:
+                unbound_method = visitor.dispatch_table.get(key)
+                if unbound_method is not None:
+                    visit_method = partial(unbound_method, visitor)
+            if visit_method is not None:
+                subscribers.append(
+                    (visitor, visit_method, self._hooks[visitor]),
+                )
+        self._subscribers[key] = subscribers
+        return subscribers
+
+    def _safe_call(
+        self,
+        visitor: FusedVisitor,
+        method: Callable[..., object],
+        *args: ast.AST,
+    ) -> bool:
+        try:
+            if self._timer is None:
+                method(*args)
+            else:
+                self._timer.call(visitor, method, *args)
+        except Exception:
+            # Failed visitor is not called ever again, just like
+            # it happens when visitors are executed one by one:
+            self.visitors.remove(visitor)
+            self._subscribers.clear()
+            self._on_error(visitor)
+            return False
+        return True
+
+
+def _is_routed(visitor: base.BaseTokenVisitor) -> bool:
+    visitor_type = type(visitor)
+    return (
+        visitor_type.visit in _TOKEN_ROUTERS
+        and visitor_type.visit_token_stream in _TOKEN_ROUTERS
+    )
+
+
+@final
+class TokenMultiplexer:
+    """
+    Runs many ``tokenize`` visitors with a single pass over tokens.
+
+    Attributes:
+        visitors: visitors that are run by this multiplexer.
+
+    """
+
+    def __init__(
+        self,
+        visitors: Sequence[base.BaseTokenVisitor],
+        on_error: Callable[[base.BaseVisitor], None],
+        timer: VisitorTimer | None = None,
+    ) -> None:
+        """
+        Creates new multiplexer.
+
+        Arguments:
+            visitors: visitors to run, order is preserved.
+            on_error: callback to report failures of visitors,
+                it is called inside the ``except`` block.
+            timer: measures visitors, when they are profiled.
+
+        """
+        self.visitors = list(visitors)
+        self._on_error = on_error
+        self._timer = timer
+        self._handlers = self._subscribe()
+
+    def run(self, file_tokens: Sequence[tokenize.TokenInfo]) -> None:
+        """Passes all ``file_tokens`` once to all visitors."""
+        for visitor in self.visitors.copy():
+            self._safe_call(visitor, visitor._pre_visit)  # noqa: SLF001
+
+        self._multiplex(file_tokens)
+
+        for visitor in self.visitors.copy():
+            self._safe_call(visitor, visitor._post_visit)  # noqa: SLF001
+
+    def _multiplex(self, file_tokens: Sequence[tokenize.TokenInfo]) -> None:
+        for stream_visitor in self.visitors.copy():
+            if not _is_routed(stream_visitor):
+                self._safe_call(
+                    stream_visitor,
+                    stream_visitor.visit_token_stream,
+                    file_tokens,
+                )
+        for token in file_tokens:
+            for visitor, visit_method in self._handlers[token.exact_type]:
+                self._safe_call(visitor, visit_method, visitor, token)
+
+    def _subscribe(self) -> _TokenHandlers:
+        handlers: _TokenHandlers = defaultdict(list)
+        for visitor in self.visitors:
+            if _is_routed(visitor):
+                for exact_type, visit_method in visitor.dispatch_table.items():
+                    handlers[exact_type].append((visitor, visit_method))
+        return handlers
+
+    def _safe_call(
+        self,
+        visitor: base.BaseTokenVisitor,
+        method: Callable[..., object],
+        *args: object,
+    ) -> None:
+        try:
+            if self._timer is None:
+                method(*args)
+            else:
+                self._timer.call(visitor, method, *args)
+        except Exception:
+            # Failed visitor is not called ever again, just like
+            # it happens when visitors are executed one by one:
+            self.visitors.remove(visitor)
+            self._handlers = self._subscribe()
+            self._on_error(visitor)
@@ -1,8 +1,9 @@
-from typing import final
+from typing import ClassVar, final
 
 from wemake_python_styleguide import constants
 from wemake_python_styleguide.logic.naming import access, alphabet, logical
 from wemake_python_styleguide.violations import naming
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.visitors.base import BaseFilenameVisitor
 
 
@@ -10,6 +11,19 @@ from wemake_python_styleguide.visitors.base import BaseFilenameVisitor
 class WrongModuleNameVisitor(BaseFilenameVisitor):
     """Checks that modules have correct names."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        naming.WrongModuleNameViolation,
+        naming.WrongModuleMagicNameViolation,
+        naming.WrongModuleNamePatternViolation,
+        naming.TooShortNameViolation,
+        naming.PrivateNameViolation,
+        naming.UnderscoredNumberNameViolation,
+        naming.ConsecutiveUnderscoresInNameViolation,
+        naming.TooLongNameViolation,
+        naming.UnicodeNameViolation,
+        naming.UnreadableNameViolation,
+    )
+
     def visit_filename(self) -> None:
         """Checks a single module's filename."""
         self._check_module_name()
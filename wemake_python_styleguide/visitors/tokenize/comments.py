@@ -25,6 +25,7 @@ from wemake_python_styleguide.constants import MAX_NO_COVER_COMMENTS, STDIN
 from wemake_python_styleguide.logic.system import is_executable_file, is_windows
 from wemake_python_styleguide.logic.tokens.constants import NEWLINES
 from wemake_python_styleguide.logic.tokens.strings import get_comment_text
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.best_practices import (
     CommentInFormattedStringViolation,
     EmptyCommentViolation,
@@ -52,6 +53,12 @@ SENTINEL_TOKEN: Final = tokenize.TokenInfo(
 class WrongCommentVisitor(BaseTokenVisitor):
     """Checks comment tokens."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        WrongMagicCommentViolation,
+        WrongDocCommentViolation,
+        OveruseOfNoCoverCommentViolation,
+    )
+
     _no_cover: ClassVar[re.Pattern[str]] = re.compile(r'^pragma:\s+no\s+cover')
     _type_check: ClassVar[re.Pattern[str]] = re.compile(
         r'^type:\s?([\w\d\[\]\'\"\.]+)$',
@@ -106,6 +113,8 @@ class WrongCommentVisitor(BaseTokenVisitor):
 class EmptyCommentVisitor(BaseTokenVisitor):
     """Checks empty comment tokens."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (EmptyCommentViolation,)
+
     def __init__(self, *args, **kwargs) -> None:
         """Initializes fields to track empty comments."""
         super().__init__(*args, **kwargs)
@@ -180,6 +189,8 @@ class ShebangVisitor(BaseTokenVisitor):
     Code is inspired by https://github.com/xuhdev/flake8-executable
     """
 
+    emitted_violations: ClassVar[ViolationClasses] = (ShebangViolation,)
+
     _shebang: ClassVar[re.Pattern[str]] = re.compile(r'(\s*)#!')
     _python_executable: ClassVar[str] = 'python'
 
@@ -260,6 +271,12 @@ class ShebangVisitor(BaseTokenVisitor):
 class NoqaVisitor(BaseTokenVisitor):
     """Checks noqa comment tokens."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        WrongMagicCommentViolation,
+        OveruseOfNoqaCommentViolation,
+        ForbiddenInlineIgnoreViolation,
+    )
+
     _noqa_check: ClassVar[re.Pattern[str]] = re.compile(
         r'^(noqa:?)($|[A-Z\d\,\s]+)',
     )
@@ -318,6 +335,10 @@ class NoqaVisitor(BaseTokenVisitor):
 class CommentInFormattedStringVisitor(BaseTokenVisitor):  # pragma: >=3.12 cover
     """Checks comment in formatted strings."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        CommentInFormattedStringViolation,
+    )
+
     _comment_in_fstring: ClassVar[re.Pattern[str]] = re.compile(
         r"""
         .*                  # (1) anything before the f-string
@@ -2,6 +2,7 @@ import tokenize
 from collections.abc import Sequence
 from typing import ClassVar, final
 
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.refactoring import (
     ImplicitElifViolation,
 )
@@ -37,6 +38,8 @@ class IfElseVisitor(BaseTokenVisitor):
 
     """
 
+    emitted_violations: ClassVar[ViolationClasses] = (ImplicitElifViolation,)
+
     _idents: ClassVar[frozenset[int]] = frozenset(
         (
             tokenize.INDENT,
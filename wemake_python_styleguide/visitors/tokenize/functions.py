@@ -1,9 +1,10 @@
 import math
 import tokenize
-from collections.abc import Iterable
-from typing import final
+from collections.abc import Iterable, Sequence
+from typing import ClassVar, final
 
 from wemake_python_styleguide.violations import best_practices
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.visitors import base
 
 
@@ -139,18 +140,17 @@ class _FileTokens:
 class WrongEmptyLinesCountVisitor(base.BaseTokenVisitor):
     """Restricts empty lines in function or method body."""
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Initializes a counter."""
-        super().__init__(*args, **kwargs)
-        self._file_tokens: list[tokenize.TokenInfo] = []
+    emitted_violations: ClassVar[ViolationClasses] = (
+        best_practices.WrongEmptyLinesCountViolation,
+    )
 
-    def visit(self, token: tokenize.TokenInfo) -> None:
+    def visit_token_stream(
+        self,
+        file_tokens: Sequence[tokenize.TokenInfo],
+    ) -> None:
         """Find empty lines count."""
-        self._file_tokens.append(token)
-        if token.type != tokenize.ENDMARKER:
-            return
         violations = _FileTokens(
-            _FileFunctions(self._file_tokens),
+            _FileFunctions(list(file_tokens)),
             self.options.exps_for_one_empty_line,
         ).analyze()
         for violation in violations:
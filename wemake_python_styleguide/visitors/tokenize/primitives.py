@@ -10,7 +10,10 @@ from wemake_python_styleguide.logic.tokens.strings import (
     split_prefixes,
 )
 from wemake_python_styleguide.violations import consistency
-from wemake_python_styleguide.violations.base import TokenizeViolation
+from wemake_python_styleguide.violations.base import (
+    TokenizeViolation,
+    ViolationClasses,
+)
 from wemake_python_styleguide.violations.best_practices import (
     MultilineFormattedStringViolation,
     WrongUnicodeEscapeViolation,
@@ -28,6 +31,12 @@ def _replace_braces(string: str) -> str:
 class WrongNumberTokenVisitor(BaseTokenVisitor):
     """Visits number tokens to find incorrect usages."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        consistency.UnderscoredNumberViolation,
+        consistency.NumberWithMeaninglessZeroViolation,
+        consistency.FloatZeroViolation,
+    )
+
     _leading_zero_pattern: ClassVar[re.Pattern[str]] = re.compile(
         r'^[0-9\.]+([box]|e\+?\-?)0.+',
         re.IGNORECASE | re.ASCII,
@@ -166,6 +175,12 @@ class _StringTokenChecker:
 class WrongStringTokenVisitor(BaseTokenVisitor):
     """Checks incorrect string tokens usages."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        consistency.UppercaseStringModifierViolation,
+        consistency.ImplicitRawStringViolation,
+        WrongUnicodeEscapeViolation,
+    )
+
     def __init__(self, *args, **kwargs) -> None:
         """Check string definitions."""
         super().__init__(*args, **kwargs)
@@ -235,6 +250,10 @@ class MultilineFormattedStringTokenVisitor(
 ):  # pragma: >=3.12 cover
     """Checks incorrect formatted string usages."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        MultilineFormattedStringViolation,
+    )
+
     _multiline_fstring_pattern: ClassVar[re.Pattern[str]] = re.compile(
         r"""
         .*                  # (1) anything before the f-string
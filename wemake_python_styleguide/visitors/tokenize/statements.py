@@ -1,32 +1,26 @@
 import tokenize
-from collections import defaultdict
-from operator import attrgetter
-from typing import TypeAlias, final
+from collections.abc import Sequence
+from typing import ClassVar, final
 
 from wemake_python_styleguide.logic.tokens import strings
 from wemake_python_styleguide.violations import best_practices, consistency
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.visitors.base import BaseTokenVisitor
 
-TokenLines: TypeAlias = defaultdict[int, list[tokenize.TokenInfo]]
-
 
 @final
 class MultilineStringVisitor(BaseTokenVisitor):
     """Checks if multiline strings are used only in assignment or docstrings."""
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Creates line tracking for tokens."""
-        super().__init__(*args, **kwargs)
-        self._lines: TokenLines = defaultdict(list)
-
-    def visit(self, token: tokenize.TokenInfo) -> None:
-        """Goes through all tokens to separate them by line numbers."""
-        self._lines[token.start[0]].append(token)
+    emitted_violations: ClassVar[ViolationClasses] = (
+        consistency.UselessMultilineStringViolation,
+        best_practices.WrongMultilineStringUseViolation,
+    )
 
     def _check_multiline_usage(
         self,
         index: int,
-        tokens: list[tokenize.TokenInfo],
+        tokens: Sequence[tokenize.TokenInfo],
         meaningful_tokens: list[tokenize.TokenInfo],
         previous_token: tokenize.TokenInfo | None,
         next_token: tokenize.TokenInfo | None,
@@ -72,7 +66,7 @@ class MultilineStringVisitor(BaseTokenVisitor):
 
     def _check_individual_line(
         self,
-        tokens: list[tokenize.TokenInfo],
+        tokens: Sequence[tokenize.TokenInfo],
         previous_token: tokenize.TokenInfo | None,
         next_token: tokenize.TokenInfo | None,
     ) -> None:
@@ -95,26 +89,9 @@ class MultilineStringVisitor(BaseTokenVisitor):
             )
 
     def _post_visit(self) -> None:
-        linenos = sorted(self._lines.keys())
-        for index, _ in enumerate(linenos):
-            line_tokens = sorted(
-                self._lines[linenos[index]],
-                key=attrgetter('start'),
-            )
-            previous_line_token = None
-            next_line_token = None
-            if index != 0:
-                previous_line_token = max(
-                    self._lines[linenos[index - 1]],
-                    key=attrgetter('start'),
-                )
-            if index + 1 < len(linenos):
-                next_line_token = min(
-                    self._lines[linenos[index + 1]],
-                    key=attrgetter('start'),
-                )
+        for token_line in self.token_index.lines:
             self._check_individual_line(
-                line_tokens,
-                previous_line_token,
-                next_line_token,
+                token_line.tokens,
+                token_line.previous_token,
+                token_line.next_token,
             )
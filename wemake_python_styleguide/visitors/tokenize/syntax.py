@@ -1,6 +1,7 @@
 import tokenize
-from typing import final
+from typing import ClassVar, final
 
+from wemake_python_styleguide.violations.base import ViolationClasses
 from wemake_python_styleguide.violations.consistency import (
     LineCompriseCarriageReturnViolation,
 )
@@ -19,6 +20,10 @@ from wemake_python_styleguide.visitors.decorators import alias
 class WrongKeywordTokenVisitor(BaseTokenVisitor):
     """Visits keywords and finds violations related to their usage."""
 
+    emitted_violations: ClassVar[ViolationClasses] = (
+        LineCompriseCarriageReturnViolation,
+    )
+
     def visit_any_newline(self, token: tokenize.TokenInfo) -> None:
         r"""Checks ``\r`` (carriage return) in line breaks."""
         self._check_line_comprise_carriage_return(token)